@@ -254,3 +254,7 @@ print("4. Count how many vowels are in your name")
 #             palindromes.add(substring)
 
 # print(sorted(palindromes))
+
+# Not: Bu çözüm O(n^3). Uzun metinler için doğrusal zamanlı sürüm:
+# from beginner_level.palindromes import distinct_palindromes, longest_palindrome
+# print(distinct_palindromes(s))
@@ -262,6 +262,7 @@ print(f"Applicant 2: {result2}")
 
 result3 = check_eligibility_good(16, 40000, 650, "full-time")
 print(f"Applicant 3: {result3}")
+# Same rules loaded from data and compiled once: beginner_level.eligibility.RuleSet
 
 # Real-world Example: Shopping Cart Discount
 print("\n" + "=" * 50)
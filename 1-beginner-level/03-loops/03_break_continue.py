@@ -266,6 +266,7 @@ def menu_system():
     print("Program ended")
 
 menu_system()
+print("💡 Dict dispatch, submenus and scripted sessions: python -m beginner_level.menus")
 
 # Real-world Example: Finding Prime Numbers
 print("\n" + "=" * 50)
@@ -290,6 +291,7 @@ for num in range(1, 31):
         primes.append(num)
 
 print(primes)
+print("💡 Primes below 10^9 in seconds: python -m beginner_level.primes 1000000000")
 
 # Real-world Example: Filtering List
 print("\n" + "=" * 50)
@@ -323,6 +325,7 @@ for student in students:
     print(f"  {student['name']}: ✓ Qualified")
 
 print(f"\nHonors list: {honors_list}")
+print("💡 Same filter on columns, no loop: python -m beginner_level.columnar")
 
 # Real-world Example: Password Attempts
 print("\n" + "=" * 50)
@@ -379,6 +382,7 @@ def search_product(products, search_term):
 products = ["Laptop", "Mouse", "Keyboard", "Monitor", "Headphones"]
 result = search_product(products, "key")
 print(f"Result: {result}")
+print("💡 Indexed search for big catalogs: python -m beginner_level.product_search")
 
 # Using pass statement
 print("\n" + "=" * 50)
@@ -188,6 +188,8 @@ for i in range(len(matrix1)):
 for row in result:
     print(row)
 
+print("💡 Flat-buffer matrices, transpose views: python -m beginner_level.matrix")
+
 # Matrix transpose
 print("\nMatrix Transpose:")
 original = [
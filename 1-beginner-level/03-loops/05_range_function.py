@@ -233,6 +233,8 @@ for quantity in range(1, 11):
     total = unit_price * quantity
     print(f"{quantity:>10} ${unit_price:>11.2f} ${total:>9.2f}")
 
+print("\n💡 Exact prices in cents for whole order books: python -m beginner_level.tiered_pricing")
+
 # Real-world Example: Password Generator
 print("\n" + "=" * 50)
 print("REAL-WORLD EXAMPLE: SIMPLE NUMBER PASSWORDS")
@@ -262,6 +264,7 @@ for i in range(0, 101, 10):
     print(f"\r[{bar}] {i}%", end="", flush=True)
     # time.sleep(0.2)  # Uncomment to see animation
 print("\n✓ Complete!")
+print("💡 Pre-rendered, throttled progress output: python -m beginner_level.progress")
 
 # Real-world Example: Seating Numbers
 print("\n" + "=" * 50)
@@ -314,6 +317,8 @@ print(f"Size of list(range(1000)): {sys.getsizeof(lst)} bytes")
 
 print("\n✓ range() is memory efficient - generates numbers on demand")
 print("✓ list(range()) creates all numbers in memory at once")
+print("✓ sys.getsizeof(lst) counts only the list, each int is a separate object")
+print("  Real memory use: python -m beginner_level.memory")
 
 # Common Range Patterns
 print("\n" + "=" * 50)
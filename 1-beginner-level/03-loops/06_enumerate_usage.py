@@ -186,6 +186,7 @@ selected = 2
 for index, item in enumerate(menu_items, 1):
     if index == selected:
         print(f"Selected: {item}")
+# Direct lookup, no second loop: menu_items[selected - 1]
 
 # Real-world Example: Shopping Cart
 print("\n" + "=" * 50)
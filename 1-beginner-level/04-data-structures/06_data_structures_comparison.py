@@ -218,6 +218,7 @@ print("PERFORMANCE CHARACTERISTICS:")
 print("=" * 80)
 
 import time
+import statistics
 
 # Create large collections
 size = 100000
@@ -229,34 +230,34 @@ test_dict = {i: i for i in range(size)}
 # Search for last element
 search_value = size - 1
 
-# List search
-start = time.time()
-search_value in test_list
-list_time = time.time() - start
-
-# Tuple search
-start = time.time()
-search_value in test_tuple
-tuple_time = time.time() - start
-
-# Set search
-start = time.time()
-search_value in test_set
-set_time = time.time() - start
-
-# Dict search
-start = time.time()
-search_value in test_dict
-dict_time = time.time() - start
+def time_membership(collection, value, loops=100, repeat=7):
+    """Median time of one 'value in collection' check, in nanoseconds.
+
+    One single check is too fast to measure reliably, so we time many
+    loops, repeat that several times and take the median.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            value in collection
+        samples.append((time.perf_counter_ns() - start) / loops)
+    return statistics.median(samples)
+
+list_time = time_membership(test_list, search_value)
+tuple_time = time_membership(test_tuple, search_value)
+set_time = time_membership(test_set, search_value)
+dict_time = time_membership(test_dict, search_value)
 
 print(f"Membership test for {size:,} elements:")
-print(f"  List:       {list_time:.6f} seconds")
-print(f"  Tuple:      {tuple_time:.6f} seconds")
-print(f"  Set:        {set_time:.6f} seconds  ⚡ FASTEST")
-print(f"  Dictionary: {dict_time:.6f} seconds  ⚡ FASTEST")
+print(f"  List:       {list_time:>10,.1f} ns")
+print(f"  Tuple:      {tuple_time:>10,.1f} ns")
+print(f"  Set:        {set_time:>10,.1f} ns  ⚡ FASTEST")
+print(f"  Dictionary: {dict_time:>10,.1f} ns  ⚡ FASTEST")
 
 print(f"\n💡 Sets and Dictionaries use hash tables = O(1) lookup")
 print(f"💡 Lists and Tuples scan sequentially = O(n) lookup")
+print(f"💡 Full benchmark: python -m beginner_level.benchmark --output results.json")
 
 # Memory Comparison
 print("\n" + "=" * 80)
@@ -281,6 +282,8 @@ print(f"  Dictionary: {dict_size} bytes")
 
 print(f"\n💡 Tuples are more memory efficient")
 print(f"💡 Dictionaries use most memory (store keys + values)")
+print(f"💡 sys.getsizeof counts only the container, not the items inside it")
+print(f"💡 Real memory per element: python -m beginner_level.memory")
 
 # When to Use Each Structure
 print("\n" + "=" * 80)
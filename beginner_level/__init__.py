@@ -0,0 +1,128 @@
+"""
+BEGINNER LEVEL HELPERS
+======================
+
+The lesson files in ``1-beginner-level/`` are scripts: their names start with
+digits and every example runs as soon as the file is loaded. This package keeps
+the reusable functions from those lessons in normal, importable modules.
+
+Submodules are loaded lazily. ``import beginner_level`` is almost free; a
+submodule is only imported the first time one of its names is used.
+
+Example:
+    from beginner_level import is_prime, calculate_grade
+
+    is_prime(97)          # True
+    calculate_grade(85)   # 'B'
+
+Key Concepts:
+- Packages and ``__init__.py``
+- Lazy loading with a module-level ``__getattr__`` (PEP 562)
+- ``if __name__ == "__main__":`` guards for demo code
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    # 01-basic-concepts
+    "longest_palindrome": "palindromes",
+    "count_palindromic_substrings": "palindromes",
+    "distinct_palindromes": "palindromes",
+    "PalindromeTree": "palindromes",
+    "encrypt": "cipher",
+    "encrypt_bytes": "cipher",
+    "encrypt_file": "cipher",
+    "buffer_stats": "char_stats",
+    "file_stats": "char_stats",
+    "VowelIndexer": "vowels",
+    "vowel_index_pattern": "vowels",
+    "index_documents": "vowels",
+    "convert": "conversions",
+    "convert_buffer": "conversions",
+    "validate_lines": "input_validation",
+    "validate_stream": "input_validation",
+    # 02-control-structures
+    "calculate_ticket_price": "control_structures",
+    "calculate_discount": "control_structures",
+    "calculate_customer_discount": "control_structures",
+    "DecisionTable": "decision_tables",
+    "Axis": "decision_tables",
+    "ticket_price": "decision_tables",
+    "ticket_prices": "decision_tables",
+    "discount": "decision_tables",
+    "discounts": "decision_tables",
+    "Permissions": "permissions",
+    "check_access": "permissions",
+    "has_permission": "permissions",
+    "CredentialStore": "credentials",
+    "hash_password": "credentials",
+    "check_password": "credentials",
+    "PriceTiers": "tiered_pricing",
+    "calculate_price": "tiered_pricing",
+    "to_cents": "tiered_pricing",
+    "format_cents": "tiered_pricing",
+    "get_status_message": "progress",
+    "progress_bar": "progress",
+    "ProgressReporter": "progress",
+    "RuleSet": "eligibility",
+    "check_loan_eligibility": "eligibility",
+    "check_driving_eligibility": "eligibility",
+    # 03-loops
+    "is_prime": "primes",
+    "PrimeTable": "primes",
+    "primes_between": "primes",
+    "ProductIndex": "product_search",
+    "Table": "columnar",
+    "col": "columnar",
+    "Ledger": "ledger",
+    "InsufficientFunds": "ledger",
+    "binary_guess": "guessing",
+    "Menu": "menus",
+    "Session": "menus",
+    "run_scripts": "menus",
+    "Matrix": "matrix",
+    # 04-data-structures
+    "add_contact": "data_structures",
+    "search_contact": "data_structures",
+    "run_benchmark": "benchmark",
+    "compare_results": "benchmark",
+    "deep_getsizeof": "memory",
+    "traced_size": "memory",
+    # 05-functions
+    "calculate_grade": "functions",
+    "calculate_average_grade": "functions",
+    "is_valid_email": "functions",
+    "is_valid_password": "functions",
+    "validate_user": "functions",
+    "process_data": "functions",
+    "PredicateChain": "predicates",
+    "Binner": "binning",
+    "PasswordFeatures": "passwords",
+    "audit_file": "passwords",
+}
+
+# ``loops`` exports no names (``is_prime`` comes from ``primes``) but stays a
+# listed submodule for the lesson's trial-division version
+_SUBMODULES = sorted(set(_LAZY_ATTRS.values()) | {"loops"})
+
+__all__ = sorted(_LAZY_ATTRS) + _SUBMODULES
+
+
+def __getattr__(name):
+    """Import the submodule that owns ``name`` on first access."""
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache it, next lookup skips __getattr__
+        return value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,43 @@
+"""
+LESSON LOADER
+=============
+
+The lesson files are scripts: every example runs as soon as the file is
+loaded, so they cannot simply be imported. ``define`` reads a lesson file,
+keeps only its ``import`` statements and the requested ``def`` statements,
+and runs those. The functions come straight from the lesson source (one
+copy, tracebacks point at the lesson file) without running any demo code.
+"""
+
+import ast
+import os
+
+LESSONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "1-beginner-level")
+
+
+def define(namespace, lesson, *names):
+    """
+    Define functions from a lesson file in ``namespace``.
+
+    Args:
+        namespace (dict): Where to put them, usually the caller's ``globals()``
+        lesson (str): Path below ``1-beginner-level``, e.g.
+                      "03-loops/03_break_continue.py"
+        names: Function names to take from the lesson
+
+    Raises:
+        ImportError: if the lesson does not define one of the names
+    """
+    path = os.path.join(LESSONS_DIR, lesson)
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+
+    wanted = set(names)
+    body = [node for node in tree.body
+            if isinstance(node, (ast.Import, ast.ImportFrom))
+            or isinstance(node, ast.FunctionDef) and node.name in wanted]
+    missing = wanted - {node.name for node in body if isinstance(node, ast.FunctionDef)}
+    if missing:
+        raise ImportError(f"{lesson} does not define {', '.join(sorted(missing))}")
+    exec(compile(ast.Module(body=body, type_ignores=[]), path, "exec"), namespace)
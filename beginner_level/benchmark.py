@@ -0,0 +1,193 @@
+"""
+MEMBERSHIP BENCHMARK
+====================
+
+Repeatable timings for ``value in container`` on lists, tuples, sets and
+dictionaries (see 06_data_structures_comparison.py).
+
+A single ``time.time()`` measurement of one lookup is mostly noise. This module:
+- uses ``time.perf_counter_ns`` (highest resolution clock)
+- warms up before measuring
+- runs each lookup many times per sample, and takes many samples
+- reports median and IQR (interquartile range) per lookup, in nanoseconds
+- saves results as JSON so two runs can be compared
+
+Usage:
+    python -m beginner_level.benchmark --output before.json
+    python -m beginner_level.benchmark --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+CONTAINERS = ("list", "tuple", "set", "dict")
+POSITIONS = ("first", "middle", "last", "miss")
+DEFAULT_SIZES = tuple(10 ** exp for exp in range(1, 8))  # 10 .. 10,000,000
+
+
+def build_container(kind, size):
+    """Create a container of ``kind`` holding the integers 0 .. size-1."""
+    if kind == "list":
+        return list(range(size))
+    if kind == "tuple":
+        return tuple(range(size))
+    if kind == "set":
+        return set(range(size))
+    if kind == "dict":
+        return dict.fromkeys(range(size))
+    raise ValueError(f"Unknown container: {kind!r}")
+
+
+def search_value(position, size):
+    """Value to look up so the search hits ``position`` (or misses)."""
+    if position == "first":
+        return 0
+    if position == "middle":
+        return size // 2
+    if position == "last":
+        return size - 1
+    if position == "miss":
+        return -1
+    raise ValueError(f"Unknown position: {position!r}")
+
+
+def _run(container, value, number):
+    """Time ``number`` lookups, return total nanoseconds."""
+    counter = time.perf_counter_ns
+    loops = range(number)
+    start = counter()
+    for _ in loops:
+        value in container
+    return counter() - start
+
+
+def time_lookup(container, value, repeat=15, warmup=3, min_sample_ns=2_000_000):
+    """
+    Measure ``value in container``.
+
+    The number of lookups per sample is grown until one sample takes at least
+    ``min_sample_ns``, so fast lookups are not lost in clock resolution.
+
+    Returns:
+        dict: per-lookup statistics in nanoseconds (median, q1, q3, iqr, min)
+    """
+    if repeat < 2:
+        raise ValueError(f"repeat must be at least 2 to compute quartiles: {repeat}")
+    number = 1
+    while True:
+        elapsed = _run(container, value, number)
+        if elapsed >= min_sample_ns or number >= 1_000_000:
+            break
+        number *= 10
+
+    for _ in range(warmup):
+        _run(container, value, number)
+
+    samples = [_run(container, value, number) / number for _ in range(repeat)]
+    q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    return {
+        "median_ns": median,
+        "q1_ns": q1,
+        "q3_ns": q3,
+        "iqr_ns": q3 - q1,
+        "min_ns": min(samples),
+        "loops": number,
+        "repeat": repeat,
+    }
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, containers=CONTAINERS, positions=POSITIONS,
+                  repeat=15, warmup=3):
+    """
+    Benchmark every (container, size, position) combination.
+
+    Returns:
+        dict: {"meta": {...}, "results": [row, ...]} ready for ``json.dump``
+    """
+    results = []
+    for size in sizes:
+        for kind in containers:
+            container = build_container(kind, size)
+            for position in positions:
+                stats = time_lookup(container, search_value(position, size),
+                                    repeat=repeat, warmup=warmup)
+                results.append({"container": kind, "size": size,
+                                "position": position, **stats})
+            del container
+    meta = {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+    return {"meta": meta, "results": results}
+
+
+def _key(row):
+    return row["container"], row["size"], row["position"]
+
+
+def compare_results(old, new):
+    """
+    Compare two benchmark runs.
+
+    Returns:
+        list: (container, size, position, old_median, new_median, ratio) tuples,
+              ratio > 1 means the new run is slower
+    """
+    old_rows = {_key(row): row for row in old["results"]}
+    rows = []
+    for row in new["results"]:
+        before = old_rows.get(_key(row))
+        if before is None:
+            continue
+        ratio = row["median_ns"] / before["median_ns"] if before["median_ns"] else float("inf")
+        rows.append((*_key(row), before["median_ns"], row["median_ns"], ratio))
+    return rows
+
+
+def format_results(report):
+    """Render a benchmark report as a text table."""
+    lines = [f"{'Container':<10} {'Size':>12} {'Position':<8} {'Median ns':>15} {'IQR ns':>13}"]
+    lines.append("-" * len(lines[0]))
+    for row in report["results"]:
+        lines.append(f"{row['container']:<10} {row['size']:>12,} {row['position']:<8} "
+                     f"{row['median_ns']:>15,.1f} {row['iqr_ns']:>13,.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--containers", nargs="+", choices=CONTAINERS, default=list(CONTAINERS))
+    parser.add_argument("--positions", nargs="+", choices=POSITIONS, default=list(POSITIONS))
+    parser.add_argument("--repeat", type=int, default=15, help="samples per lookup (at least 2)")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    args = parser.parse_args(argv)
+    if args.repeat < 2:
+        parser.error("--repeat must be at least 2 (quartiles need two samples)")
+
+    report = run_benchmark(args.sizes, args.containers, args.positions,
+                           repeat=args.repeat, warmup=args.warmup)
+    print(format_results(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        print(f"\n{'Container':<10} {'Size':>12} {'Position':<8} {'Old ns':>15} {'New ns':>15} {'Ratio':>7}")
+        for kind, size, position, before, after, ratio in compare_results(old, report):
+            print(f"{kind:<10} {size:>12,} {position:<8} {before:>15,.1f} {after:>15,.1f} {ratio:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
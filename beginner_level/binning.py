@@ -0,0 +1,142 @@
+"""
+THRESHOLD BINNING
+=================
+
+Many lesson functions sort a value into a category with an ``if/elif`` ladder:
+- ``calculate_grade`` / ``check_grade``: 90 → A, 80 → B, 70 → C, 60 → D
+- ``categorize_size``: 1 → tiny, 5 → small, 10 → medium, 20 → large
+- the age-category ternary chain in 05_ternary_operator.py
+
+A ``Binner`` is built once from sorted cut points and labels:
+- one value: ``bisect`` finds the band in O(log n)
+- many small whole numbers (0-255): a 256-entry table and ``bytes.translate``
+- many values: ``numpy.searchsorted`` does the whole array in C
+- results can be small integer codes (one byte each) instead of strings;
+  ``binner.labels[code]`` turns a code back into its label
+
+Example:
+    GRADES.classify(85)         # 'B'
+    GRADES.codes([95, 45])      # codes [4, 0], labels F, D, C, B, A
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+class Binner:
+    """
+    Map values to labels using sorted cut points.
+
+    Args:
+        cuts: Sorted cut points; n cuts give n + 1 bands
+        labels: One label per band, lowest band first
+        side (str): "right" when rules read ``x >= cut`` (a value equal to a
+                    cut goes to the higher band), "left" when they read
+                    ``x > cut``
+    """
+
+    def __init__(self, cuts, labels, side="right"):
+        self.cuts = tuple(cuts)
+        self.labels = tuple(labels)
+        if len(self.labels) != len(self.cuts) + 1:
+            raise ValueError("need exactly one more label than cut points")
+        if list(self.cuts) != sorted(set(self.cuts)):
+            raise ValueError("cut points must be sorted and unique")
+        if side not in ("left", "right"):
+            raise ValueError("side must be 'left' or 'right'")
+        self.side = side
+        self._bisect = bisect_right if side == "right" else bisect_left
+        # Smallest array type that can hold every code
+        self.typecode = "B" if len(self.labels) <= 256 else "H"
+        self._table = None
+
+    def code(self, value):
+        """Band number of one value."""
+        return self._bisect(self.cuts, value)
+
+    def classify(self, value):
+        """Label of one value."""
+        return self.labels[self._bisect(self.cuts, value)]
+
+    def codes(self, values):
+        """
+        Band numbers of many values.
+
+        Returns:
+            numpy uint8/uint16 array for NumPy input, else ``array.array``
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            dtype = np.uint8 if self.typecode == "B" else np.uint16
+            return np.searchsorted(np.asarray(self.cuts), values, side=self.side).astype(dtype)
+        if self.typecode == "B" and isinstance(values, (list, tuple, bytes, bytearray)):
+            # Small whole numbers (0-255, e.g. scores): one C-level table lookup
+            try:
+                return array("B", bytes(values).translate(self._byte_table()))
+            except (TypeError, ValueError):
+                pass
+        cuts, find = self.cuts, self._bisect
+        return array(self.typecode, [find(cuts, value) for value in values])
+
+    def _byte_table(self):
+        """Code of every value 0-255, for ``bytes.translate``."""
+        if self._table is None:
+            self._table = bytes(self.code(value) for value in range(256))
+        return self._table
+
+    def classify_many(self, values):
+        """Labels of many values (a list of strings; prefer ``codes``)."""
+        labels = self.labels
+        return [labels[code] for code in self.codes(values)]
+
+    def counts(self, codes):
+        """How many values fell in each band: {label: count}."""
+        if np is not None and isinstance(codes, np.ndarray):
+            totals = np.bincount(codes, minlength=len(self.labels))
+        else:
+            totals = [0] * len(self.labels)
+            for code in codes:
+                totals[code] += 1
+        return {label: int(total) for label, total in zip(self.labels, totals)}
+
+
+# calculate_grade (01_function_definition.py), check_grade (03_comparison_operators.py)
+GRADES = Binner([60, 70, 80, 90], ["F", "D", "C", "B", "A"])
+
+# categorize_size (05_ternary_operator.py)
+SIZES = Binner([1, 5, 10, 20], ["tiny", "small", "medium", "large", "huge"])
+
+# Age category ternary chain (05_ternary_operator.py)
+AGE_CATEGORIES = Binner([13, 18, 65], ["Child", "Teen", "Adult", "Senior"])
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from .functions import calculate_grade
+
+    for score in [95, 87, 73, 61, 45]:
+        print(f"Score {score}: Grade {GRADES.classify(score)}")
+    print(f"categorize_size(5): {SIZES.classify(5)}")
+
+    scores = [random.randint(0, 100) for _ in range(1_000_000)]
+
+    start = time.perf_counter()
+    [calculate_grade(score) for score in scores]
+    print(f"\nif/elif ladder:     {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    codes = GRADES.codes(scores)
+    print(f"Binner.codes:       {time.perf_counter() - start:.3f}s")
+
+    if np is not None:
+        score_array = np.array(scores)
+        start = time.perf_counter()
+        codes = GRADES.codes(score_array)
+        print(f"numpy.searchsorted: {time.perf_counter() - start:.3f}s")
+    print(GRADES.counts(codes))
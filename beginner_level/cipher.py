@@ -0,0 +1,120 @@
+"""
+SHIFT CIPHER
+============
+
+The "Şifreleme Challenge" in 02_string_operations.py:
+- every letter moves ``shift`` places forward (a→c, y→a for shift=2)
+- vowels become uppercase, consonants lowercase
+- spaces become "_"
+
+The lesson version calls ``alphabet.index()`` for every character and builds
+the result with ``encrypted += ...``. Here the rules are turned into a
+translation table once per shift value, and ``str.translate`` /
+``bytes.translate`` do the whole string in C.
+
+Only the ASCII letters a-z are shifted; other characters are kept as they are.
+Files are processed in binary chunks, so they never need to fit in memory.
+
+Run ``python -m beginner_level.cipher`` to compare the speed (MB/s).
+"""
+
+import argparse
+import string
+import time
+from functools import lru_cache
+
+ALPHABET = string.ascii_lowercase
+VOWELS = "aeiou"
+
+
+def _shifted(ch, shift):
+    """Encrypted form of one ASCII letter."""
+    new_char = ALPHABET[(ALPHABET.index(ch.lower()) + shift) % 26]
+    return new_char.upper() if new_char in VOWELS else new_char
+
+
+@lru_cache(maxsize=None)
+def str_table(shift):
+    """Translation table for ``str.translate`` (cached per shift)."""
+    mapping = {ch: _shifted(ch, shift) for ch in ALPHABET + ALPHABET.upper()}
+    mapping[" "] = "_"
+    return str.maketrans(mapping)
+
+
+@lru_cache(maxsize=None)
+def bytes_table(shift):
+    """256-byte translation table for ``bytes.translate`` (cached per shift)."""
+    table = bytearray(range(256))
+    for ch in ALPHABET + ALPHABET.upper():
+        table[ord(ch)] = ord(_shifted(ch, shift))
+    table[ord(" ")] = ord("_")
+    return bytes(table)
+
+
+def encrypt(text, shift=2):
+    """Encrypt a string. Example: encrypt("Ali Can") → "cnk_Ecp"."""
+    return text.translate(str_table(shift))
+
+
+def encrypt_bytes(data, shift=2):
+    """Encrypt ASCII or UTF-8 bytes (multi-byte characters pass through)."""
+    return data.translate(bytes_table(shift))
+
+
+def encrypt_file(src_path, dst_path, shift=2, chunk_size=1 << 20):
+    """
+    Encrypt a file chunk by chunk.
+
+    Works on bytes, so chunk boundaries can never split a character in a way
+    that matters: only single-byte ASCII letters are changed.
+
+    Returns:
+        int: Number of bytes processed
+    """
+    table = bytes_table(shift)
+    total = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        while chunk := src.read(chunk_size):
+            dst.write(chunk.translate(table))
+            total += len(chunk)
+    return total
+
+
+def encrypt_loop(text, shift=2):
+    """The lesson's character-by-character version, kept for comparison."""
+    encrypted = ""
+    for ch in text:
+        if ch == " ":
+            encrypted += "_"
+        elif ch.isalpha() and ch.lower() in ALPHABET:
+            encrypted += _shifted(ch, shift)
+        else:
+            encrypted += ch
+    return encrypted
+
+
+def _throughput(func, data, size_mb):
+    start = time.perf_counter()
+    func(data)
+    return size_mb / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shift cipher throughput.")
+    parser.add_argument("--megabytes", type=float, default=4.0)
+    parser.add_argument("--shift", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    sample = "Ali Can ve Bora Can, Python ogreniyor. "
+    text = sample * int(args.megabytes * 1_000_000 / len(sample))
+    data = text.encode("ascii")
+    size_mb = len(data) / 1_000_000
+
+    print(f"Encrypting {size_mb:.1f} MB:")
+    print(f"  loop + concat:   {_throughput(lambda t: encrypt_loop(t, args.shift), text, size_mb):8.1f} MB/s")
+    print(f"  str.translate:   {_throughput(lambda t: encrypt(t, args.shift), text, size_mb):8.1f} MB/s")
+    print(f"  bytes.translate: {_throughput(lambda d: encrypt_bytes(d, args.shift), data, size_mb):8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
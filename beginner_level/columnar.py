@@ -0,0 +1,294 @@
+"""
+COLUMNAR FILTERING
+==================
+
+The FILTERING WITH CONTINUE example (03_break_continue.py) walks a list of
+student dicts and skips with ``continue`` unless ``grade >= 80`` and
+``attendance >= 80``. Every record is a dict, every test a key lookup, and
+the result is a new list.
+
+A ``Table`` stores each field as one column instead:
+- numbers in typed arrays (NumPy arrays, or ``array.array`` without NumPy),
+  text in a NumPy string array or a plain list
+- a filter is an expression such as
+  ``(col("grade") >= 80) & (col("attendance") >= 80)``, evaluated a whole
+  column at a time into a boolean mask
+- ``where`` returns the matching row numbers and ``filter`` a ``View`` of
+  them; nothing is copied until a column of the view is read
+
+Without NumPy a mask is a ``bytes`` object of 0/1 values: comparisons run
+through ``map`` and ``&``, ``|``, ``~`` are single big-integer operations.
+
+Example:
+    table = Table.from_records(students)
+    honors = table.filter((col("grade") >= 80) & (col("attendance") >= 80))
+    honors["name"]      # ['Alice']
+"""
+
+import operator
+from abc import ABC, abstractmethod
+from array import array
+from itertools import compress, repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+OPERATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne,
+}
+
+
+class Expr(ABC):
+    """A filter expression; combine with ``&``, ``|`` and ``~``."""
+
+    def __and__(self, other):
+        return Combine(operator.and_, self, other)
+
+    def __or__(self, other):
+        return Combine(operator.or_, self, other)
+
+    def __invert__(self):
+        return Invert(self)
+
+    @abstractmethod
+    def mask(self, table):
+        """Rows of ``table`` that match: a bool array (NumPy) or one 0/1 byte per row."""
+
+
+class Column:
+    """Reference to a column, used to build comparisons: ``col("grade") >= 80``."""
+
+    __hash__ = None
+
+    def __init__(self, name):
+        self.name = name
+
+    def __lt__(self, value):
+        return Compare(self.name, "<", value)
+
+    def __le__(self, value):
+        return Compare(self.name, "<=", value)
+
+    def __gt__(self, value):
+        return Compare(self.name, ">", value)
+
+    def __ge__(self, value):
+        return Compare(self.name, ">=", value)
+
+    def __eq__(self, value):
+        return Compare(self.name, "==", value)
+
+    def __ne__(self, value):
+        return Compare(self.name, "!=", value)
+
+    def isin(self, values):
+        return IsIn(self.name, values)
+
+
+col = Column
+
+
+class Compare(Expr):
+    def __init__(self, name, op, value):
+        self.name = name
+        self.op = op
+        self.value = value
+
+    def mask(self, table):
+        column = table.columns[self.name]
+        func = OPERATORS[self.op]
+        if table.numpy:
+            return func(column, self.value)
+        return bytes(map(func, column, repeat(self.value, len(column))))
+
+    def __repr__(self):
+        return f"(col({self.name!r}) {self.op} {self.value!r})"
+
+
+class IsIn(Expr):
+    def __init__(self, name, values):
+        self.name = name
+        self.values = frozenset(values)
+
+    def mask(self, table):
+        column = table.columns[self.name]
+        if table.numpy:
+            return np.isin(column, list(self.values))
+        return bytes(map(self.values.__contains__, column))
+
+    def __repr__(self):
+        return f"col({self.name!r}).isin({sorted(self.values)!r})"
+
+
+class Combine(Expr):
+    def __init__(self, func, left, right):
+        self.func = func
+        self.left = left
+        self.right = right
+
+    def mask(self, table):
+        left, right = self.left.mask(table), self.right.mask(table)
+        if table.numpy:
+            return self.func(left, right)
+        # 0/1 bytes: one big-integer operation for the whole column
+        size = len(left)
+        result = self.func(int.from_bytes(left, "little"), int.from_bytes(right, "little"))
+        return result.to_bytes(size, "little")
+
+    def __repr__(self):
+        return f"({self.left!r} {'&' if self.func is operator.and_ else '|'} {self.right!r})"
+
+
+class Invert(Expr):
+    def __init__(self, inner):
+        self.inner = inner
+
+    def mask(self, table):
+        inner = self.inner.mask(table)
+        if table.numpy:
+            return ~inner
+        ones = int.from_bytes(b"\x01" * len(inner), "little")
+        return (int.from_bytes(inner, "little") ^ ones).to_bytes(len(inner), "little")
+
+    def __repr__(self):
+        return f"~{self.inner!r}"
+
+
+def _typecode(values):
+    """'q' for whole numbers, 'd' for other numbers, None for anything else."""
+    if all(type(value) in (int, bool) for value in values):
+        return "q"
+    if all(type(value) in (int, float, bool) for value in values):
+        return "d"
+    return None
+
+
+class Table:
+    """
+    Named columns of equal length.
+
+    Args:
+        columns: {name: sequence of values}
+        use_numpy (bool): Store columns as NumPy arrays (default: when
+                          NumPy is installed)
+    """
+
+    def __init__(self, columns, use_numpy=None):
+        self.numpy = np is not None if use_numpy is None else use_numpy
+        if self.numpy and np is None:
+            raise ImportError("NumPy is not installed")
+        self.columns = {}
+        sizes = set()
+        for name, values in columns.items():
+            self.columns[name] = self._store(values)
+            sizes.add(len(self.columns[name]))
+        if len(sizes) > 1:
+            raise ValueError("all columns must have the same length")
+        self._size = sizes.pop() if sizes else 0
+
+    def _store(self, values):
+        if self.numpy:
+            return np.asarray(values)
+        if isinstance(values, array):
+            return values
+        values = list(values)
+        typecode = _typecode(values)
+        return values if typecode is None else array(typecode, values)
+
+    @classmethod
+    def from_records(cls, records, fields=None, use_numpy=None):
+        """Build from a list of dicts (every record needs every field)."""
+        records = list(records)
+        if fields is None:
+            fields = list(records[0]) if records else []
+        return cls({field: [record[field] for record in records] for field in fields}, use_numpy)
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def mask(self, expr):
+        """Boolean mask of ``expr`` (NumPy bool array or 0/1 ``bytes``)."""
+        return expr.mask(self)
+
+    def where(self, expr):
+        """Row numbers where ``expr`` holds (NumPy array or ``array('q')``)."""
+        mask = expr.mask(self)
+        if self.numpy:
+            return np.flatnonzero(mask)
+        return array("q", compress(range(self._size), mask))
+
+    def filter(self, expr):
+        """Rows where ``expr`` holds, as a ``View`` (no data copied)."""
+        return View(self, self.where(expr))
+
+
+class View:
+    """Some rows of a ``Table``, kept as row numbers."""
+
+    def __init__(self, table, indices):
+        self.table = table
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, name):
+        """Values of one column for the rows in the view."""
+        column = self.table.columns[name]
+        if self.table.numpy:
+            return column[self.indices].tolist()
+        return [column[i] for i in self.indices]
+
+    def filter(self, expr):
+        """Narrow the view further."""
+        mask = expr.mask(self.table)
+        if self.table.numpy:
+            return View(self.table, self.indices[mask[self.indices]])
+        return View(self.table, array("q", [i for i in self.indices if mask[i]]))
+
+    def rows(self):
+        """Yield each row as a dict (copies, one at a time)."""
+        columns = self.table.columns
+        for i in self.indices:
+            yield {name: column[i] for name, column in columns.items()}
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    students = [
+        {"name": "Alice", "grade": 85, "attendance": 95},
+        {"name": "Bob", "grade": 65, "attendance": 70},
+        {"name": "Charlie", "grade": 90, "attendance": 50},
+        {"name": "David", "grade": 75, "attendance": 85},
+        {"name": "Eve", "grade": 55, "attendance": 60},
+    ]
+    honors = (col("grade") >= 80) & (col("attendance") >= 80)
+    print(f"Honors list: {Table.from_records(students).filter(honors)['name']}")
+
+    records = [{"name": f"student{i}", "grade": random.randint(0, 100),
+                "attendance": random.randint(0, 100)} for i in range(2_000_000)]
+
+    start = time.perf_counter()
+    loop = []
+    for student in records:
+        if student["grade"] < 80:
+            continue
+        if student["attendance"] < 80:
+            continue
+        loop.append(student["name"])
+    print(f"\ndict loop:         {time.perf_counter() - start:.3f}s  {len(loop):,} rows")
+
+    for use_numpy in ([False, True] if np is not None else [False]):
+        table = Table.from_records(records, use_numpy=use_numpy)
+        start = time.perf_counter()
+        view = table.filter(honors)
+        elapsed = time.perf_counter() - start
+        print(f"Table ({'numpy' if use_numpy else 'arrays'}):  {elapsed:8.3f}s  {len(view):,} rows")
@@ -0,0 +1,31 @@
+"""
+CONTROL STRUCTURE HELPERS
+=========================
+
+Reusable functions from ``1-beginner-level/02-control-structures``.
+Run this file directly to see the examples.
+
+The functions are taken from the lesson files themselves (see ``_lessons``).
+01_if_else_elif.py and 04_nested_conditions.py both define a
+``calculate_discount``; the one from 01_if_else_elif.py (discount by
+customer type) is available here as ``calculate_customer_discount``.
+"""
+
+from ._lessons import define
+
+define(globals(), "02-control-structures/04_nested_conditions.py",
+       "calculate_ticket_price", "calculate_discount")
+
+_if_else_elif = {}
+define(_if_else_elif, "02-control-structures/01_if_else_elif.py", "calculate_discount")
+calculate_customer_discount = _if_else_elif["calculate_discount"]
+del _if_else_elif
+
+
+if __name__ == "__main__":
+    for age, is_student, is_weekend in [(10, False, True), (25, True, False), (70, False, False)]:
+        price, discount = calculate_ticket_price(age, is_student, is_weekend)
+        print(f"Age {age}, student={is_student}, weekend={is_weekend}: ${price:.2f} ({discount})")
+
+    print(calculate_discount(120, True, True, True))
+    print(calculate_customer_discount(100, "VIP", True))
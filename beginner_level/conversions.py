@@ -0,0 +1,184 @@
+"""
+BULK STRING TO NUMBER CONVERSION
+================================
+
+03_type_conversions.py converts one value at a time:
+
+    try:
+        number = int(text)
+    except ValueError:
+        ...
+
+Doing that for millions of values means millions of ``try`` blocks and a
+Python list of int objects. This module converts whole columns:
+- tokens are converted in chunks with ``map(int, chunk)``; one ``try`` covers
+  a whole chunk, and only a chunk that fails is redone token by token
+- results go into a compact ``array.array`` (8 bytes per value), or a NumPy
+  array without copying
+- invalid tokens are reported in a ``bytearray`` mask (1 = invalid) and
+  their value is set to 0 (int) or NaN (float)
+- chunks can be converted in parallel processes; only a few chunks per
+  worker are in flight at a time, and inputs below ``PARALLEL_MIN`` tokens
+  are converted in-process (starting workers and pickling tokens would cost
+  more than the conversion)
+
+``int()`` and ``float()`` accept bytes as well as str, so a raw CSV column
+can be split and converted without decoding it first.
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Converter -> (array typecode, value used for invalid tokens)
+KINDS = {
+    int: ("q", 0),
+    float: ("d", float("nan")),
+}
+PARALLEL_MIN = 1 << 20  # Fewer tokens than this are always converted in-process
+
+
+def _convert_chunk(chunk, kind):
+    """
+    Convert one chunk of tokens.
+
+    Returns:
+        tuple: (array of values, list of invalid positions in the chunk)
+    """
+    typecode, fill = KINDS[kind]
+    try:
+        # Fast path: the whole chunk is valid
+        return array(typecode, map(kind, chunk)), []
+    except (ValueError, TypeError, OverflowError):
+        pass
+
+    values = array(typecode)
+    bad = []
+    for position, token in enumerate(chunk):
+        try:
+            values.append(kind(token))
+        except (ValueError, TypeError, OverflowError):
+            values.append(fill)
+            bad.append(position)
+    return values, bad
+
+
+def _chunks(tokens, chunk_size):
+    if isinstance(tokens, (list, tuple)):
+        for start in range(0, len(tokens), chunk_size):
+            yield tokens[start:start + chunk_size]
+        return
+    iterator = iter(tokens)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _map_bounded(pool, func, chunks, window, *args):
+    """Like ``pool.map``, but only ``window`` chunks are submitted at a time."""
+    pending = deque()
+    for chunk in chunks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(func, chunk, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+def convert(tokens, kind=int, chunk_size=65536, workers=1, as_numpy=False):
+    """
+    Convert many strings (or bytes) to numbers.
+
+    Args:
+        tokens: Iterable of str or bytes tokens
+        kind: ``int`` or ``float``
+        chunk_size (int): Tokens per chunk
+        workers (int): Processes to use (None = one per CPU core)
+        as_numpy (bool): Return the values as a NumPy array (no copy)
+
+    Returns:
+        tuple: (values, errors) where errors[i] == 1 if tokens[i] was invalid
+
+    Example:
+        values, errors = convert(["10", "x", "30"])
+        # values = array('q', [10, 0, 30]), errors = bytearray(b'\\x00\\x01\\x00')
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be int or float, not {kind!r}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    chunks = _chunks(tokens, chunk_size)
+    if workers > 1:
+        # Look ahead just far enough to tell whether the input is small
+        wanted = -(-PARALLEL_MIN // chunk_size)
+        head = list(islice(chunks, wanted))
+        if len(head) < wanted:
+            workers = 1
+        chunks = chain(head, chunks)
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = _map_bounded(pool, _convert_chunk, chunks, 2 * workers, kind)
+    else:
+        pool = None
+        results = (_convert_chunk(chunk, kind) for chunk in chunks)
+
+    values = array(KINDS[kind][0])
+    errors = bytearray()
+    try:
+        for chunk_values, bad in results:
+            offset = len(values)
+            values.extend(chunk_values)
+            errors.extend(bytes(len(chunk_values)))
+            for position in bad:
+                errors[offset + position] = 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if as_numpy:
+        if np is None:
+            raise ImportError("NumPy is not installed")
+        values = np.frombuffer(values, dtype=np.int64 if kind is int else np.float64)
+    return values, errors
+
+
+def convert_buffer(buffer, kind=int, sep=b"\n", **options):
+    """
+    Convert a buffer of separated tokens, e.g. one CSV column read as bytes.
+
+    A trailing separator does not produce an extra empty token. Other
+    options are passed on to ``convert``.
+    """
+    data = bytes(buffer)
+    if data.endswith(sep):
+        data = data[:-len(sep)]
+    tokens = data.split(sep) if data else []
+    return convert(tokens, kind, **options)
+
+
+if __name__ == "__main__":
+    import time
+
+    column = [str(i) for i in range(1_000_000)]
+    column[10] = "abc"
+
+    start = time.perf_counter()
+    numbers = []
+    for text in column:
+        try:
+            numbers.append(int(text))
+        except ValueError:
+            numbers.append(0)
+    print(f"try/except per token: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    values, errors = convert(column)
+    print(f"convert():            {time.perf_counter() - start:.3f}s")
+    print(f"Invalid tokens: {errors.count(1)}, first at index {errors.index(1)}")
@@ -0,0 +1,250 @@
+"""
+CREDENTIAL STORE
+================
+
+``login_system`` (01_if_else_elif.py, 04_nested_conditions.py) compares the
+password with a plain-text literal, and ``verify_password``
+(03_break_continue.py) counts failed attempts in a local loop. That is fine
+for a lesson, but real systems need:
+
+- salted, slow password hashes (PBKDF2-HMAC-SHA256 from ``hashlib``), so a
+  leaked store does not reveal passwords
+- constant-time comparison (``hmac.compare_digest``), so response time does
+  not leak how much of a hash matched
+- a lockout counter per user, like ``max_attempts`` in ``verify_password``
+- a small LRU cache of recently verified logins, so a user who logs in again
+  shortly after does not pay for the slow hash twice
+- an asyncio API that runs the slow hash in a thread pool, so the event loop
+  keeps serving other requests while hashing
+
+At most ``max_attempts - failed`` attempts per user are hashed at the same
+time. Further concurrent attempts wait for those results instead of being
+rejected: a burst of correct logins all succeed (the later ones from the
+cache), and a burst of guesses still stops at ``max_attempts``.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+ALGORITHM = "pbkdf2_sha256"
+ITERATIONS = 600_000
+_BUSY = object()  # _precheck result: the attempt has to wait for others
+
+
+def hash_password(password, salt=None, iterations=ITERATIONS):
+    """
+    Hash a password for storage.
+
+    Returns:
+        str: "pbkdf2_sha256$<iterations>$<salt hex>$<hash hex>"
+    """
+    if salt is None:
+        salt = os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{ALGORITHM}${iterations}${salt.hex()}${digest.hex()}"
+
+
+def check_password(password, encoded):
+    """True if ``password`` matches a hash from ``hash_password``."""
+    algorithm, iterations, salt, expected = encoded.split("$")
+    if algorithm != ALGORITHM:
+        raise ValueError(f"Unknown hash algorithm: {algorithm!r}")
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), int(iterations))
+    return hmac.compare_digest(digest.hex(), expected)
+
+
+class CredentialStore:
+    """
+    Users, password hashes, lockouts and a cache of recent logins.
+
+    Example:
+        store = CredentialStore()
+        store.add_user("admin", "admin123")
+        store.login("admin", "admin123")   # 'Login successful!'
+
+    Args:
+        max_attempts (int): Failed logins before the account is locked
+        lockout_seconds (float): How long a lock lasts
+        cache_size (int): Recently verified logins to remember
+        cache_seconds (float): How long a cached login stays valid
+        iterations (int): PBKDF2 iterations for new hashes
+        workers (int): Threads used by ``login_async`` for hashing
+    """
+
+    def __init__(self, max_attempts=3, lockout_seconds=300, cache_size=1024,
+                 cache_seconds=300, iterations=ITERATIONS, workers=4):
+        self.max_attempts = max_attempts
+        self.lockout_seconds = lockout_seconds
+        self.cache_size = cache_size
+        self.cache_seconds = cache_seconds
+        self.iterations = iterations
+
+        self.users = {}       # username -> {"hash": ..., "verified": bool}
+        self.failures = {}    # username -> (failed attempts, time of last failure)
+        self.in_flight = {}   # username -> attempts being hashed right now
+        self._cache = OrderedDict()   # keyed digest -> expiry time
+        self._cache_key = os.urandom(32)
+        self._lock = threading.Lock()
+        self._settled = threading.Condition(self._lock)  # Notified when an attempt finishes
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash")
+        # Hash for unknown users, so they take as long as real ones
+        self._dummy_hash = hash_password("", iterations=iterations)
+
+    def add_user(self, username, password, verified=True):
+        """Create a user, or replace the password of an existing one."""
+        record = {"hash": hash_password(password, iterations=self.iterations), "verified": verified}
+        with self._lock:
+            self.users[username] = record
+            self._cache.clear()  # Old passwords must not stay cached
+
+    def _cache_token(self, username, password):
+        # Keyed hash: the cache never holds anything derived from the
+        # password without a secret that only lives in this process
+        return hmac.new(self._cache_key, f"{username}\0{password}".encode(), "sha256").digest()
+
+    def _precheck(self, username, password, wait=True):
+        """
+        Fast checks before hashing. Returns a final status or None.
+
+        None means the attempt holds an in-flight reservation and must be
+        hashed. When the user's remaining failure budget is taken by
+        attempts still being hashed, the call waits for them to finish
+        (or returns ``_BUSY`` when ``wait`` is False) and checks again.
+        """
+        if not username:
+            return "Username cannot be empty"
+        if not password:
+            return "Password cannot be empty"
+
+        token = self._cache_token(username, password)
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                failed, last = self.failures.get(username, (0, 0.0))
+                if failed >= self.max_attempts:
+                    if now - last < self.lockout_seconds:
+                        return "Account locked - too many failed attempts"
+                    del self.failures[username]
+                    failed = 0
+
+                expires = self._cache.get(token)
+                if expires is not None:
+                    if expires > now:
+                        self._cache.move_to_end(token)
+                        self.failures.pop(username, None)
+                        return self._success_message(username)
+                    del self._cache[token]
+
+                # Every attempt being hashed could still fail, so together
+                # they may not exceed the failures the user has left
+                pending = self.in_flight.get(username, 0)
+                if failed + pending < self.max_attempts:
+                    self.in_flight[username] = pending + 1
+                    return None
+                if not wait:
+                    return _BUSY
+                self._settled.wait()
+
+    def _release(self, username):
+        """Drop the in-flight reservation made by ``_precheck``. Needs ``_lock``."""
+        pending = self.in_flight[username] - 1
+        if pending:
+            self.in_flight[username] = pending
+        else:
+            del self.in_flight[username]
+        self._settled.notify_all()
+
+    def _verify(self, username, password):
+        """The slow part: hash and compare in constant time."""
+        record = self.users.get(username)
+        encoded = record["hash"] if record else self._dummy_hash
+        return check_password(password, encoded) and record is not None
+
+    def _success_message(self, username):
+        if self.users[username]["verified"]:
+            return "Login successful!"
+        return "Please verify your email first"
+
+    def _record(self, username, password, ok):
+        """Update counters and cache after a hash check."""
+        now = time.monotonic()
+        with self._lock:
+            if not ok:
+                # Only real accounts get a counter, so guessing made-up
+                # usernames cannot grow ``failures`` without limit
+                if username in self.users:
+                    failed, _ = self.failures.get(username, (0, 0.0))
+                    self.failures[username] = (failed + 1, now)
+                self._release(username)
+                return "Invalid credentials"
+
+            self.failures.pop(username, None)
+            self._cache[self._cache_token(username, password)] = now + self.cache_seconds
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)  # Drop the least recently used
+            # Released last, so waiting attempts see the failure or the cache entry
+            self._release(username)
+            return self._success_message(username)
+
+    def login(self, username, password):
+        """Check a login. Returns a status message like ``login_system``."""
+        status = self._precheck(username, password)
+        if status is not None:
+            return status
+        try:
+            ok = self._verify(username, password)
+        except BaseException:
+            with self._lock:
+                self._release(username)
+            raise
+        return self._record(username, password, ok)
+
+    async def login_async(self, username, password):
+        """Same as ``login``, with the hashing done in a worker thread."""
+        loop = asyncio.get_running_loop()
+        status = self._precheck(username, password, wait=False)
+        if status is _BUSY:
+            # Wait in a worker thread, never on the event loop. Attempts that
+            # hold a reservation were queued on the executor before this one,
+            # so they run first and wake it up
+            return await loop.run_in_executor(self._executor, self.login, username, password)
+        if status is not None:
+            return status
+        try:
+            ok = await loop.run_in_executor(self._executor, self._verify, username, password)
+        except BaseException:
+            with self._lock:
+                self._release(username)
+            raise
+        return self._record(username, password, ok)
+
+    def close(self):
+        """Stop the hashing threads."""
+        self._executor.shutdown()
+
+
+if __name__ == "__main__":
+    store = CredentialStore(iterations=100_000)
+    store.add_user("admin", "admin123")
+    store.add_user("jane_doe", "secret123", verified=False)
+
+    for username, password in [("admin", "admin123"), ("admin", "admin123"),
+                               ("jane_doe", "secret123"), ("", "pass")]:
+        start = time.perf_counter()
+        status = store.login(username, password)
+        print(f"{username or '<empty>':<10} {status:<35} {(time.perf_counter() - start) * 1000:6.1f} ms")
+
+    for attempt in ["wrong1", "wrong2", "wrong3", "admin123"]:
+        print(f"admin / {attempt:<9} {store.login('admin', attempt)}")
+
+    async def burst():
+        return await asyncio.gather(*(store.login_async("jane_doe", "secret123") for _ in range(4)))
+
+    print(asyncio.run(burst()))
+    store.close()
@@ -0,0 +1,55 @@
+"""
+DATA STRUCTURE HELPERS
+======================
+
+Reusable functions from ``1-beginner-level/04-data-structures``.
+Run this file directly to see the examples.
+
+The contact book functions of 05_dictionaries.py use a global ``contacts``
+dict and print their results; these take the book as an argument and
+return the details instead.
+"""
+
+
+def add_contact(contacts, name, phone, email, address):
+    """
+    Add (or replace) a contact in a contact book (see 05_dictionaries.py).
+
+    Args:
+        contacts (dict): Contact book, name -> details dict
+        name (str): Contact name, used as the key
+        phone (str): Phone number
+        email (str): Email address
+        address (str): Postal address
+
+    Returns:
+        dict: The stored contact details
+    """
+    contacts[name] = {
+        "phone": phone,
+        "email": email,
+        "address": address
+    }
+    return contacts[name]
+
+
+def search_contact(contacts, name):
+    """Return the details for ``name``, or None if not found."""
+    return contacts.get(name)
+
+
+if __name__ == "__main__":
+    book = {}
+    add_contact(book, "Alice", "555-1234", "alice@email.com", "123 Main St")
+    add_contact(book, "Charlie", "555-9012", "charlie@email.com", "789 Pine Rd")
+
+    for contact_name in ("Alice", "Diana"):
+        details = search_contact(book, contact_name)
+        if details is None:
+            print(f"✗ {contact_name} not found")
+            continue
+        print(f"{contact_name}:")
+        for key, value in details.items():
+            print(f"  {key.capitalize()}: {value}")
+
+    print(f"\nTotal contacts: {len(book)}")
@@ -0,0 +1,291 @@
+"""
+COMPILED DECISION TABLES
+========================
+
+``calculate_ticket_price`` and ``calculate_discount`` (04_nested_conditions.py)
+walk several nested ``if`` levels on every call. But their inputs only matter
+in a few ranges: "age < 18", "age >= 65", "student or not", ...
+
+A decision table turns such a function into a lookup:
+1. Every input becomes an ``Axis`` that maps a value to a small band number
+   (``bisect`` on the cut points, or a dict for categories).
+2. The original function is called once for one sample value of every
+   combination of bands, and the answers are stored in a flat list.
+3. A call is then a few band lookups and one list index. ``compile()``
+   writes those lookups out as a single expression, so the table is as
+   cheap to call as the original branches.
+
+With NumPy installed, ``lookup_many`` does the same for whole columns with
+``numpy.searchsorted``, so millions of rows are priced without a Python loop.
+
+Example:
+    TICKET_TABLE(25, True, False)   # (15.0, 'Student discount')
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import product
+
+from .control_structures import (
+    calculate_customer_discount,
+    calculate_discount,
+    calculate_ticket_price,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+class Axis:
+    """
+    One input of a decision table.
+
+    Numeric axis (``cuts`` given): values are split into len(cuts) + 1 bands.
+        side="right" matches rules written as ``x >= cut`` / ``x < cut``
+        side="left" matches rules written as ``x > cut`` / ``x <= cut``
+    Categorical axis: one band per entry of ``values``. With ``other=True``
+    any unknown value goes to one extra band.
+
+    Examples:
+        Axis("age", cuts=(18, 65))                   # <18, 18-64, >=65
+        Axis("amount", cuts=(100, 150), side="left")  # <=100, <=150, >150
+        Axis("is_weekend")                           # False, True
+    """
+
+    def __init__(self, name, cuts=None, side="right", values=(False, True), other=False):
+        self.name = name
+        self.cuts = tuple(cuts) if cuts is not None else None
+        self.side = side
+
+        if self.cuts is not None:
+            if list(self.cuts) != sorted(set(self.cuts)):
+                raise ValueError(f"{name}: cuts must be sorted and unique")
+            if side not in ("left", "right"):
+                raise ValueError(f"{name}: side must be 'left' or 'right'")
+            self._bisect = bisect_right if side == "right" else bisect_left
+            self.samples = self._numeric_samples()
+        else:
+            self.values = tuple(values)
+            self.other = other
+            self._codes = {value: code for code, value in enumerate(self.values)}
+            self.samples = self.values + ((None,) if other else ())
+
+    def _numeric_samples(self):
+        """One value inside every band, used to evaluate the rule."""
+        cuts = self.cuts
+        samples = [cuts[0] - 1]
+        samples += [(low + high) / 2 for low, high in zip(cuts, cuts[1:])]
+        samples.append(cuts[-1] + 1)
+        return tuple(samples)
+
+    def __len__(self):
+        """Number of bands."""
+        return len(self.samples)
+
+    def code(self, value):
+        """Band number of one value."""
+        if self.cuts is not None:
+            return self._bisect(self.cuts, value)
+        code = self._codes.get(value)
+        if code is None:
+            if not self.other:
+                raise KeyError(f"{self.name}: unexpected value {value!r}")
+            return len(self.values)
+        return code
+
+    def codes(self, column):
+        """Band numbers of a whole column (NumPy array)."""
+        if self.cuts is not None:
+            return np.searchsorted(np.asarray(self.cuts), np.asarray(column), side=self.side)
+        column = np.asarray(column)
+        if self.values == (False, True) and not self.other:
+            return column.astype(bool).astype(np.intp)
+        result = np.full(column.shape, len(self.values) if self.other else -1, dtype=np.intp)
+        for code, value in enumerate(self.values):
+            result[column == value] = code
+        if (result < 0).any():
+            raise KeyError(f"{self.name}: unexpected value in column")
+        return result
+
+
+class DecisionTable:
+    """
+    A function of several inputs, precomputed over every band combination.
+
+    Args:
+        rule: The original function; called once per cell at build time
+        axes (list): One ``Axis`` per positional argument of ``rule``
+    """
+
+    def __init__(self, rule, axes):
+        self.rule = rule
+        self.axes = list(axes)
+
+        # Row-major strides: the last axis changes fastest
+        self.strides = []
+        stride = 1
+        for axis in reversed(self.axes):
+            self.strides.append(stride)
+            stride *= len(axis)
+        self.strides.reverse()
+
+        self.cells = [rule(*samples) for samples in product(*(axis.samples for axis in self.axes))]
+
+    def compile(self):
+        """
+        Build a fast lookup function with the same arguments as ``rule``.
+
+        The band lookups are written out as one expression, for example
+        ``cells[((a0 >= 18) + (a0 >= 65)) * 4 + (2 if a1 else 0) + ...]``,
+        so a call costs about as much as the original ``if`` chain.
+        """
+        namespace = {"cells": self.cells, "bisect_left": bisect_left, "bisect_right": bisect_right}
+        terms = []
+        for i, (axis, stride) in enumerate(zip(self.axes, self.strides)):
+            arg = f"a{i}"
+            if axis.cuts is not None:
+                if len(axis.cuts) <= 3 and all(type(cut) in (int, float) for cut in axis.cuts):
+                    op = ">=" if axis.side == "right" else ">"
+                    band = " + ".join(f"({arg} {op} {cut!r})" for cut in axis.cuts)
+                else:
+                    namespace[f"cuts{i}"] = axis.cuts
+                    band = f"{axis._bisect.__name__}(cuts{i}, {arg})"
+                terms.append(f"({band}) * {stride}")
+            elif axis.values == (False, True) and not axis.other:
+                terms.append(f"({stride} if {arg} else 0)")
+            else:
+                namespace[f"codes{i}"] = {value: code * stride for value, code in axis._codes.items()}
+                if axis.other:
+                    terms.append(f"codes{i}.get({arg}, {len(axis.values) * stride})")
+                else:
+                    terms.append(f"codes{i}[{arg}]")
+
+        args = ", ".join(f"a{i}" for i in range(len(self.axes)))
+        source = f"def lookup({args}):\n    return cells[{' + '.join(terms)}]\n"
+        exec(source, namespace)
+        lookup = namespace["lookup"]
+        lookup.__doc__ = f"Compiled decision table for {getattr(self.rule, '__name__', 'rule')}."
+        return lookup
+
+    def index(self, *args):
+        """Cell number for one set of inputs."""
+        cell = 0
+        for axis, stride, value in zip(self.axes, self.strides, args):
+            cell += axis.code(value) * stride
+        return cell
+
+    def __call__(self, *args):
+        """Same answer as ``rule(*args)``, from the table."""
+        return self.cells[self.index(*args)]
+
+    def lookup_many(self, *columns):
+        """
+        Cell numbers for whole columns at once (requires NumPy).
+
+        Returns:
+            numpy.ndarray: one cell number per row; use ``column(i)[cells]``
+                           to turn them into values
+        """
+        if np is None:
+            raise ImportError("NumPy is not installed")
+        cells = 0
+        for axis, stride, column in zip(self.axes, self.strides, columns):
+            cells = cells + axis.codes(column) * stride
+        return np.asarray(cells, dtype=np.intp)
+
+    def column(self, position=None):
+        """
+        The cell values as a NumPy array.
+
+        Args:
+            position (int): For rules that return tuples, which element to use
+        """
+        if position is None:
+            return np.asarray(self.cells)
+        return np.asarray([cell[position] for cell in self.cells])
+
+
+TICKET_TABLE = DecisionTable(calculate_ticket_price, [
+    Axis("age", cuts=(18, 65)),
+    Axis("is_student"),
+    Axis("is_weekend"),
+])
+
+# The discount percent depends only on bands; the final amount is arithmetic
+DISCOUNT_TABLE = DecisionTable(
+    lambda total_amount, *flags: calculate_discount(total_amount, *flags)[1],
+    [
+        Axis("total_amount", cuts=(100, 150), side="left"),
+        Axis("is_member"),
+        Axis("has_coupon"),
+        Axis("is_first_purchase"),
+    ],
+)
+
+CUSTOMER_DISCOUNT_TABLE = DecisionTable(
+    lambda customer_type, has_coupon: calculate_customer_discount(0, customer_type, has_coupon)[1],
+    [
+        Axis("customer_type", values=("VIP", "Member", "Regular"), other=True),
+        Axis("has_coupon"),
+    ],
+)
+
+
+# Table version of calculate_ticket_price: ticket_price(age, is_student, is_weekend)
+ticket_price = TICKET_TABLE.compile()
+_discount_percent = DISCOUNT_TABLE.compile()
+customer_discount_percent = CUSTOMER_DISCOUNT_TABLE.compile()
+
+
+def discount(total_amount, is_member, has_coupon, is_first_purchase):
+    """Table version of ``calculate_discount``: (final amount, percent)."""
+    percent = _discount_percent(total_amount, is_member, has_coupon, is_first_purchase)
+    return total_amount * (1 - percent / 100), percent
+
+
+def ticket_prices(ages, is_student, is_weekend):
+    """
+    Price many tickets at once (requires NumPy).
+
+    Returns:
+        tuple: (prices array, cell numbers); ``TICKET_TABLE.cells[n][1]``
+               is the description for cell number n
+    """
+    cells = TICKET_TABLE.lookup_many(ages, is_student, is_weekend)
+    return TICKET_TABLE.column(0)[cells], cells
+
+
+def discounts(total_amounts, is_member, has_coupon, is_first_purchase):
+    """
+    Discount many carts at once (requires NumPy).
+
+    Returns:
+        tuple: (final amounts array, discount percent array)
+    """
+    total_amounts = np.asarray(total_amounts, dtype=np.float64)
+    cells = DISCOUNT_TABLE.lookup_many(total_amounts, is_member, has_coupon, is_first_purchase)
+    percents = DISCOUNT_TABLE.column()[cells]
+    return total_amounts * (1 - percents / 100), percents
+
+
+if __name__ == "__main__":
+    import time
+
+    rows = [(age, age % 3 == 0, age % 2 == 0) for age in range(100)] * 10_000
+
+    start = time.perf_counter()
+    for row in rows:
+        calculate_ticket_price(*row)
+    print(f"Nested ifs:     {time.perf_counter() - start:.3f}s for {len(rows):,} rows")
+
+    start = time.perf_counter()
+    for row in rows:
+        ticket_price(*row)
+    print(f"Decision table: {time.perf_counter() - start:.3f}s")
+
+    if np is not None:
+        ages, students, weekends = (np.array(column) for column in zip(*rows))
+        start = time.perf_counter()
+        ticket_prices(ages, students, weekends)
+        print(f"NumPy batch:    {time.perf_counter() - start:.3f}s")
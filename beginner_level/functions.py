@@ -0,0 +1,59 @@
+"""
+FUNCTION HELPERS
+================
+
+Reusable functions from ``1-beginner-level/05-functions``.
+Run this file directly to see the examples.
+
+The grade and validator functions are taken from 01_function_definition.py
+itself (see ``_lessons``). ``process_data`` is a quiet version of the one
+in 02_parameters_and_arguments.py: the lesson prints every step and needs
+a list, this one returns a new list from any iterable.
+"""
+
+from ._lessons import define
+
+define(globals(), "05-functions/01_function_definition.py",
+       "calculate_grade", "calculate_average_grade",
+       "is_valid_email", "is_valid_password", "validate_user")
+
+
+def process_data(data, /, transform=None, *, filter_fn=None, sort_key=None, reverse=False):
+    """
+    Process data with various operations (see 02_parameters_and_arguments.py).
+
+    Args:
+        data: Input data (position-only to allow 'data' in kwargs)
+        transform: Function to transform each item
+        filter_fn: Function to filter items (keyword-only)
+        sort_key: Function for sorting (keyword-only)
+        reverse: Reverse sort order (keyword-only)
+
+    Returns:
+        list: A new list, the input is not modified
+    """
+    result = list(data)
+
+    if filter_fn:
+        result = [x for x in result if filter_fn(x)]
+
+    if transform:
+        result = [transform(x) for x in result]
+
+    if sort_key:
+        result = sorted(result, key=sort_key, reverse=reverse)
+
+    return result
+
+
+if __name__ == "__main__":
+    student_scores = [85, 92, 78, 88, 95]
+    average, letter_grade = calculate_average_grade(student_scores)
+    print(f"Scores: {student_scores}")
+    print(f"Average: {average:.2f}, Grade: {letter_grade}")
+
+    print(validate_user("user@example.com", "Pass1234"))
+
+    numbers = [5, 2, 8, 1, 9, 3, 7, 4, 6]
+    print(process_data(numbers, lambda x: x * 2, filter_fn=lambda x: x > 5,
+                       sort_key=lambda x: x, reverse=True))
@@ -0,0 +1,185 @@
+"""
+GUESSING GAME SIMULATOR
+=======================
+
+``guessing_game`` (02_while_loop.py) replays a fixed list of guesses
+against ``secret_number = 42``. Two questions it cannot answer: what is the
+best way to guess, and how many attempts do players need?
+
+Best strategy: always guess the middle of the numbers still possible. Each
+"too low" / "too high" halves the range, so no secret in 1-100 needs more
+than 7 attempts (ceil(log2(101))). No strategy has a better worst case:
+after k answers at most 2^k - 1 numbers can be told apart.
+
+Simulation: ``simulate`` plays many games and returns how often each
+attempt count occurred.
+- with NumPy all games of a chunk are played together: one array of
+  low/high bounds per game, one vectorised step per round
+- chunks can run on a ``ProcessPoolExecutor``; every chunk gets its own
+  random seed (``numpy.random.SeedSequence.spawn``), so results do not
+  depend on the number of workers
+- strategies: "binary" (middle) and "random" (any number still possible)
+
+Example:
+    distribution = simulate(1_000_000, strategy="random", workers=None)
+    win_rate(distribution, max_attempts=5)
+"""
+
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+STRATEGIES = ("binary", "random")
+
+
+def binary_guess(low, high):
+    """Middle of [low, high]: the minimax guess."""
+    return (low + high) // 2
+
+
+def worst_case(low=1, high=100):
+    """Attempts binary search needs in the worst case."""
+    return (high - low + 1).bit_length()
+
+
+def play(secret, low=1, high=100, strategy="binary", rng=random):
+    """
+    Play one game.
+
+    Returns:
+        int: number of attempts until the secret was guessed
+    """
+    if not low <= secret <= high:
+        raise ValueError(f"secret must be between {low} and {high}: {secret}")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"strategy must be one of {STRATEGIES}")
+    attempts = 0
+    while True:
+        guess = binary_guess(low, high) if strategy == "binary" else rng.randint(low, high)
+        attempts += 1
+        if guess == secret:
+            return attempts
+        if guess < secret:
+            low = guess + 1   # Too low
+        else:
+            high = guess - 1  # Too high
+
+
+def _simulate_numpy(games, low, high, strategy, seed):
+    """Play ``games`` games at once. Returns attempt counts (bincount)."""
+    rng = np.random.default_rng(seed)
+    secrets = rng.integers(low, high + 1, size=games)
+    lows = np.full(games, low, dtype=np.int64)
+    highs = np.full(games, high, dtype=np.int64)
+    attempts = np.zeros(games, dtype=np.int64)
+    active = np.arange(games)
+
+    rounds = 0
+    while active.size:
+        rounds += 1
+        lo, hi, secret = lows[active], highs[active], secrets[active]
+        if strategy == "binary":
+            guess = (lo + hi) // 2
+        else:
+            guess = lo + (rng.random(active.size) * (hi - lo + 1)).astype(np.int64)
+        found = guess == secret
+        attempts[active[found]] = rounds
+        too_low = guess < secret
+        lows[active[too_low]] = guess[too_low] + 1
+        too_high = guess > secret
+        highs[active[too_high]] = guess[too_high] - 1
+        active = active[~found]
+    return np.bincount(attempts)
+
+
+def _simulate_chunk(games, low, high, strategy, seed):
+    """One chunk of games, as {attempts: games}."""
+    if np is not None:
+        counts = _simulate_numpy(games, low, high, strategy, seed)
+        return {attempts: int(count) for attempts, count in enumerate(counts) if count}
+    rng = random.Random(seed)
+    return Counter(play(rng.randint(low, high), low, high, strategy, rng) for _ in range(games))
+
+
+def simulate(games, low=1, high=100, strategy="binary", workers=1, chunk_size=250_000, seed=None):
+    """
+    Play many games with random secrets.
+
+    Args:
+        games (int): Number of games
+        low, high (int): Range of the secret number
+        strategy (str): "binary" or "random"
+        workers (int): Processes to use (None = one per CPU core)
+        chunk_size (int): Games per chunk
+        seed (int): Seed for reproducible results
+
+    Returns:
+        Counter: {attempts: number of games}
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"strategy must be one of {STRATEGIES}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    sizes = [min(chunk_size, games - start) for start in range(0, games, chunk_size)]
+    if np is not None:
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    else:
+        base = random.Random(seed)
+        seeds = [base.getrandbits(64) for _ in sizes]
+
+    chunks = [(size, low, high, strategy, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    distribution = Counter()
+    if workers <= 1:
+        for chunk in chunks:
+            distribution.update(_simulate_chunk(*chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_simulate_chunk, *zip(*chunks)):
+                distribution.update(part)
+    return distribution
+
+
+def win_rate(distribution, max_attempts=5):
+    """Share of games won within ``max_attempts`` (the lesson allows 5)."""
+    total = sum(distribution.values())
+    won = sum(count for attempts, count in distribution.items() if attempts <= max_attempts)
+    return won / total if total else 0.0
+
+
+def mean_attempts(distribution):
+    """Average attempts per game."""
+    total = sum(distribution.values())
+    return sum(attempts * count for attempts, count in distribution.items()) / total if total else 0.0
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Simulate the number guessing game.")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=1, help="processes (0 = one per core)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+
+    print(f"Secret 42, binary search: {play(42)} attempts (worst case {worst_case()})")
+    for strategy in STRATEGIES:
+        start = time.perf_counter()
+        distribution = simulate(args.games, strategy=strategy, workers=args.workers or None,
+                                seed=args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"\n{strategy}: {args.games:,} games in {elapsed:.2f}s, "
+              f"mean {mean_attempts(distribution):.2f} attempts, "
+              f"won within 5: {win_rate(distribution):.1%}")
+        peak = max(distribution.values())
+        for attempts in sorted(distribution):
+            share = distribution[attempts] / args.games
+            print(f"  {attempts:>2} {'█' * round(40 * distribution[attempts] / peak):<40} {share:6.2%}")
@@ -0,0 +1,174 @@
+"""
+BATCH INPUT VALIDATION
+======================
+
+04_user_input.py validates one ``input()`` answer at a time:
+- ``get_valid_age``: a whole number from 1 to 120
+- ``get_yes_no``: yes / y / no / n (any case)
+- ``show_menu``: a choice from 1 to 3
+
+This module applies the same rules to many recorded answers at once. Answers
+can come from any iterable of lines (a list, ``sys.stdin``, a file) or from an
+``asyncio.StreamReader``. Nothing waits on a terminal.
+
+The rules are prepared once: all valid answers are put in a dict, so the
+common case is a single lookup instead of ``int()`` inside ``try/except``.
+Only unusual input (e.g. " +07") falls back to ``int()``.
+
+Usage:
+    python -m beginner_level.input_validation age < answers.txt
+"""
+
+import argparse
+import sys
+import time
+from collections import namedtuple
+
+# One validated answer: ok is True -> value is the parsed answer,
+# ok is False -> value is the error message
+Result = namedtuple("Result", ["line", "text", "ok", "value"])
+
+
+class Rule:
+    """
+    A validation rule built from a table of valid answers.
+
+    Args:
+        name (str): Rule name
+        table (dict): normalised answer -> value
+        error (str): Message for answers that are not in the table
+        normalise: Function applied to the raw answer before the lookup
+        fallback: Optional slow parser for answers missing from the table;
+                  returns (ok, value_or_message)
+    """
+
+    def __init__(self, name, table, error, normalise=str.strip, fallback=None):
+        self.name = name
+        self.table = table
+        self.error = error
+        self.normalise = normalise
+        self.fallback = fallback
+
+    def check(self, text):
+        """Validate one answer, return (ok, value_or_message)."""
+        key = self.normalise(text)
+        value = self.table.get(key, self)
+        if value is not self:
+            return True, value
+        if self.fallback is not None:
+            return self.fallback(key)
+        return False, self.error
+
+
+def _number_fallback(low, high, range_error, type_error):
+    def parse(text):
+        try:
+            number = int(text)
+        except ValueError:
+            return False, type_error
+        if low <= number <= high:
+            return True, number
+        return False, range_error
+    return parse
+
+
+def number_rule(name, low, high, range_error, type_error):
+    """Rule accepting whole numbers from low to high."""
+    table = {str(number): number for number in range(low, high + 1)}
+    return Rule(name, table, type_error,
+                fallback=_number_fallback(low, high, range_error, type_error))
+
+
+RULES = {
+    "age": number_rule("age", 1, 120,
+                       "Age must be between 1 and 120",
+                       "Invalid input! Please enter a number"),
+    "yes_no": Rule("yes_no", {"yes": True, "y": True, "no": False, "n": False},
+                   "Please answer yes or no",
+                   normalise=str.lower),
+    "menu": number_rule("menu", 1, 3,
+                        "Choice must be 1, 2, or 3",
+                        "Please enter a number"),
+}
+
+
+def _get_rule(rule):
+    return RULES[rule] if isinstance(rule, str) else rule
+
+
+def validate_lines(lines, rule):
+    """
+    Validate an iterable of answers.
+
+    Args:
+        lines: Iterable of str (e.g. a list, a file, ``sys.stdin``)
+        rule: A ``Rule`` or the name of one in ``RULES``
+
+    Yields:
+        Result: one per line, in input order
+    """
+    check = _get_rule(rule).check
+    for number, text in enumerate(lines, 1):
+        text = text.rstrip("\r\n")
+        ok, value = check(text)
+        yield Result(number, text, ok, value)
+
+
+def validate_all(lines, rule):
+    """
+    Validate everything and split the results.
+
+    Returns:
+        tuple: (accepted results, rejected results)
+    """
+    accepted, rejected = [], []
+    for result in validate_lines(lines, rule):
+        (accepted if result.ok else rejected).append(result)
+    return accepted, rejected
+
+
+async def validate_stream(reader, rule):
+    """
+    Validate answers read from an ``asyncio.StreamReader``.
+
+    Yields:
+        Result: one per line, as soon as the line has arrived
+    """
+    check = _get_rule(rule).check
+    number = 0
+    while line := await reader.readline():
+        number += 1
+        text = line.decode().rstrip("\r\n")
+        ok, value = check(text)
+        yield Result(number, text, ok, value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate recorded answers.")
+    parser.add_argument("rule", choices=sorted(RULES))
+    parser.add_argument("file", nargs="?", help="answers file (default: stdin)")
+    parser.add_argument("--summary", action="store_true", help="only print counts")
+    args = parser.parse_args(argv)
+
+    source = open(args.file, encoding="utf-8") if args.file else sys.stdin
+    accepted = rejected = 0
+    start = time.perf_counter()
+    with source:
+        for result in validate_lines(source, args.rule):
+            if result.ok:
+                accepted += 1
+            else:
+                rejected += 1
+            if not args.summary:
+                status = "accepted" if result.ok else "rejected"
+                print(f"{result.line}\t{status}\t{result.text}\t{result.value}")
+    elapsed = time.perf_counter() - start
+
+    total = accepted + rejected
+    rate = total / elapsed if elapsed else float("inf")
+    print(f"{total:,} answers: {accepted:,} accepted, {rejected:,} rejected "
+          f"({rate:,.0f} answers/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
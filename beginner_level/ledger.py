@@ -0,0 +1,376 @@
+"""
+ACCOUNT LEDGER
+==============
+
+``atm_simulation`` (02_while_loop.py) keeps one ``balance`` in a local
+variable and handles a fixed list of transactions one after another. A real
+ledger has many accounts, many threads posting at once, and must survive a
+restart.
+
+``Ledger`` keeps balances in integer cents and adds:
+- an append-only transaction log: fixed 32-byte records in a memory-mapped
+  file, so a posting is a ``struct.pack_into`` and no ``write()`` call
+- striped locks: account ``a`` uses lock ``a % stripes``, so threads posting
+  to different accounts rarely wait for each other (the only shared step is
+  ``next()`` on the log position counter, which is atomic and takes no lock)
+- snapshots: all balances plus the log position, written atomically; on
+  ``open`` the newest snapshot is loaded and only the log after it is
+  replayed
+
+Run ``python -m beginner_level.ledger --postings 1000000 --threads 8`` for a
+replay benchmark with postings per second and tail latency.
+
+Example:
+    with Ledger.open("ledger_dir") as ledger:
+        ledger.open_account(1, 1000_00)
+        ledger.withdraw(1, 300_00)    # 70000
+        ledger.deposit(1, 500_00)     # 120000
+"""
+
+import mmap
+import os
+import struct
+import threading
+from array import array
+from itertools import count
+
+RECORD = struct.Struct("<QIBxxxqq")  # sequence, account, kind, amount, balance after
+DEPOSIT, WITHDRAW, OPEN = 1, 2, 3
+LOG_NAME = "ledger.log"
+SNAPSHOT_NAME = "snapshot.bin"
+SNAPSHOT_HEADER = struct.Struct("<8sQQ")  # magic, log position, number of accounts
+SNAPSHOT_MAGIC = b"LEDGSNAP"
+MAX_ACCOUNT = (1 << 32) - 1          # Account numbers are stored as uint32
+MIN_CENTS, MAX_CENTS = -(1 << 63), (1 << 63) - 1  # Amounts and balances are int64
+
+
+class InsufficientFunds(ValueError):
+    """Withdrawal larger than the balance."""
+
+
+class Ledger:
+    """
+    Balances of many accounts with a memory-mapped transaction log.
+
+    Use ``Ledger.open(directory)`` rather than the constructor.
+
+    Args:
+        directory (str): Folder for the log and snapshot files
+        stripes (int): Number of account locks
+        grow_records (int): Log records added each time the file fills up
+        snapshot_every (int): Take a snapshot after this many postings
+                              (0 = only when ``snapshot`` is called)
+    """
+
+    def __init__(self, directory, stripes=64, grow_records=1 << 20, snapshot_every=0):
+        self.directory = directory
+        self.balances = {}
+        self.stripes = [threading.Lock() for _ in range(stripes)]
+        self.grow_records = grow_records
+        self.snapshot_every = snapshot_every
+
+        self._positions = count()        # Hands out log positions
+        self._grow_lock = threading.Lock()
+        self._maps = []                  # Old maps stay open for threads still using them
+        self._map = None
+        self._capacity = 0
+        self._file = None
+
+    @classmethod
+    def open(cls, directory, **options):
+        """Open (or create) a ledger: load the snapshot, replay the log after it."""
+        os.makedirs(directory, exist_ok=True)
+        ledger = cls(directory, **options)
+        ledger._recover()
+        return ledger
+
+    # -- log file -------------------------------------------------------
+
+    def _map_file(self, records):
+        """Make the log file hold ``records`` records and map all of it."""
+        self._file.truncate(records * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), records * RECORD.size)
+        self._maps.append(self._map)
+        self._capacity = records
+
+    def _grow(self, needed):
+        with self._grow_lock:
+            if needed >= self._capacity:
+                self._map_file(max(needed + 1, self._capacity + self.grow_records))
+
+    def _append(self, account, kind, amount, balance):
+        """Write one record. Called with the account's stripe lock held."""
+        position = next(self._positions)
+        if position >= self._capacity:
+            self._grow(position)
+        RECORD.pack_into(self._map, position * RECORD.size, position + 1, account, kind, amount, balance)
+        return position
+
+    def _recover(self):
+        path = os.path.join(self.directory, LOG_NAME)
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map_file(max(size // RECORD.size, self.grow_records))
+
+        start = self._load_snapshot()
+        end_position = start
+        balances = self.balances
+        # Slots are written in parallel, so a crash can leave empty (zero)
+        # records between written ones: skip them, keep the highest position
+        end = min(size // RECORD.size, self._capacity)
+        view = memoryview(self._map)[start * RECORD.size:end * RECORD.size]
+        try:
+            for sequence, account, kind, _, balance in RECORD.iter_unpack(view):
+                if kind:
+                    balances[account] = balance
+                    end_position = sequence
+        finally:
+            view.release()
+        self._positions = count(end_position)
+
+    def _all_stripes(self):
+        """Hold every stripe lock: no posting runs until ``_release_stripes``."""
+        for lock in self.stripes:
+            lock.acquire()
+
+    def _release_stripes(self):
+        for lock in reversed(self.stripes):
+            lock.release()
+
+    def _peek_position(self):
+        """Next log position, without using it. Needs ``_all_stripes``."""
+        position = next(self._positions)
+        self._positions = count(position)
+        return position
+
+    # -- snapshots ------------------------------------------------------
+
+    def _load_snapshot(self):
+        """Load balances from the snapshot. Returns the log position it covers."""
+        path = os.path.join(self.directory, SNAPSHOT_NAME)
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as f:
+            magic, position, count = SNAPSHOT_HEADER.unpack(f.read(SNAPSHOT_HEADER.size))
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a ledger snapshot")
+            accounts, balances = array("q"), array("q")
+            accounts.fromfile(f, count)
+            balances.fromfile(f, count)
+        self.balances = dict(zip(accounts, balances))
+        return position
+
+    def snapshot(self):
+        """
+        Write all balances and the current log position to disk.
+
+        Every stripe lock is held while the balances are copied, so the
+        snapshot is a consistent cut; the file is written afterwards.
+        """
+        self._all_stripes()
+        try:
+            position = self._peek_position()
+            accounts = array("q", self.balances.keys())
+            balances = array("q", self.balances.values())
+        finally:
+            self._release_stripes()
+
+        self._map.flush()  # The log up to ``position`` must be on disk first
+        path = os.path.join(self.directory, SNAPSHOT_NAME)
+        tmp = f"{path}.tmp{threading.get_ident()}"
+        with open(tmp, "wb") as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, position, len(accounts)))
+            accounts.tofile(f)
+            balances.tofile(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return position
+
+    # -- postings -------------------------------------------------------
+    #
+    # Every value is checked against the record layout before a log
+    # position is taken, so ``pack_into`` cannot fail and leave an unwritten
+    # slot; the balance is only changed once the record is written.
+
+    @staticmethod
+    def _check_account(account):
+        if not isinstance(account, int):
+            raise TypeError(f"Account number must be an int, not {type(account).__name__}")
+        if not 0 <= account <= MAX_ACCOUNT:
+            raise ValueError(f"Account number must be between 0 and {MAX_ACCOUNT}: {account}")
+
+    @staticmethod
+    def _check_cents(value, what):
+        if not isinstance(value, int):
+            raise TypeError(f"{what} must be whole cents (int), not {type(value).__name__}")
+        if not MIN_CENTS <= value <= MAX_CENTS:
+            raise ValueError(f"{what} does not fit in 64 bits: {value}")
+
+    def open_account(self, account, balance=0):
+        """Create an account with an opening balance (cents)."""
+        self._check_account(account)
+        self._check_cents(balance, "Balance")
+        with self.stripes[account % len(self.stripes)]:
+            if account in self.balances:
+                raise ValueError(f"Account {account} already exists")
+            self._append(account, OPEN, balance, balance)
+            self.balances[account] = balance
+
+    def balance(self, account):
+        """Current balance of an account (cents)."""
+        return self.balances[account]
+
+    def deposit(self, account, amount):
+        """Add ``amount`` cents. Returns the new balance."""
+        self._check_account(account)
+        self._check_cents(amount, "Amount")
+        if amount <= 0:
+            raise ValueError("Amount must be positive")
+        with self.stripes[account % len(self.stripes)]:
+            balance = self.balances[account] + amount
+            self._check_cents(balance, "Balance")
+            position = self._append(account, DEPOSIT, amount, balance)
+            self.balances[account] = balance
+        self._maybe_snapshot(position)
+        return balance
+
+    def withdraw(self, account, amount):
+        """Take ``amount`` cents out. Returns the new balance."""
+        self._check_account(account)
+        self._check_cents(amount, "Amount")
+        if amount <= 0:
+            raise ValueError("Amount must be positive")
+        with self.stripes[account % len(self.stripes)]:
+            balance = self.balances[account]
+            if amount > balance:
+                raise InsufficientFunds(f"Insufficient funds. Balance: {balance}")
+            balance -= amount
+            position = self._append(account, WITHDRAW, amount, balance)
+            self.balances[account] = balance
+        self._maybe_snapshot(position)
+        return balance
+
+    def _maybe_snapshot(self, position):
+        if self.snapshot_every and (position + 1) % self.snapshot_every == 0:
+            self.snapshot()
+
+    def __len__(self):
+        """Number of records in the log (briefly holds every stripe lock)."""
+        self._all_stripes()
+        try:
+            return self._peek_position()
+        finally:
+            self._release_stripes()
+
+    def flush(self):
+        """Write the mapped log pages to disk."""
+        self._map.flush()
+
+    def close(self):
+        """Flush and release the log file."""
+        if self._file is None:
+            return
+        self._map.flush()
+        for mapped in self._maps:
+            mapped.close()
+        # Drop the unused tail that was reserved for growth
+        self._file.truncate(self._peek_position() * RECORD.size)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def replay_benchmark(directory, postings=1_000_000, accounts=10_000, threads=4, seed=0):
+    """
+    Post random deposits and withdrawals from several threads.
+
+    Returns:
+        dict: postings, rejected, seconds, per_second and latency
+              percentiles (p50, p99, p999) in microseconds
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    work = [(rng.randrange(accounts), rng.random() < 0.5, rng.randint(1, 500_00))
+            for _ in range(postings)]
+    per_thread = [work[i::threads] for i in range(threads)]
+    latencies = [array("q") for _ in range(threads)]
+    rejected = [0] * threads
+
+    with Ledger.open(directory) as ledger:
+        for account in range(accounts):
+            if account not in ledger.balances:
+                ledger.open_account(account, 1000_00)
+
+        def run(index):
+            clock = time.perf_counter_ns
+            record = latencies[index].append
+            deposit, withdraw = ledger.deposit, ledger.withdraw
+            for account, is_deposit, amount in per_thread[index]:
+                start = clock()
+                try:
+                    (deposit if is_deposit else withdraw)(account, amount)
+                except InsufficientFunds:
+                    rejected[index] += 1
+                record(clock() - start)
+
+        workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        seconds = time.perf_counter() - start
+        ledger.snapshot()
+
+    merged = sorted(latency for part in latencies for latency in part)
+
+    def percentile(fraction):
+        return merged[min(len(merged) - 1, int(fraction * len(merged)))] / 1000 if merged else 0.0
+
+    return {
+        "postings": postings,
+        "rejected": sum(rejected),
+        "seconds": seconds,
+        "per_second": postings / seconds if seconds else 0.0,
+        "p50_us": percentile(0.50),
+        "p99_us": percentile(0.99),
+        "p999_us": percentile(0.999),
+    }
+
+
+def main(argv=None):
+    import argparse
+    import tempfile
+    import time
+
+    parser = argparse.ArgumentParser(description="Ledger replay benchmark.")
+    parser.add_argument("--postings", type=int, default=1_000_000)
+    parser.add_argument("--accounts", type=int, default=10_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--dir", help="ledger folder (default: a temporary one)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.dir or tmp
+        result = replay_benchmark(directory, args.postings, args.accounts, args.threads)
+        print(f"{result['postings']:,} postings on {args.threads} threads in {result['seconds']:.2f}s "
+              f"({result['per_second']:,.0f}/s, {result['rejected']:,} rejected)")
+        print(f"latency p50 {result['p50_us']:.1f} us  p99 {result['p99_us']:.1f} us  "
+              f"p999 {result['p999_us']:.1f} us")
+
+        start = time.perf_counter()
+        with Ledger.open(directory) as ledger:
+            print(f"reopened {len(ledger.balances):,} accounts, {len(ledger):,} log records "
+                  f"in {(time.perf_counter() - start) * 1000:.1f} ms (from snapshot)")
+
+
+if __name__ == "__main__":
+    main()
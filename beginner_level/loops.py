@@ -0,0 +1,17 @@
+"""
+LOOP HELPERS
+============
+
+Reusable functions from ``1-beginner-level/03-loops``, taken from the
+lesson files themselves (see ``_lessons``). Run this file directly to see
+the examples.
+"""
+
+from ._lessons import define
+
+define(globals(), "03-loops/03_break_continue.py", "is_prime")
+
+
+if __name__ == "__main__":
+    print("Prime numbers from 1 to 30:")
+    print([num for num in range(1, 31) if is_prime(num)])
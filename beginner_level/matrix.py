@@ -0,0 +1,312 @@
+"""
+ARRAY-BACKED MATRIX
+===================
+
+The MATRIX OPERATIONS section of 04_nested_loops.py adds and transposes
+lists of lists with ``row.append`` inside two ``range(len(...))`` loops:
+one Python-level step and one float object per element.
+
+``Matrix`` keeps all elements in one flat buffer (``array('d')``, or a NumPy
+array) and finds element (i, j) at ``offset + i * row_stride + j * col_stride``:
+- ``T`` is a view: same buffer, rows and columns and strides swapped, so a
+  transpose costs nothing until the data is needed
+- ``copy()`` materialises a view into a fresh row-major buffer tile by tile
+  (256 x 256 by default), so reads and writes stay close in memory
+- ``+ - * /`` (elementwise, or with a number) run a whole buffer at a time
+  with ``map`` over ``operator`` functions
+- ``@`` multiplies matrices; with NumPy every matrix is handed over without
+  copying (``as_numpy`` wraps the same buffer) and ``numpy.matmul`` does the
+  work
+
+Run ``python -m beginner_level.matrix --sizes 256 1024 4096`` to compare
+with the nested-loop versions.
+
+Example:
+    m = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    m.T.to_rows()          # [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]
+    (m + m).to_rows()      # [[2.0, 4.0, 6.0], [8.0, 10.0, 12.0]]
+"""
+
+import operator
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+BLOCK = 256  # Tile edge for copy(); larger tiles mean fewer Python-level slice steps
+
+
+class Matrix:
+    """
+    Dense matrix of floats in a flat buffer with row and column strides.
+
+    Args:
+        rows, cols (int): Shape
+        data: Flat buffer (``array('d')`` or 1-D float64 NumPy array);
+              zeros when omitted
+        offset, row_stride, col_stride (int): Layout inside ``data``
+                                              (default: row-major)
+    """
+
+    use_numpy = np is not None  # Set to False to force the pure-Python code
+
+    def __init__(self, rows, cols, data=None, offset=0, row_stride=None, col_stride=1):
+        self.rows = rows
+        self.cols = cols
+        self.data = array("d", bytes(8 * rows * cols)) if data is None else data
+        self.offset = offset
+        self.row_stride = cols if row_stride is None else row_stride
+        self.col_stride = col_stride
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build from a list of lists (like ``matrix1`` in the lesson)."""
+        cols = len(rows[0]) if rows else 0
+        if any(len(row) != cols for row in rows):
+            raise ValueError("all rows must have the same length")
+        data = array("d")
+        for row in rows:
+            data.extend(row)
+        return cls(len(rows), cols, data)
+
+    @classmethod
+    def identity(cls, n):
+        """n x n identity matrix."""
+        matrix = cls(n, n)
+        matrix.data[::n + 1] = array("d", repeat(1.0, n))
+        return matrix
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    @property
+    def is_contiguous(self):
+        """True when the elements are the whole buffer in row-major order."""
+        return (self.offset == 0 and self.row_stride == self.cols and self.col_stride == 1
+                and len(self.data) == self.rows * self.cols)
+
+    def __getitem__(self, index):
+        i, j = index
+        return self.data[self.offset + i * self.row_stride + j * self.col_stride]
+
+    def __setitem__(self, index, value):
+        i, j = index
+        self.data[self.offset + i * self.row_stride + j * self.col_stride] = value
+
+    def __repr__(self):
+        return f"Matrix({self.rows}x{self.cols})"
+
+    # -- views and copies -----------------------------------------------
+
+    @property
+    def T(self):
+        """Transpose as a view of the same buffer (no copy)."""
+        return Matrix(self.cols, self.rows, self.data, self.offset, self.col_stride, self.row_stride)
+
+    def row(self, i):
+        """Row i as an ``array('d')`` (or NumPy) slice."""
+        start = self.offset + i * self.row_stride
+        return self.data[start:start + self.cols * self.col_stride:self.col_stride]
+
+    def copy(self, block=BLOCK):
+        """
+        Contiguous row-major copy, materialised tile by tile.
+
+        Each tile moves ``block`` x ``block`` elements with strided slice
+        assignments, so a transposed view is read a few cache lines at a
+        time instead of jumping a whole row ahead for every element.
+        """
+        rows, cols = self.rows, self.cols
+        if self.is_contiguous:
+            # array slices copy, NumPy slices are views
+            data = self.data[:] if isinstance(self.data, array) else self.data.copy()
+            return Matrix(rows, cols, data)
+        if isinstance(self.data, array):
+            out = array("d", bytes(8 * rows * cols))
+        else:
+            out = np.empty(rows * cols)
+        src, offset = self.data, self.offset
+        rs, cs = self.row_stride, self.col_stride
+        for r0 in range(0, rows, block):
+            r1 = min(r0 + block, rows)
+            for c0 in range(0, cols, block):
+                width = min(block, cols - c0)
+                for i in range(r0, r1):
+                    start = offset + i * rs + c0 * cs
+                    out[i * cols + c0:i * cols + c0 + width] = src[start:start + width * cs:cs]
+        return Matrix(rows, cols, out)
+
+    def contiguous(self):
+        """``self`` if already contiguous, else ``copy()``."""
+        return self if self.is_contiguous else self.copy()
+
+    def to_rows(self):
+        """Back to a list of lists."""
+        return [self.row(i).tolist() for i in range(self.rows)]
+
+    def as_numpy(self):
+        """NumPy view of the same buffer (no copy; requires NumPy)."""
+        if np is None:
+            raise ImportError("NumPy is not installed")
+        base = np.frombuffer(self.data, dtype=np.float64) if isinstance(self.data, array) else self.data
+        item = base.itemsize
+        return np.lib.stride_tricks.as_strided(
+            base[self.offset:], shape=(self.rows, self.cols),
+            strides=(self.row_stride * item, self.col_stride * item))
+
+    @classmethod
+    def from_numpy(cls, values):
+        """Wrap a 2-D NumPy array (copied only if not C-contiguous float64)."""
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        return cls(values.shape[0], values.shape[1], values.reshape(-1))
+
+    # -- arithmetic -----------------------------------------------------
+
+    def _elementwise(self, other, func):
+        if self.use_numpy and np is not None:
+            right = other.as_numpy() if isinstance(other, Matrix) else other
+            if isinstance(other, Matrix) and other.shape != self.shape:
+                raise ValueError(f"shape mismatch: {self.shape} vs {other.shape}")
+            return Matrix.from_numpy(func(self.as_numpy(), right))
+
+        left = self.contiguous().data
+        if not isinstance(left, array):
+            left = array("d", left.tobytes())
+        if isinstance(other, Matrix):
+            if other.shape != self.shape:
+                raise ValueError(f"shape mismatch: {self.shape} vs {other.shape}")
+            right = other.contiguous().data
+        else:
+            right = repeat(float(other), len(left))
+        return Matrix(self.rows, self.cols, array("d", map(func, left, right)))
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
+
+    def __sub__(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def __mul__(self, other):
+        """Elementwise product (use ``@`` for matrix multiplication)."""
+        return self._elementwise(other, operator.mul)
+
+    def __truediv__(self, other):
+        return self._elementwise(other, operator.truediv)
+
+    def __rsub__(self, other):
+        return self._elementwise(other, _reversed(operator.sub))
+
+    def __rtruediv__(self, other):
+        return self._elementwise(other, _reversed(operator.truediv))
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return self._elementwise(-1.0, operator.mul)
+
+    def __matmul__(self, other):
+        if self.cols != other.rows:
+            raise ValueError(f"shape mismatch: {self.shape} @ {other.shape}")
+        if self.use_numpy and np is not None:
+            return Matrix.from_numpy(np.matmul(self.as_numpy(), other.as_numpy()))
+
+        # Row of A times column of B; B is transposed once so its columns are
+        # contiguous rows, then each dot product is one ``sum(map(mul, ...))``
+        left = self.contiguous()
+        right = other.T.copy()
+        mul = operator.mul
+        columns = [right.row(j) for j in range(right.rows)]
+        out = array("d")
+        for i in range(left.rows):
+            row = left.row(i)
+            out.extend([sum(map(mul, row, column)) for column in columns])
+        return Matrix(self.rows, other.cols, out)
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and self.to_rows() == other.to_rows()
+
+    __hash__ = None
+
+
+def _reversed(func):
+    """``func`` with its operands swapped, for ``number - matrix`` etc."""
+    def swapped(a, b):
+        return func(b, a)
+    return swapped
+
+
+def _nested_add(a, b):
+    """Matrix addition as in 04_nested_loops.py."""
+    result = []
+    for i in range(len(a)):
+        row = []
+        for j in range(len(a[i])):
+            row.append(a[i][j] + b[i][j])
+        result.append(row)
+    return result
+
+
+def _nested_transpose(matrix):
+    """Matrix transpose as in 04_nested_loops.py."""
+    transposed = []
+    for j in range(len(matrix[0])):
+        row = []
+        for i in range(len(matrix)):
+            row.append(matrix[i][j])
+        transposed.append(row)
+    return transposed
+
+
+def main(argv=None):
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="Matrix vs nested-loop benchmark.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 1024, 2048, 4096])
+    parser.add_argument("--matmul-limit", type=int, default=256,
+                        help="largest size for the pure-Python matmul")
+    args = parser.parse_args(argv)
+
+    def timed(func):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    print(f"{'size':>6} {'operation':<10} {'nested':>9} {'array':>9} {'numpy':>9}")
+    for n in args.sizes:
+        rows = [[random.random() for _ in range(n)] for _ in range(n)]
+        a = Matrix.from_rows(rows)
+        b = a.T.copy()
+        results = {}
+
+        results["add"] = [timed(lambda: _nested_add(rows, rows))]
+        results["transpose"] = [timed(lambda: _nested_transpose(rows))]
+        results["matmul"] = [None]
+        for use_numpy in (False, True):
+            if use_numpy and np is None:
+                for times in results.values():
+                    times.append(None)
+                continue
+            Matrix.use_numpy = use_numpy
+            results["add"].append(timed(lambda: a + b))
+            results["transpose"].append(timed(lambda: a.T.copy() if not use_numpy
+                                              else np.ascontiguousarray(a.as_numpy().T)))
+            results["matmul"].append(timed(lambda: a @ b) if use_numpy or n <= args.matmul_limit
+                                     else None)
+        Matrix.use_numpy = np is not None
+
+        for operation, times in results.items():
+            cells = " ".join(f"{t:8.3f}s" if t is not None else f"{'-':>9}" for t in times)
+            print(f"{n:>6} {operation:<10} {cells}")
+
+
+if __name__ == "__main__":
+    main()
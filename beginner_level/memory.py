@@ -0,0 +1,168 @@
+"""
+DEEP MEMORY ACCOUNTING
+======================
+
+``sys.getsizeof`` only measures the container itself, not the objects it
+points to. A list of 1,000 strings "costs" 8 bytes per slot according to
+``getsizeof``, but every string is a separate object with its own size.
+
+This module gives two better answers:
+- ``deep_getsizeof``: walk the object graph and add up every object once
+- ``traced_size``: ask ``tracemalloc`` how many bytes were really allocated
+  while building a structure (snapshot before/after, then diff)
+
+Run ``python -m beginner_level.memory`` for a per-element comparison of
+list, tuple, set, dict, ``array.array`` and ``__slots__`` records.
+"""
+
+import argparse
+import array
+import gc
+import sys
+import tracemalloc
+from collections import deque
+
+
+def deep_getsizeof(obj, seen=None):
+    """
+    Total size in bytes of ``obj`` and everything it references.
+
+    Shared objects (e.g. the same string in two lists) are only counted once.
+    Instance ``__dict__``s share their keys between objects of one class, so
+    for plain class instances ``traced_size`` gives the more accurate number.
+    Pass the same ``seen`` set to several calls to measure them as a group.
+
+    Args:
+        obj: Any Python object
+        seen (set): ids of objects already counted
+
+    Returns:
+        int: Size in bytes
+    """
+    if seen is None:
+        seen = set()
+
+    total = 0
+    pending = deque([obj])
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        # Types and modules are shared by everything, don't walk into them
+        if isinstance(current, (type, type(sys))):
+            continue
+
+        if isinstance(current, (str, bytes, bytearray, int, float, complex, bool,
+                                range, array.array)):
+            continue  # No references to other Python objects
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            pending.extend(current)
+
+        if hasattr(current, "__dict__"):
+            pending.append(current.__dict__)
+        for cls in type(current).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                if hasattr(current, name):
+                    pending.append(getattr(current, name))
+
+    return total
+
+
+def traced_size(factory):
+    """
+    Bytes allocated by ``factory()`` and still alive afterwards.
+
+    Uses a ``tracemalloc`` snapshot before and after the call, so it sees
+    every allocation, including ones ``deep_getsizeof`` cannot reach.
+
+    Returns:
+        tuple: (result of factory(), allocated bytes)
+    """
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = factory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    return result, sum(stat.size_diff for stat in stats)
+
+
+class Record:
+    """Plain class, attributes stored in a per-instance __dict__."""
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+
+class SlotRecord:
+    """Same record with __slots__: no per-instance __dict__."""
+
+    __slots__ = ("key", "value")
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+
+# name -> function building a structure with n elements
+STRUCTURES = {
+    "list[int]": lambda n: list(range(n)),
+    "tuple[int]": lambda n: tuple(range(n)),
+    "set[int]": lambda n: set(range(n)),
+    "dict[int,int]": lambda n: {i: i for i in range(n)},
+    "array('q')": lambda n: array.array("q", range(n)),
+    "list[str]": lambda n: [f"item-{i}" for i in range(n)],
+    "list[dict]": lambda n: [{"key": i, "value": i} for i in range(n)],
+    "list[Record]": lambda n: [Record(i, i) for i in range(n)],
+    "list[SlotRecord]": lambda n: [SlotRecord(i, i) for i in range(n)],
+}
+
+
+def compare_memory(n=100_000, structures=STRUCTURES):
+    """
+    Measure every structure with n elements.
+
+    Returns:
+        list: (name, shallow bytes, deep bytes, traced bytes) tuples
+    """
+    rows = []
+    for name, build in structures.items():
+        data, traced = traced_size(lambda: build(n))
+        rows.append((name, sys.getsizeof(data), deep_getsizeof(data), traced))
+        del data
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare real memory use of containers.")
+    parser.add_argument("-n", "--elements", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    if args.elements < 1:
+        parser.error("--elements must be at least 1 (sizes are shown per element)")
+
+    n = args.elements
+    print(f"Memory for {n:,} elements (bytes per element):")
+    print(f"{'Structure':<18} {'getsizeof':>10} {'deep':>10} {'tracemalloc':>12}")
+    print("-" * 53)
+    for name, shallow, deep, traced in compare_memory(n):
+        print(f"{name:<18} {shallow / n:>10.1f} {deep / n:>10.1f} {traced / n:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+PALINDROMIC SUBSTRINGS
+======================
+
+The "Zor Soru" in 02_string_operations.py checks every slice ``s[i:j]`` and
+reverses it: O(n^3) time, and a new string for every candidate.
+
+Two classic linear-time algorithms do much better:
+- Manacher's algorithm: the longest palindrome and the number of palindromic
+  substrings (counting repeats), O(n)
+- Palindromic tree (eertree): every *distinct* palindrome, O(n) nodes.
+  Characters are added one at a time, so text can be streamed in chunks.
+
+Example:
+    distinct_palindromes("ababa")  # ['a', 'aba', 'ababa', 'b', 'bab']
+    longest_palindrome("ababa")    # 'ababa'
+"""
+
+
+def _manacher(s):
+    """
+    Palindrome radii for every center of ``s``.
+
+    Returns:
+        tuple: (odd, even) lists. odd[i] = number of odd palindromes centered
+               at i; even[i] = number of even palindromes centered between
+               i-1 and i.
+    """
+    n = len(s)
+
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+
+    return odd, even
+
+
+def longest_palindrome(s):
+    """Longest palindromic substring of ``s`` (the first one if tied)."""
+    if not s:
+        return ""
+    odd, even = _manacher(s)
+    best_start, best_length = 0, 1
+    for i in range(len(s)):
+        length = 2 * odd[i] - 1
+        if length > best_length:
+            best_start, best_length = i - odd[i] + 1, length
+        length = 2 * even[i]
+        if length > best_length:
+            best_start, best_length = i - even[i], length
+    return s[best_start:best_start + best_length]
+
+
+def count_palindromic_substrings(s):
+    """Number of palindromic substrings, counting every position separately."""
+    odd, even = _manacher(s)
+    return sum(odd) + sum(even)
+
+
+class PalindromeTree:
+    """
+    Palindromic tree (eertree) built one character at a time.
+
+    Every node is one distinct palindrome. Node 0 is the imaginary root of
+    length -1, node 1 is the empty string. Nodes are stored in parallel lists
+    instead of one object per node to keep memory small.
+
+    Example:
+        tree = PalindromeTree()
+        tree.extend("abab")
+        tree.extend("a")       # Text can arrive in pieces
+        len(tree)              # 5 distinct palindromes
+    """
+
+    def __init__(self):
+        self.text = []             # Characters seen so far
+        self.length = [-1, 0]      # Palindrome length per node
+        self.link = [0, 0]         # Longest proper palindromic suffix
+        self.edges = [{}, {}]      # char -> child node
+        self.end = [-1, -1]        # End index of first occurrence
+        self.count = [0, 0]        # Occurrences ending as longest suffix
+        self.last = 1              # Node of the longest palindromic suffix
+
+    def _suffix_with(self, node, pos, ch):
+        """Follow suffix links until text[pos - len - 1] == ch."""
+        text, length, link = self.text, self.length, self.link
+        while True:
+            start = pos - length[node] - 1
+            if start >= 0 and text[start] == ch:
+                return node
+            node = link[node]
+
+    def add(self, ch):
+        """Append one character. Returns True if a new palindrome appeared."""
+        pos = len(self.text)
+        self.text.append(ch)
+
+        parent = self._suffix_with(self.last, pos, ch)
+        child = self.edges[parent].get(ch)
+        if child is not None:
+            self.last = child
+            self.count[child] += 1
+            return False
+
+        node = len(self.length)
+        self.length.append(self.length[parent] + 2)
+        self.end.append(pos)
+        self.edges.append({})
+        self.count.append(1)
+        if self.length[node] == 1:
+            self.link.append(1)
+        else:
+            suffix = self._suffix_with(self.link[parent], pos, ch)
+            self.link.append(self.edges[suffix][ch])
+        self.edges[parent][ch] = node
+        self.last = node
+        return True
+
+    def extend(self, chars):
+        """Append every character of ``chars`` (any iterable of characters)."""
+        for ch in chars:
+            self.add(ch)
+
+    def __len__(self):
+        """Number of distinct non-empty palindromes."""
+        return len(self.length) - 2
+
+    def palindromes(self):
+        """Yield every distinct palindrome (in order of first appearance)."""
+        text = self.text
+        for node in range(2, len(self.length)):
+            end = self.end[node]
+            yield "".join(text[end - self.length[node] + 1:end + 1])
+
+    def longest(self):
+        """Longest palindrome seen so far."""
+        if len(self) == 0:
+            return ""
+        node = max(range(2, len(self.length)), key=self.length.__getitem__)
+        end = self.end[node]
+        return "".join(self.text[end - self.length[node] + 1:end + 1])
+
+    def occurrences(self):
+        """
+        Occurrence count of every distinct palindrome.
+
+        Returns:
+            dict: palindrome -> number of times it appears in the text
+        """
+        totals = self.count[:]
+        # Children always have a larger index than their suffix link
+        for node in range(len(self.length) - 1, 1, -1):
+            totals[self.link[node]] += totals[node]
+        return dict(zip(self.palindromes(), totals[2:]))
+
+
+def distinct_palindromes(s):
+    """Sorted list of all distinct palindromic substrings of ``s``."""
+    tree = PalindromeTree()
+    tree.extend(s)
+    return sorted(tree.palindromes())
+
+
+def palindrome_tree_from_file(path, chunk_size=1 << 16, encoding="utf-8"):
+    """
+    Build a PalindromeTree from a text file without reading it all at once.
+
+    Args:
+        path (str): File to read
+        chunk_size (int): Characters read per chunk
+        encoding (str): File encoding
+
+    Returns:
+        PalindromeTree: Tree over the whole file contents
+    """
+    tree = PalindromeTree()
+    with open(path, encoding=encoding) as f:
+        while chunk := f.read(chunk_size):
+            tree.extend(chunk)
+    return tree
+
+
+if __name__ == "__main__":
+    s = "ababa".lower().replace(" ", "")
+    print(f"Distinct palindromes: {distinct_palindromes(s)}")
+    print(f"Longest: {longest_palindrome(s)}")
+    print(f"All palindromic substrings: {count_palindromic_substrings(s)}")
@@ -0,0 +1,179 @@
+"""
+PASSWORD STRENGTH FEATURES
+==========================
+
+``is_valid_password`` (01_function_definition.py) scans a password three
+times: ``len()``, then ``any(char.isdigit() ...)``, then
+``any(char.isupper() ...)``. ``check_password_strength``
+(03_comparison_operators.py) looks at the length again.
+
+Here every character is classified once:
+- ``str.translate`` turns the password into a string of class letters
+  (U upper, L lower, D digit, S space, Y symbol) in one C-level pass
+- the class of a character comes from the same ``str`` predicates the
+  lesson uses (``isupper``, ``islower``, ``isdigit``, ``isspace``) and is
+  cached, so each distinct character is only classified once
+- ``str.count`` on that short class string gives every count; the result is
+  a ``PasswordFeatures`` tuple
+
+``audit`` and ``audit_file`` score big password lists in chunks, optionally
+spread over a ``ProcessPoolExecutor``. Only a few chunks per worker are in
+flight at a time, so memory stays bounded however long the list is.
+"""
+
+import os
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+PasswordFeatures = namedtuple("PasswordFeatures", [
+    "length", "unique", "upper", "lower", "digit", "space", "symbol", "non_ascii",
+])
+
+
+class _ClassTable(dict):
+    """
+    Code point -> one-letter class, for ``str.translate``.
+
+    Filled on first use of each character, so every distinct character is
+    classified only once. Letters without case (e.g. CJK) count as symbols.
+    """
+
+    def __missing__(self, code_point):
+        ch = chr(code_point)
+        if ch.isupper():
+            cls = "U"
+        elif ch.islower():
+            cls = "L"
+        elif ch.isdigit():
+            cls = "D"
+        elif ch.isspace():
+            cls = "S"
+        else:
+            cls = "Y"
+        self[code_point] = cls
+        return cls
+
+
+_CLASSES = _ClassTable()
+
+
+def features(password):
+    """All character counts of one password."""
+    classes = password.translate(_CLASSES)
+    count = classes.count
+    non_ascii = 0 if password.isascii() else len(password) - len(password.encode("ascii", "ignore"))
+    return PasswordFeatures(len(password), len(set(password)),
+                            count("U"), count("L"), count("D"), count("S"), count("Y"),
+                            non_ascii)
+
+
+def is_valid(f):
+    """``is_valid_password`` rule: 8+ chars with a digit and an uppercase letter."""
+    return f.length >= 8 and f.digit > 0 and f.upper > 0
+
+
+def strength(f):
+    """``check_password_strength`` rule: Weak / Medium / Strong by length."""
+    if f.length < 6:
+        return "Weak"
+    elif f.length < 10:
+        return "Medium"
+    return "Strong"
+
+
+def score(f):
+    """0-6 score: length 8+, length 12+, and each character class used."""
+    return ((f.length >= 8) + (f.length >= 12) + (f.upper > 0) + (f.lower > 0)
+            + (f.digit > 0) + (f.symbol > 0 or f.space > 0))
+
+
+def _features_chunk(passwords):
+    return [features(password) for password in passwords]
+
+
+def _chunks(items, size):
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _map_bounded(pool, func, chunks, window):
+    """Like ``pool.map``, but only ``window`` chunks are submitted at a time."""
+    pending = deque()
+    for chunk in chunks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(func, chunk))
+    while pending:
+        yield pending.popleft().result()
+
+
+def audit(passwords, workers=1, chunk_size=50_000):
+    """
+    Features of many passwords, in input order.
+
+    Args:
+        passwords: Iterable of passwords
+        workers (int): Processes to use (None = one per CPU core)
+        chunk_size (int): Passwords sent to a worker at a time
+
+    Yields:
+        PasswordFeatures
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for password in passwords:
+            yield features(password)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in _map_bounded(pool, _features_chunk, _chunks(passwords, chunk_size), 2 * workers):
+            yield from chunk
+
+
+def summarise(passwords):
+    """
+    Counts over many passwords.
+
+    Returns:
+        dict: total, valid (``is_valid``), strength counts and score counts
+    """
+    summary = {"total": 0, "valid": 0, "strength": Counter(), "score": Counter()}
+    for password in passwords:
+        f = features(password)
+        summary["total"] += 1
+        summary["valid"] += is_valid(f)
+        summary["strength"][strength(f)] += 1
+        summary["score"][score(f)] += 1
+    return summary
+
+
+def audit_file(path, workers=1, encoding="utf-8", chunk_size=50_000):
+    """
+    Summarise a newline-delimited password list (see ``summarise``).
+
+    With several workers each process summarises whole chunks, so only the
+    small summaries travel back, not one result per password.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with open(path, encoding=encoding, errors="replace") as f:
+        passwords = (line.rstrip("\r\n") for line in f)
+        if workers <= 1:
+            return summarise(passwords)
+
+        summary = {"total": 0, "valid": 0, "strength": Counter(), "score": Counter()}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in _map_bounded(pool, summarise, _chunks(passwords, chunk_size), 2 * workers):
+                summary["total"] += part["total"]
+                summary["valid"] += part["valid"]
+                summary["strength"].update(part["strength"])
+                summary["score"].update(part["score"])
+    return summary
+
+
+if __name__ == "__main__":
+    for password in ["abc", "pass123", "Pass1234", "myStrongPass2024", "Şifre 2024!"]:
+        f = features(password)
+        print(f"{password!r:<20} {strength(f):<7} valid={is_valid(f)!s:<5} score={score(f)} {f}")
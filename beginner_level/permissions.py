@@ -0,0 +1,188 @@
+"""
+BITMASK PERMISSIONS
+===================
+
+``check_access`` (02_logical_operators.py) compares role strings and checks
+``resource_level in ["basic", "intermediate"]`` on every call.
+``has_permission`` (04_sets.py) keeps a set of permission strings per user.
+
+Here every permission gets one bit of an integer:
+
+    read = 0b001, write = 0b010, delete = 0b100
+    editor = read | write = 0b011
+
+- a user's grants are one int instead of a set of strings
+- role hierarchies ("admin has everything a manager has") are merged into
+  one mask when the role is defined, not on every check
+- a check is one ``&`` and one ``==``
+- with NumPy, "which of these N users may do X" is one vectorised ``&``
+  over an array of masks
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+class Permissions:
+    """
+    Registry of permission bits and role masks.
+
+    Example:
+        perms = Permissions(["read", "write", "delete"])
+        perms.add_role("viewer", ["read"])
+        perms.add_role("editor", ["write"], inherits=["viewer"])
+        user = perms.role_mask("editor")
+        perms.has(user, "write")      # True
+        perms.has(user, "delete")     # False
+    """
+
+    def __init__(self, permissions=()):
+        self.bits = {}    # permission name -> single-bit mask
+        self.roles = {}   # role name -> combined mask
+        for name in permissions:
+            self.bit(name)
+
+    def bit(self, name):
+        """Mask of one permission; new names get the next free bit."""
+        bit = self.bits.get(name)
+        if bit is None:
+            bit = self.bits[name] = 1 << len(self.bits)
+        return bit
+
+    def mask(self, names):
+        """Combined mask of several permission names."""
+        mask = 0
+        for name in names:
+            mask |= self.bit(name)
+        return mask
+
+    def names(self, mask):
+        """Permission names contained in a mask."""
+        return [name for name, bit in self.bits.items() if mask & bit]
+
+    @property
+    def all(self):
+        """Mask with every known permission."""
+        return (1 << len(self.bits)) - 1
+
+    def add_role(self, role, permissions=(), inherits=()):
+        """
+        Define a role. Inherited roles must already exist.
+
+        Returns:
+            int: The role's full mask (own + inherited permissions)
+        """
+        mask = self.mask(permissions)
+        for parent in inherits:
+            mask |= self.roles[parent]
+        self.roles[role] = mask
+        return mask
+
+    def role_mask(self, *roles):
+        """Combined mask of one or more roles (unknown roles give 0)."""
+        mask = 0
+        for role in roles:
+            mask |= self.roles.get(role, 0)
+        return mask
+
+    def required(self, required):
+        """
+        Turn a permission name, list of names or mask into a mask.
+
+        Checks never add bits: an unknown name gives None (nobody has it).
+        """
+        if isinstance(required, int):
+            return required
+        if isinstance(required, str):
+            return self.bits.get(required)
+        mask = 0
+        for name in required:
+            bit = self.bits.get(name)
+            if bit is None:
+                return None
+            mask |= bit
+        return mask
+
+    def has(self, granted, required):
+        """True if ``granted`` contains every bit of ``required``."""
+        required = self.required(required)
+        return required is not None and granted & required == required
+
+    def who_can(self, user_masks, required):
+        """
+        Indices of the users that have ``required``.
+
+        Args:
+            user_masks: Sequence of masks, or a NumPy uint64 array (see
+                        ``to_array``) for a vectorised check
+            required: Permission name(s) or mask
+
+        Returns:
+            Indices as a NumPy array (for array input) or a list
+        """
+        required = self.required(required)
+        if required is None:
+            return np.array([], dtype=np.intp) if np is not None and isinstance(user_masks, np.ndarray) else []
+        if np is not None and isinstance(user_masks, np.ndarray):
+            required = np.uint64(required)
+            return np.flatnonzero(user_masks & required == required)
+        return [i for i, mask in enumerate(user_masks) if mask & required == required]
+
+    def to_array(self, user_masks):
+        """Pack masks into a NumPy uint64 array (up to 64 permissions)."""
+        if np is None:
+            raise ImportError("NumPy is not installed")
+        if len(self.bits) > 64:
+            raise ValueError("More than 64 permissions do not fit in uint64")
+        return np.fromiter(user_masks, dtype=np.uint64)
+
+
+# Roles and resource levels from check_access (02_logical_operators.py).
+# "other" stands for any unknown resource level; only admins may access it.
+ACCESS = Permissions(["basic", "intermediate", "advanced", "other"])
+ACCESS.add_role("user", ["basic"])
+ACCESS.add_role("manager", ["intermediate"], inherits=["user"])
+ACCESS.add_role("admin", ["advanced", "other"], inherits=["manager"])
+
+_ROLE_MASKS = dict(ACCESS.roles)
+_RESOURCE_BITS = dict(ACCESS.bits)
+_OTHER = ACCESS.bits["other"]
+
+
+def check_access(user_role, is_authenticated, resource_level):
+    """Bitmask version of ``check_access`` from 02_logical_operators.py."""
+    if not is_authenticated:
+        return False
+    required = _RESOURCE_BITS.get(resource_level, _OTHER)
+    return _ROLE_MASKS.get(user_role, 0) & required != 0
+
+
+# Permission sets from 04_sets.py
+CONTENT = Permissions(["read", "write", "edit", "delete", "admin"])
+CONTENT.add_role("viewer", ["read"])
+CONTENT.add_role("editor", ["write", "edit"], inherits=["viewer"])
+CONTENT.add_role("admin", ["write", "delete", "admin"], inherits=["viewer"])
+
+
+def has_permission(user_mask, required_perm):
+    """Bitmask version of ``has_permission`` from 04_sets.py."""
+    return CONTENT.has(user_mask, required_perm)
+
+
+if __name__ == "__main__":
+    print(check_access("admin", True, "advanced"))     # True
+    print(check_access("manager", True, "advanced"))   # False
+    print(check_access("user", True, "basic"))         # True
+    print(check_access("user", False, "basic"))        # False
+
+    admin = CONTENT.role_mask("admin")
+    editor = CONTENT.role_mask("editor")
+    print(f"\nAdmin can 'delete': {has_permission(admin, 'delete')}")
+    print(f"Editor can 'delete': {has_permission(editor, 'delete')}")
+    print(f"Extra admin permissions: {CONTENT.names(admin & ~editor)}")
+    print(f"Common permissions: {CONTENT.names(admin & editor)}")
+
+    users = [admin, editor, CONTENT.role_mask("viewer")] * 3
+    print(f"\nUsers who can write: {CONTENT.who_can(users, 'write')}")
@@ -0,0 +1,169 @@
+"""
+ADAPTIVE PREDICATE CHAINS
+=========================
+
+02_logical_operators.py shows that ``and`` stops at the first False: in
+``cheap_check() and expensive_check()`` the expensive check only runs when
+the cheap one passes. So the order of checks matters. ``validate_user``
+(01_function_definition.py) and ``validate_registration`` still hard-code
+their order.
+
+``PredicateChain`` learns the order instead. For every check it counts calls
+and rejections and measures the time taken. Every ``reorder_every`` calls the
+checks are sorted by
+
+    average cost / rejection rate
+
+so cheap checks that reject often run first. The learned order and counters
+can be inspected with ``order`` and ``stats()``.
+"""
+
+import time
+
+from .functions import is_valid_email, is_valid_password
+
+
+class Predicate:
+    """One named check with its runtime counters."""
+
+    __slots__ = ("name", "func", "message", "calls", "rejections", "cost_ns")
+
+    def __init__(self, name, func, message):
+        self.name = name
+        self.func = func
+        self.message = message
+        self.calls = 0
+        self.rejections = 0
+        self.cost_ns = 0
+
+    @property
+    def rejection_rate(self):
+        return self.rejections / self.calls if self.calls else 0.0
+
+    @property
+    def mean_cost_ns(self):
+        return self.cost_ns / self.calls if self.calls else 0.0
+
+    def score(self):
+        """Lower runs earlier. Never-rejecting checks go last."""
+        if not self.calls:
+            return 0.0
+        return self.mean_cost_ns / max(self.rejection_rate, 1e-9)
+
+
+class PredicateChain:
+    """
+    Checks that all must pass, run in a learned order.
+
+    Example:
+        chain = PredicateChain()
+        chain.add("email", lambda email, pw: "@" in email, "Invalid email")
+        chain.add("password", lambda email, pw: len(pw) >= 8, "Password too short")
+        chain("user@example.com", "secret")   # (False, 'Password too short')
+
+    Args:
+        reorder_every (int): Calls between reorderings
+        learning (bool): Set to False to freeze the current order
+    """
+
+    def __init__(self, reorder_every=1000, learning=True):
+        self.predicates = []
+        self.reorder_every = reorder_every
+        self.learning = learning
+        self._until_reorder = reorder_every
+
+    def add(self, name, func, message=None):
+        """Append a check. ``func`` gets the chain's call arguments."""
+        self.predicates.append(Predicate(name, func, message or name))
+        return self
+
+    @property
+    def order(self):
+        """Names of the checks in the order they currently run."""
+        return [predicate.name for predicate in self.predicates]
+
+    def __call__(self, *args, **kwargs):
+        """
+        Run the checks until one fails.
+
+        Returns:
+            tuple: (True, None) or (False, message of the failing check)
+        """
+        if not self.learning:
+            for predicate in self.predicates:
+                if not predicate.func(*args, **kwargs):
+                    return False, predicate.message
+            return True, None
+
+        counter = time.perf_counter_ns
+        result = True, None
+        for predicate in self.predicates:
+            start = counter()
+            passed = predicate.func(*args, **kwargs)
+            predicate.cost_ns += counter() - start
+            predicate.calls += 1
+            if not passed:
+                predicate.rejections += 1
+                result = False, predicate.message
+                break
+
+        self._until_reorder -= 1
+        if self._until_reorder <= 0:
+            self.reorder()
+        return result
+
+    def check_all(self, *args, **kwargs):
+        """Run every check (no short-circuit) and return all failure messages."""
+        return [predicate.message for predicate in self.predicates
+                if not predicate.func(*args, **kwargs)]
+
+    def reorder(self):
+        """Sort the checks by cost / rejection rate now."""
+        self.predicates.sort(key=Predicate.score)
+        self._until_reorder = self.reorder_every
+
+    def stats(self):
+        """Counters per check, in the current order."""
+        return [{
+            "name": predicate.name,
+            "calls": predicate.calls,
+            "rejections": predicate.rejections,
+            "rejection_rate": predicate.rejection_rate,
+            "mean_cost_ns": predicate.mean_cost_ns,
+        } for predicate in self.predicates]
+
+
+def registration_chain(**options):
+    """Checks of ``validate_registration`` (02_logical_operators.py)."""
+    chain = PredicateChain(**options)
+    chain.add("email", lambda email, password, age, terms: bool(email) and "@" in email,
+              "Invalid email address")
+    chain.add("password", lambda email, password, age, terms: bool(password) and len(password) >= 8,
+              "Password must be at least 8 characters")
+    chain.add("age", lambda email, password, age, terms: 13 <= age <= 120,
+              "Age must be between 13 and 120")
+    chain.add("terms", lambda email, password, age, terms: bool(terms),
+              "You must accept terms and conditions")
+    return chain
+
+
+def user_chain(**options):
+    """Checks of ``validate_user`` (01_function_definition.py)."""
+    chain = PredicateChain(**options)
+    chain.add("email", lambda email, password: is_valid_email(email), "Invalid email format")
+    chain.add("password", lambda email, password: is_valid_password(password),
+              "Password must be 8+ chars with digit and uppercase")
+    return chain
+
+
+if __name__ == "__main__":
+    import random
+
+    chain = registration_chain(reorder_every=500)
+    print(f"Initial order: {chain.order}")
+    for _ in range(10_000):
+        chain("user@example.com", "long-password", 25, random.random() < 0.5)
+    print(f"Learned order: {chain.order}")
+    for row in chain.stats():
+        print(f"  {row['name']:<10} calls={row['calls']:>6} "
+              f"rejected={row['rejection_rate']:6.1%} cost={row['mean_cost_ns']:6.0f} ns")
@@ -0,0 +1,325 @@
+"""
+PRIME NUMBERS
+=============
+
+``is_prime`` (03_break_continue.py) does trial division up to sqrt(n) on
+every call, and the demo calls it once per number of a range. For ranges
+that repeats the same divisions over and over.
+
+This module has three tools instead:
+- a segmented sieve of Eratosthenes for ranges: odd numbers only, sieved a
+  segment at a time with ``bytearray`` slice assignment, and stored packed
+  (one bit per odd number, 62.5 MB for everything below 10^9); segments
+  can be spread over a ``ProcessPoolExecutor``
+- deterministic Miller-Rabin for single large values
+- ``PrimeTable``: a packed sieve saved to a file and opened with ``mmap``,
+  so many processes share one copy through the OS page cache
+
+Example:
+    table = PrimeTable.cached("primes.bin", 10**9, workers=None)
+    table.count()               # 50847534
+    12_345_679 in table          # bit lookup below the limit, Miller-Rabin above
+"""
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import compress
+from math import isqrt
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+SEGMENT_ODDS = 1 << 21       # Odd numbers per segment (4M numbers, 2 MB while sieving)
+MAGIC = b"PRIMEBIT"          # File header: magic + limit (8 bytes, little-endian)
+HEADER_SIZE = len(MAGIC) + 8
+
+# Bases that make Miller-Rabin exact below 3.3 * 10^24
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_ASCII = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def is_prime(n):
+    """
+    Miller-Rabin primality test.
+
+    Exact for n < 3.3 * 10^24; above that a composite passing all 13 bases
+    is theoretically possible but no such number is known.
+    """
+    if n < 2:
+        return False
+    for p in _WITNESSES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+@lru_cache(maxsize=8)
+def _base_primes(limit):
+    """Odd primes up to ``limit`` (simple sieve, used to sieve segments)."""
+    flags = bytearray([1]) * (limit + 1)
+    flags[:2] = b"\x00\x00"
+    for p in range(2, isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return tuple(p for p in compress(range(limit + 1), flags) if p > 2)
+
+
+def _pack(flags):
+    """One 0/1 byte per odd number -> one bit each (little bit order)."""
+    if np is not None:
+        return np.packbits(np.frombuffer(flags, dtype=np.uint8), bitorder="little").tobytes()
+    bits = int(flags.translate(_TO_ASCII)[::-1] or b"0", 2)
+    return bits.to_bytes(len(flags) // 8, "little")
+
+
+def _unpack(packed):
+    """Inverse of ``_pack``: a bytes object with one 0/1 byte per bit."""
+    if np is not None:
+        return np.unpackbits(np.frombuffer(packed, dtype=np.uint8), bitorder="little").tobytes()
+    width = len(packed) * 8
+    text = format(int.from_bytes(packed, "little"), f"0{width}b")[::-1]
+    return text.encode().translate(_FROM_ASCII)
+
+
+def _sieve_segment(first, size):
+    """
+    Sieve the odd numbers 2*first+1, 2*first+3, ... (``size`` of them).
+
+    Returns:
+        bytes: packed flags, zero-padded to whole bytes
+    """
+    flags = bytearray([1]) * size
+    if first == 0:
+        flags[0] = 0  # 1 is not prime
+    low = 2 * first + 1
+    high = 2 * (first + size) - 1
+    for p in _base_primes(isqrt(high)):
+        start = p * p
+        if start < low:
+            start = low + (-low % p)      # First multiple of p in the segment...
+            if start % 2 == 0:
+                start += p                # ...that is odd
+        if start > high:
+            continue
+        index = (start - low) // 2
+        flags[index::p] = bytes(len(range(index, size, p)))
+    flags += bytes(-size % 8)
+    return _pack(flags)
+
+
+def _segments(first, last, segment_odds):
+    """
+    (first odd index, size) pairs covering [first, last).
+
+    Sizes are rounded down to whole bytes of flags (at least one byte), so
+    packed segments can be joined end to end.
+    """
+    segment_odds = max(8, segment_odds - segment_odds % 8)
+    for start in range(first, last, segment_odds):
+        yield start, min(segment_odds, last - start)
+
+
+def _sieve_packed(limit, workers=1, segment_odds=SEGMENT_ODDS):
+    """Packed segments for all odd numbers below ``limit``, in order."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    segments = list(_segments(0, limit // 2, segment_odds))
+    if workers <= 1:
+        for first, size in segments:
+            yield _sieve_segment(first, size)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_sieve_segment, *zip(*segments))
+
+
+def primes_between(start, stop, workers=1, segment_odds=SEGMENT_ODDS):
+    """
+    Yield the primes in [start, stop) with a segmented sieve.
+
+    Only the range itself is sieved (plus the small base primes), so
+    ``primes_between(10**12, 10**12 + 10**6)`` is quick.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if start <= 2 < stop:
+        yield 2
+    first = max(start, 1) // 2          # Odd index of the first odd number >= start
+    last = stop // 2                    # Odd numbers below stop
+    if first >= last:
+        return
+    segments = list(_segments(first, last, segment_odds))
+    if workers <= 1:
+        parts = (_sieve_segment(first_odd, size) for first_odd, size in segments)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        parts = pool.map(_sieve_segment, *zip(*segments))
+    try:
+        for (first_odd, size), packed in zip(segments, parts):
+            low = 2 * first_odd + 1
+            numbers = range(low, min(low + 2 * size, stop), 2)
+            yield from compress(numbers, _unpack(packed))
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+class PrimeTable:
+    """
+    Packed sieve of every number below ``limit``.
+
+    Bit k is set when the odd number 2k + 1 is prime; 2 is handled
+    separately. ``bits`` is ``bytes`` for a table built in memory and a
+    view of a read-only ``mmap`` for one opened with ``load``.
+    """
+
+    def __init__(self, limit, bits):
+        self.limit = limit
+        self.bits = bits
+        self._file = None
+
+    @classmethod
+    def build(cls, limit, workers=1, segment_odds=SEGMENT_ODDS):
+        """Sieve everything below ``limit`` in memory."""
+        return cls(limit, b"".join(_sieve_packed(limit, workers, segment_odds)))
+
+    def save(self, path):
+        """Write the table to ``path`` (header + packed bits)."""
+        with open(path, "wb") as f:
+            f.write(MAGIC + self.limit.to_bytes(8, "little"))
+            f.write(self.bits)
+
+    @classmethod
+    def create(cls, path, limit, workers=1, segment_odds=SEGMENT_ODDS):
+        """Sieve straight into a file, one segment at a time, then ``load`` it."""
+        tmp = f"{path}.tmp{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC + limit.to_bytes(8, "little"))
+            for packed in _sieve_packed(limit, workers, segment_odds):
+                f.write(packed)
+        os.replace(tmp, path)  # Readers never see a half-written table
+        return cls.load(path)
+
+    @classmethod
+    def load(cls, path):
+        """Open a saved table with ``mmap`` (shared between processes)."""
+        f = open(path, "rb")
+        try:
+            header = f.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE or not header.startswith(MAGIC):
+                raise ValueError(f"{path} is not a prime table")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            f.close()
+            raise
+        table = cls(int.from_bytes(header[len(MAGIC):], "little"), memoryview(mapped)[HEADER_SIZE:])
+        table._file = (f, mapped)
+        return table
+
+    @classmethod
+    def cached(cls, path, limit, workers=1):
+        """Open the table at ``path``, building it first if missing or too small."""
+        if os.path.exists(path):
+            table = cls.load(path)
+            if table.limit >= limit:
+                return table
+            table.close()
+        return cls.create(path, limit, workers)
+
+    def close(self):
+        """Release the memory map of a loaded table."""
+        if self._file is not None:
+            f, mapped = self._file
+            self.bits.release()
+            mapped.close()
+            f.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, n):
+        """Primality of ``n``: a bit lookup below ``limit``, else Miller-Rabin."""
+        if n < 2:
+            return False
+        if n >= self.limit:
+            return is_prime(n)
+        if n % 2 == 0:
+            return n == 2
+        k = n >> 1
+        return bool(self.bits[k >> 3] >> (k & 7) & 1)
+
+    is_prime = __contains__
+
+    def count(self, chunk_size=1 << 20):
+        """Number of primes below ``limit``."""
+        total = 1 if self.limit > 2 else 0
+        for start in range(0, len(self.bits), chunk_size):
+            total += int.from_bytes(self.bits[start:start + chunk_size], "little").bit_count()
+        return total
+
+    def primes(self, start=0, stop=None, chunk_size=1 << 16):
+        """Yield the primes in [start, stop), ``stop`` at most ``limit``."""
+        stop = self.limit if stop is None else min(stop, self.limit)
+        if start <= 2 < stop:
+            yield 2
+        first_byte = max(start, 1) // 16
+        last_byte = -(-stop // 16)
+        for byte in range(first_byte, last_byte, chunk_size):
+            low = byte * 16 + 1
+            flags = _unpack(self.bits[byte:min(byte + chunk_size, last_byte)])
+            numbers = range(low, low + 2 * len(flags), 2)
+            for p in compress(numbers, flags):
+                if p >= stop:
+                    return
+                if p >= start:
+                    yield p
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Sieve primes below a limit.")
+    parser.add_argument("limit", type=int, nargs="?", default=10**8)
+    parser.add_argument("--workers", type=int, default=1, help="processes (0 = one per core)")
+    parser.add_argument("--save", help="write the table to this file (mmap-able)")
+    args = parser.parse_args()
+    workers = args.workers or None
+
+    print("Prime numbers from 1 to 30:")
+    print(list(primes_between(1, 31)))
+
+    start = time.perf_counter()
+    if args.save:
+        table = PrimeTable.create(args.save, args.limit, workers)
+    else:
+        table = PrimeTable.build(args.limit, workers)
+    elapsed = time.perf_counter() - start
+    print(f"Primes below {args.limit:,}: {table.count():,} ({elapsed:.2f}s, "
+          f"{len(table.bits) / 1e6:.1f} MB)")
+    big = 2**61 - 1
+    print(f"is_prime(2**61 - 1): {is_prime(big)}")
+    table.close()
@@ -0,0 +1,201 @@
+"""
+PRODUCT SEARCH INDEX
+====================
+
+``search_product`` (03_break_continue.py) lowercases every product on every
+search and tests ``search_term.lower() in product.lower()`` one product at a
+time. With millions of products that is far too slow for type-ahead.
+
+``ProductIndex`` does the work once, when a product is added:
+- the name is case-folded (``str.casefold``, which also handles ß, İ, ...)
+- every piece of 1 to 3 letters of the folded name gets a posting: the set
+  of product ids containing it ("keyboard" -> k, ke, key, e, ey, eyb, ...)
+
+A query of up to 3 letters is answered by its own posting. A longer query
+intersects the postings of its trigrams, smallest first, then confirms the
+few candidates with a real substring test (the trigrams of a query can
+occur in a name without the query itself). Results are ranked (prefix
+match, then word start, then earlier position, then shorter name) and can
+be cut to the top k. Products can be added and removed at any time; once
+removed products outnumber the rest, ids are renumbered to close the gaps.
+
+Example:
+    index = ProductIndex(["Laptop", "Mouse", "Keyboard", "Monitor"])
+    index.search("o")          # ['Mouse', 'Monitor', 'Laptop', 'Keyboard']
+    index.search("key")        # ['Keyboard']
+"""
+
+import heapq
+from functools import partial
+
+N = 3  # Letters per n-gram
+
+
+def _grams(text, n=N):
+    """Every ``n``-letter piece of ``text``."""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _pieces(text):
+    """Every 1- to N-letter piece of ``text`` (the keys of its postings)."""
+    return {text[i:i + n] for n in range(1, N + 1) for i in range(len(text) - n + 1)}
+
+
+class ProductIndex:
+    """
+    Case-insensitive substring search over product names.
+
+    Args:
+        products: Optional names to add right away
+    """
+
+    def __init__(self, products=()):
+        self.names = []       # product id -> name (None once removed)
+        self.folded = []      # product id -> case-folded name
+        self.postings = {}    # 1- to 3-letter piece -> set of product ids
+        self.ids = {}         # name -> set of product ids (names may repeat)
+        self._count = 0
+        for product in products:
+            self.add(product)
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, product):
+        return bool(self.ids.get(product))
+
+    def add(self, product):
+        """Index one product. Returns its id (valid until the next ``compact``)."""
+        product_id = len(self.names)
+        folded = product.casefold()
+        self.names.append(product)
+        self.folded.append(folded)
+        self.ids.setdefault(product, set()).add(product_id)
+        postings = self.postings
+        for piece in _pieces(folded):
+            bucket = postings.get(piece)
+            if bucket is None:
+                postings[piece] = {product_id}
+            else:
+                bucket.add(product_id)
+        self._count += 1
+        return product_id
+
+    def remove(self, product):
+        """Remove every product with this name. Returns how many were removed."""
+        product_ids = self.ids.pop(product, ())
+        for product_id in product_ids:
+            for piece in _pieces(self.folded[product_id]):
+                bucket = self.postings[piece]
+                bucket.discard(product_id)
+                if not bucket:
+                    del self.postings[piece]
+            self.names[product_id] = None
+            self.folded[product_id] = None
+        self._count -= len(product_ids)
+        if len(self.names) - self._count > self._count:
+            self.compact()
+        return len(product_ids)
+
+    def compact(self):
+        """
+        Drop the slots of removed products and renumber the rest.
+
+        Ids keep their insertion order, so ranking and ``first`` are
+        unchanged; postings are remapped rather than rebuilt.
+        """
+        new_ids = {}
+        names, folded = [], []
+        for product_id, name in enumerate(self.names):
+            if name is not None:
+                new_ids[product_id] = len(names)
+                names.append(name)
+                folded.append(self.folded[product_id])
+        if len(names) == len(self.names):
+            return
+        remap = new_ids.__getitem__
+        self.names, self.folded = names, folded
+        self.ids = {name: set(map(remap, bucket)) for name, bucket in self.ids.items()}
+        self.postings = {piece: set(map(remap, bucket)) for piece, bucket in self.postings.items()}
+
+    def candidates(self, query):
+        """Ids of products whose names contain ``query`` (case-insensitive)."""
+        query = query.casefold()
+        folded = self.folded
+        if not query:
+            return [i for i, name in enumerate(folded) if name is not None]
+        if len(query) <= N:
+            return list(self.postings.get(query, ()))  # The posting is exact
+
+        buckets = []
+        for gram in _grams(query):
+            bucket = self.postings.get(gram)
+            if bucket is None:
+                return []
+            buckets.append(bucket)
+        buckets.sort(key=len)
+        found = buckets[0]
+        for bucket in buckets[1:]:
+            found = found & bucket
+            if not found:
+                return []
+        return [i for i in found if query in folded[i]]
+
+    def _rank(self, query, product_id):
+        """Sort key: prefix, word start, position, length, id."""
+        name = self.folded[product_id]
+        position = name.find(query)
+        word_start = position == 0 or not name[position - 1].isalnum()
+        return position != 0, not word_start, position, len(name), product_id
+
+    def search(self, query, limit=None):
+        """
+        Product names containing ``query``, best matches first.
+
+        Args:
+            query (str): Text to look for (any case)
+            limit (int): Return at most this many (the top k)
+        """
+        found = self.candidates(query)
+        query = query.casefold()
+        key = partial(self._rank, query)
+        if limit is not None and limit < len(found):
+            best = heapq.nsmallest(limit, found, key=key)
+        else:
+            best = sorted(found, key=key)
+        return [self.names[product_id] for product_id in best]
+
+    def first(self, query):
+        """First product (in insertion order) containing ``query``, like ``search_product``."""
+        found = self.candidates(query)
+        return self.names[min(found)] if found else None
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    index = ProductIndex(["Laptop", "Mouse", "Keyboard", "Monitor", "Headphones"])
+    print(f"first('key'): {index.first('key')}")
+    print(f"search('o'):  {index.search('o')}")
+
+    words = ["Wireless", "Mechanical", "Gaming", "USB-C", "Ergonomic", "Portable", "Pro",
+             "Mini", "Ultra", "Smart", "Keyboard", "Mouse", "Monitor", "Laptop", "Charger",
+             "Headphones", "Speaker", "Cable", "Hub", "Stand", "Webcam", "Microphone"]
+    products = [f"{' '.join(random.sample(words, 3))} {random.randint(100, 99999)}"
+                for _ in range(300_000)]
+
+    start = time.perf_counter()
+    index = ProductIndex(products)
+    print(f"\nIndexed {len(index):,} products in {time.perf_counter() - start:.1f}s "
+          f"({len(index.postings):,} postings)")
+
+    for query in ["webcam 42", "ergonomic mouse", "mini", "hu", "USB-C hub 123"]:
+        start = time.perf_counter()
+        top = index.search(query, limit=5)
+        indexed = time.perf_counter() - start
+        start = time.perf_counter()
+        scan = [product for product in products if query.lower() in product.lower()]
+        scanned = time.perf_counter() - start
+        print(f"{query!r:<18} {len(index.candidates(query)):>6} hits  "
+              f"index {indexed * 1000:8.3f} ms  scan {scanned * 1000:7.1f} ms  {top[:2]}")
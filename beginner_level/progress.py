@@ -0,0 +1,130 @@
+"""
+PROGRESS MESSAGES
+=================
+
+``get_status_message`` (05_ternary_operator.py) builds a new f-string on
+every call, and the PROGRESS BAR demo (05_range_function.py) rebuilds the
+bar with string multiplication every step. Yet progress is a whole number
+from 0 to 100, so there are only 101 different messages and bars.
+
+Here they are all rendered once, interned, and kept in tuples:
+- ``get_status_message(75)`` is a tuple index, no formatting and no new
+  string
+- ``progress_bar(40)`` returns the ready-made "[████░░░░░░] 40%" line
+- ``ProgressReporter`` turns "items done" counts into percentages and only
+  emits when the percentage changes and enough time has passed, so a loop
+  over millions of items prints a handful of lines
+
+Example:
+    reporter = ProgressReporter(total=len(items), min_interval=0.5)
+    for done, item in enumerate(items, 1):
+        work(item)
+        reporter.update(done)
+"""
+
+import sys
+import time
+
+from ._lessons import define
+
+_ternary = {}
+define(_ternary, "02-control-structures/05_ternary_operator.py", "get_status_message")
+# The lesson's rules: builds the table and formats values outside it
+_status_message = _ternary["get_status_message"]
+del _ternary
+
+
+def _bar(percent, width):
+    filled = percent * width // 100
+    return f"[{'█' * filled}{'░' * (width - filled)}] {percent}%"
+
+
+STATUS_MESSAGES = tuple(sys.intern(_status_message(progress)) for progress in range(101))
+BARS = tuple(sys.intern(_bar(percent, 10)) for percent in range(101))
+
+
+def get_status_message(progress):
+    """Status message for a progress value (0-100 is a table lookup)."""
+    if progress.__class__ is int and 0 <= progress <= 100:
+        return STATUS_MESSAGES[progress]
+    return _status_message(progress)
+
+
+def progress_bar(percent):
+    """Ten-character bar line like "[████░░░░░░] 40%" for 0-100."""
+    return BARS[percent]
+
+
+class ProgressReporter:
+    """
+    Throttled progress output for a known number of items.
+
+    Args:
+        total (int): Number of items
+        emit: Called with each line to show (default: write to stdout with
+              a carriage return, like the PROGRESS BAR demo)
+        min_interval (float): Seconds between lines; 100% is always shown
+        width (int): Bar width; 10 uses the shared ``BARS`` table
+    """
+
+    def __init__(self, total, emit=None, min_interval=0.1, width=10):
+        if total <= 0:
+            raise ValueError("total must be positive")
+        self.total = total
+        self.emit = emit or self._write
+        self.min_interval = min_interval
+        self.lines = BARS if width == 10 else tuple(_bar(percent, width) for percent in range(101))
+        self.emitted = 0
+        self._percent = -1
+        self._last = float("-inf")
+        # Next ``done`` count that changes the percentage, so most updates
+        # are a single integer comparison
+        self._next = 0
+
+    @staticmethod
+    def _write(line):
+        sys.stdout.write("\r" + line)
+        sys.stdout.flush()
+
+    def update(self, done):
+        """Report ``done`` finished items. Returns True if a line was emitted."""
+        if done < self._next:
+            return False
+        percent = min(done * 100 // self.total, 100)
+        # First count that reaches the next whole percent
+        self._next = -(-(percent + 1) * self.total // 100)
+        if percent == self._percent:
+            return False
+
+        now = time.monotonic()
+        if percent < 100 and now - self._last < self.min_interval:
+            return False
+        self._percent = percent
+        self._last = now
+        self.emitted += 1
+        self.emit(self.lines[percent])
+        return True
+
+    def finish(self):
+        """Show 100% (if not shown yet) and end the line."""
+        self.update(self.total)
+        if self.emit == self._write:
+            sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    for progress in [25, 50, 75, 100]:
+        print(get_status_message(progress))
+
+    print("Loading...")
+    for i in range(0, 101, 10):
+        print(f"\r{progress_bar(i)}", end="", flush=True)
+    print("\n✓ Complete!")
+
+    items = 5_000_000
+    start = time.perf_counter()
+    reporter = ProgressReporter(items, min_interval=0.05)
+    for done in range(1, items + 1):
+        reporter.update(done)
+    reporter.finish()
+    print(f"{items:,} updates, {reporter.emitted} lines, {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,156 @@
+"""
+TIERED PRICING
+==============
+
+``calculate_price`` (05_ternary_operator.py) and the BULK PRICING table
+(05_range_function.py) work out a quantity discount with ``if``/ternaries on
+every call, using float arithmetic:
+
+    discount = 0.2 if is_member else 0.1 if quantity > 10 else 0
+    final_price = base_price * (1 - discount)
+
+``PriceTiers`` compiles the tiers once into sorted quantity breakpoints and
+prices with whole numbers only:
+- money is in integer cents, discounts in basis points (10% = 1000 bp)
+- the unit price is rounded half-up to a cent, then multiplied by the
+  quantity, so every run gives exactly the same totals
+- a whole order book (arrays of prices, quantities and member flags) is
+  priced at once with NumPy ``searchsorted``; without NumPy a plain loop
+  gives the same numbers
+
+Example:
+    BULK_PRICING.quote(1000, 6)   # (900, 5400, 1000): $9.00 each, $54.00
+"""
+
+from bisect import bisect_right
+from decimal import ROUND_HALF_UP, Decimal
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+BASIS_POINTS = 10_000  # 100%
+
+
+def to_cents(amount):
+    """Dollars (str, int, float or Decimal) to integer cents, half-up."""
+    cents = Decimal(str(amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) * 100
+    return int(cents)
+
+
+def format_cents(cents):
+    """Integer cents as a dollar string, e.g. 5400 -> '$54.00'."""
+    sign = "-" if cents < 0 else ""
+    return f"{sign}${abs(cents) // 100:,}.{abs(cents) % 100:02d}"
+
+
+def to_basis_points(percent):
+    """Percent (e.g. 12.5) to basis points (1250); must be exact."""
+    points = Decimal(str(percent)) * 100
+    if points != points.to_integral_value():
+        raise ValueError(f"{percent}% is finer than one basis point")
+    return int(points)
+
+
+def discounted_unit_cents(base_cents, discount_bp):
+    """Unit price after a discount, rounded half-up to a whole cent."""
+    return (base_cents * (BASIS_POINTS - discount_bp) + BASIS_POINTS // 2) // BASIS_POINTS
+
+
+class PriceTiers:
+    """
+    Quantity discount tiers.
+
+    Args:
+        tiers: (minimum quantity, discount percent) pairs, e.g.
+               [(1, 0), (5, 10)] = 10% off from 5 items
+        member_discount: Percent for members, replacing the tier discount
+                         (None = members get the tier discount too)
+    """
+
+    def __init__(self, tiers, member_discount=None):
+        tiers = sorted(tiers)
+        self.min_quantities = tuple(quantity for quantity, _ in tiers)
+        self.discounts_bp = tuple(to_basis_points(percent) for _, percent in tiers)
+        if len(set(self.min_quantities)) != len(self.min_quantities):
+            raise ValueError("each minimum quantity may appear only once")
+        self.member_bp = None if member_discount is None else to_basis_points(member_discount)
+
+    def discount_bp(self, quantity, is_member=False):
+        """Discount in basis points for one order line."""
+        if is_member and self.member_bp is not None:
+            return self.member_bp
+        tier = bisect_right(self.min_quantities, quantity) - 1
+        return self.discounts_bp[tier] if tier >= 0 else 0
+
+    def quote(self, base_cents, quantity, is_member=False):
+        """
+        Price one order line.
+
+        Returns:
+            tuple: (unit price cents, total cents, discount basis points)
+        """
+        discount = self.discount_bp(quantity, is_member)
+        unit = discounted_unit_cents(base_cents, discount)
+        return unit, unit * quantity, discount
+
+    def quote_book(self, base_cents, quantities, is_member=None):
+        """
+        Price many order lines at once.
+
+        Args:
+            base_cents: Base prices in cents (one per line, or one for all)
+            quantities: Quantities
+            is_member: Member flags (or None for no members)
+
+        Returns:
+            tuple: (unit cents, total cents, discount bp); NumPy int64
+                   arrays when NumPy is installed, else lists
+        """
+        if np is None:
+            count = len(quantities)
+            prices = base_cents if hasattr(base_cents, "__len__") else [base_cents] * count
+            members = is_member if is_member is not None else [False] * count
+            rows = [self.quote(price, quantity, member)
+                    for price, quantity, member in zip(prices, quantities, members)]
+            return tuple(list(column) for column in zip(*rows)) if rows else ([], [], [])
+
+        quantities = np.asarray(quantities, dtype=np.int64)
+        base_cents = np.asarray(base_cents, dtype=np.int64)
+
+        # Tier discounts, with 0 below the first tier
+        table = np.array((0,) + self.discounts_bp, dtype=np.int64)
+        discount = table[np.searchsorted(self.min_quantities, quantities, side="right")]
+        if is_member is not None and self.member_bp is not None:
+            discount = np.where(np.asarray(is_member, dtype=bool), self.member_bp, discount)
+
+        unit = (base_cents * (BASIS_POINTS - discount) + BASIS_POINTS // 2) // BASIS_POINTS
+        return unit, unit * quantities, discount
+
+
+# BULK PRICING table (05_range_function.py): 10% off from 5 items
+BULK_PRICING = PriceTiers([(1, 0), (5, 10)])
+
+# calculate_price (05_ternary_operator.py): members 20%, otherwise 10% above 10 items
+MEMBER_PRICING = PriceTiers([(1, 0), (11, 10)], member_discount=20)
+
+
+def calculate_price(base_price, is_member, quantity):
+    """Exact version of ``calculate_price``: discounted unit price in dollars."""
+    unit, _, _ = MEMBER_PRICING.quote(to_cents(base_price), quantity, is_member)
+    return Decimal(unit).scaleb(-2)  # Keeps the cents: Decimal("80.00")
+
+
+if __name__ == "__main__":
+    base = to_cents(10)
+    print(f"Base price: {format_cents(base)}")
+    print(f"{'Quantity':>10} {'Unit Price':>12} {'Total':>10}")
+    print("-" * 35)
+    units, totals, _ = BULK_PRICING.quote_book(base, list(range(1, 11)))
+    for quantity, unit, total in zip(range(1, 11), units, totals):
+        print(f"{quantity:>10} {format_cents(int(unit)):>12} {format_cents(int(total)):>10}")
+
+    print(f"\nMember buying 1 item: ${calculate_price(100, True, 1)}")
+    print(f"Non-member buying 15 items: ${calculate_price(100, False, 15)}")
+    print(f"Non-member buying 5 items: ${calculate_price(100, False, 5)}")
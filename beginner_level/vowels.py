@@ -0,0 +1,146 @@
+"""
+VOWEL POSITION INDEXER
+======================
+
+The "Vowel Index Pattern" exercise in 02_string_operations.py wants the index
+of the first occurrence of every vowel (a, e, i, o, u, ı, ö, ü). The lesson
+version appends to a list and checks ``i not in indexes`` each time.
+
+``VowelIndexer`` keeps only one offset per vowel, so its state never grows
+with the text. Text can be fed in chunks with a running offset. Once every
+vowel has been seen, the rest of the input is skipped. A chunk is scanned
+once, by a compiled regex character class of the vowel forms still missing:
+each hit is a vowel seen for the first time, its forms are dropped from the
+class and the scan resumes after it. The scanning happens in C, not in a
+Python loop.
+
+Upper case follows Turkish rules: "I" counts as "ı" and "İ" as "i".
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# Every vowel character -> the vowel it counts as
+VOWEL_FORMS = {
+    "a": "a", "A": "a",
+    "e": "e", "E": "e",
+    "i": "i", "İ": "i",
+    "ı": "ı", "I": "ı",
+    "o": "o", "O": "o",
+    "ö": "ö", "Ö": "ö",
+    "u": "u", "U": "u",
+    "ü": "ü", "Ü": "ü",
+}
+VOWELS = tuple(dict.fromkeys(VOWEL_FORMS.values()))
+
+
+def _forms_pattern(forms):
+    """Regex matching any one of ``forms``, or None when there are none."""
+    return re.compile(f"[{re.escape(''.join(forms))}]") if forms else None
+
+
+class VowelIndexer:
+    """
+    First-occurrence offset of every vowel in a stream of text.
+
+    Example:
+        indexer = VowelIndexer()
+        indexer.feed("Must")
+        indexer.feed("afa")
+        indexer.positions   # {'u': 1, 'a': 4}
+    """
+
+    def __init__(self):
+        self.offset = 0        # Characters consumed so far
+        self.positions = {}    # vowel -> first offset
+        self._pending = dict(VOWEL_FORMS)  # forms not found yet
+        self._pattern = _forms_pattern(self._pending)
+
+    @property
+    def done(self):
+        """True once every vowel has been found."""
+        return len(self.positions) == len(VOWELS)
+
+    def feed(self, chunk):
+        """Consume the next piece of text."""
+        start = 0
+        while self._pattern is not None:
+            match = self._pattern.search(chunk, start)
+            if match is None:
+                break
+            # The first hit of any form is the vowel's first occurrence, so
+            # all of its forms are settled
+            vowel = self._pending[match.group()]
+            self.positions[vowel] = self.offset + match.start()
+            self._pending = {form: v for form, v in self._pending.items() if v != vowel}
+            self._pattern = _forms_pattern(self._pending)
+            start = match.end()
+        self.offset += len(chunk)
+
+    def pattern(self):
+        """Offsets as a tuple, highest first (the exercise's output)."""
+        return tuple(sorted(self.positions.values(), reverse=True))
+
+
+def vowel_index_pattern(text):
+    """Example: vowel_index_pattern("Mustafa") → (4, 1)."""
+    indexer = VowelIndexer()
+    indexer.feed(text)
+    return indexer.pattern()
+
+
+def index_documents(documents):
+    """
+    Index a stream of documents one by one.
+
+    Args:
+        documents: Iterable of documents. A document is a string or an
+                   iterable of string chunks.
+
+    Yields:
+        dict: vowel -> first offset, for each document
+    """
+    for document in documents:
+        indexer = VowelIndexer()
+        chunks = (document,) if isinstance(document, str) else document
+        for chunk in chunks:
+            indexer.feed(chunk)
+            if indexer.done:
+                break
+        yield indexer.positions
+
+
+def index_file(path, encoding="utf-8", chunk_size=1 << 16):
+    """First vowel offsets (in characters) of one text file."""
+    indexer = VowelIndexer()
+    with open(path, encoding=encoding) as f:
+        while not indexer.done and (chunk := f.read(chunk_size)):
+            indexer.feed(chunk)
+    return indexer.positions
+
+
+def index_files(paths, workers=1, encoding="utf-8"):
+    """
+    Index many files, optionally in parallel.
+
+    Args:
+        paths: File paths
+        workers (int): Number of processes (None = one per CPU core)
+        encoding (str): Text encoding of the files
+
+    Returns:
+        list: One positions dict per path, in the same order
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return [index_file(path, encoding) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(index_file, paths, [encoding] * len(paths)))
+
+
+if __name__ == "__main__":
+    for name in ("Mustafa", "Ilgaz Öztürk", "İrem"):
+        print(f"{name:<14} {vowel_index_pattern(name)}")
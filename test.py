@@ -0,0 +1,1011 @@
+"""
+Regression tests for the ``beginner_level`` package.
+
+Run with:  python -m unittest test   (or: python -m pytest test.py)
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import math
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from beginner_level.benchmark import main as benchmark_main, time_lookup
+from beginner_level.cipher import encrypt, encrypt_bytes, encrypt_file, encrypt_loop
+from beginner_level.binning import AGE_CATEGORIES, GRADES, SIZES, Binner
+from beginner_level.char_stats import buffer_stats, file_stats
+from beginner_level.columnar import Expr, Table, col
+from beginner_level import conversions
+from beginner_level.conversions import convert, convert_buffer
+from beginner_level.credentials import CredentialStore
+from beginner_level.control_structures import (
+    calculate_customer_discount, calculate_discount, calculate_ticket_price,
+)
+from beginner_level.decision_tables import (
+    customer_discount_percent, discount, discounts, ticket_price, ticket_prices,
+)
+from beginner_level.eligibility import LOAN_RULES, RuleSet, np
+from beginner_level.guessing import play, simulate, worst_case
+from beginner_level.ledger import RECORD, InsufficientFunds, Ledger
+from beginner_level.matrix import Matrix
+from beginner_level.input_validation import RULES, validate_all, validate_lines, validate_stream
+from beginner_level.memory import SlotRecord, compare_memory, deep_getsizeof, main as memory_main
+from beginner_level.menus import (
+    INVALID, MAIN_MENU, SETTINGS_MENU, Back, Exit, Menu, Session, run_scripts,
+)
+from beginner_level import _lessons
+from beginner_level.data_structures import add_contact, search_contact
+from beginner_level.functions import calculate_grade, is_valid_password, process_data
+from beginner_level.palindromes import (
+    PalindromeTree, count_palindromic_substrings, distinct_palindromes, longest_palindrome,
+    palindrome_tree_from_file,
+)
+from beginner_level.passwords import audit, audit_file, features, is_valid, summarise
+from beginner_level.permissions import Permissions
+from beginner_level.progress import BARS, ProgressReporter, get_status_message, progress_bar
+from beginner_level.product_search import ProductIndex
+from beginner_level.predicates import registration_chain, user_chain
+from beginner_level.primes import PrimeTable, is_prime, primes_between
+from beginner_level.tiered_pricing import BULK_PRICING, calculate_price
+from beginner_level.vowels import VOWEL_FORMS, VowelIndexer, index_documents, vowel_index_pattern
+
+
+class BenchmarkTest(unittest.TestCase):
+    def test_time_lookup(self):
+        stats = time_lookup(set(range(100)), 50, repeat=3, warmup=0, min_sample_ns=0)
+        self.assertLessEqual(stats["q1_ns"], stats["median_ns"])
+        self.assertLessEqual(stats["median_ns"], stats["q3_ns"])
+
+    def test_repeat_below_two_is_rejected(self):
+        with self.assertRaises(ValueError):
+            time_lookup([1], 1, repeat=1)
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            benchmark_main(["--repeat", "1"])
+
+
+class CipherTest(unittest.TestCase):
+    def texts(self):
+        rng = random.Random(13)
+        yield from ["", "Ali Can", "Şule İpek Çağrı", "xyz XYZ", "123 !?\t\n"]
+        for _ in range(100):
+            yield "".join(rng.choices("abcxyzAEIOU ğüşİı.,", k=rng.randint(0, 30)))
+
+    def test_matches_lesson_loop(self):
+        self.assertEqual(encrypt("Ali Can"), "cnk_Ecp")
+        for text in self.texts():
+            for shift in (0, 2, 25, 27, -1):
+                expected = encrypt_loop(text, shift)
+                self.assertEqual(encrypt(text, shift), expected)
+                self.assertEqual(encrypt_bytes(text.encode(), shift), expected.encode())
+
+    def test_file_chunk_boundaries(self):
+        text = "".join(self.texts())
+        with tempfile.TemporaryDirectory() as tmp:
+            src, dst = os.path.join(tmp, "in.txt"), os.path.join(tmp, "out.txt")
+            with open(src, "wb") as f:
+                f.write(text.encode())
+            for chunk_size in (1, 3, 1 << 20):
+                self.assertEqual(encrypt_file(src, dst, chunk_size=chunk_size), len(text.encode()))
+                with open(dst, "rb") as f:
+                    self.assertEqual(f.read().decode(), encrypt_loop(text))
+
+
+class CharStatsTest(unittest.TestCase):
+    LINES = ["Ali", "Mustafa", "", "x", "Bora Can", "Şükrü Öztürk", "çğıöşü ÇĞİÖŞÜ"]
+
+    def lesson_mean(self, s):
+        # The expression from Exercise 4 in 02_string_operations.py
+        diffs = [abs(ord(s[i]) - ord(s[i+1])) for i in range(len(s)-1)]
+        return sum(diffs) / len(diffs) if diffs else float("nan")
+
+    def assert_matches(self, stats, lines):
+        self.assertEqual(len(stats.line_means), len(lines))
+        for mean, line in zip(stats.line_means, lines):
+            expected = self.lesson_mean(line.encode("latin-1", "replace").decode("latin-1"))
+            if math.isnan(expected):
+                self.assertTrue(math.isnan(mean))
+            else:
+                self.assertAlmostEqual(mean, expected)
+
+    def test_matches_lesson_expression(self):
+        buffer = "\n".join(self.LINES).encode("latin-1", "replace")
+        modes = [False, True] if np is not None else [False]
+        for use_numpy in modes:
+            self.assert_matches(buffer_stats(buffer, use_numpy), self.LINES)
+            self.assert_matches(buffer_stats(buffer + b"\n", use_numpy), self.LINES)
+            empty = buffer_stats(b"", use_numpy)
+            self.assertEqual((len(empty.line_means), empty.count), (0, 0))
+            self.assertTrue(math.isnan(empty.mean))
+
+    def test_file_chunk_boundaries(self):
+        lines = self.LINES * 50
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "names.txt")
+            with open(path, "wb") as f:
+                f.write("\n".join(lines).encode("latin-1", "replace"))
+            whole = file_stats(path)
+            self.assert_matches(whole, lines)
+            for chunk_size, workers in [(1, 1), (5, 1), (7, 3)]:
+                stats = file_stats(path, workers=workers, chunk_size=chunk_size)
+                self.assert_matches(stats, lines)
+                self.assertEqual((stats.count, stats.total, stats.histogram),
+                                 (whole.count, whole.total, whole.histogram))
+
+
+class InputValidationTest(unittest.TestCase):
+    ANSWERS = ["", "42", " 7 ", "+07", "0", "120", "121", "-3", "abc", "4.5", "2", "3", "4",
+               "yes", "Y", "NO", "n", " yes", "evet", "٤٢", "１２０", "İ"]
+    LESSON = {"age": ("get_valid_age", (), "1"),
+              "yes_no": ("get_yes_no", ("?",), "y"),
+              "menu": ("show_menu", (), "1")}
+
+    def lesson_check(self, func, args, sentinel, text):
+        """Answer once; a rejected answer makes the lesson print and ask again."""
+        output = io.StringIO()
+        with mock.patch("builtins.input", side_effect=[text, sentinel]) as ask, \
+                contextlib.redirect_stdout(output):
+            value = func(*args)
+        if ask.call_count == 1:
+            return True, value
+        return False, output.getvalue().splitlines()[-1]
+
+    def test_matches_lesson_functions(self):
+        namespace = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            _lessons.define(namespace, "01-basic-concepts/04_user_input.py",
+                            *(name for name, _, _ in self.LESSON.values()))
+        for rule, (name, args, sentinel) in self.LESSON.items():
+            results = list(validate_lines([text + "\n" for text in self.ANSWERS], rule))
+            self.assertEqual([result.text for result in results], self.ANSWERS)
+            for text, result in zip(self.ANSWERS, results):
+                self.assertEqual((result.ok, result.value),
+                                 self.lesson_check(namespace[name], args, sentinel, text), (rule, text))
+
+    def test_empty_and_stream(self):
+        self.assertEqual(validate_all([], "age"), ([], []))
+
+        async def read(data):
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            return [result async for result in validate_stream(reader, RULES["menu"])]
+
+        self.assertEqual(asyncio.run(read(b"")), [])
+        data = "\r\n".join(self.ANSWERS).encode()
+        self.assertEqual(asyncio.run(read(data)), list(validate_lines(self.ANSWERS, "menu")))
+
+
+class DecisionTableTest(unittest.TestCase):
+    AGES = [-1, 0, 17, 17.5, 18, 30, 64, 64.9, 65, 120]
+    AMOUNTS = [0, 99.99, 100, 100.01, 150, 150.5, 151, 1e9]
+    FLAGS = [(a, b, c) for a in (False, True) for b in (False, True) for c in (False, True)]
+
+    def test_rules_come_from_the_lesson_file(self):
+        lesson = os.path.join(_lessons.LESSONS_DIR, "02-control-structures")
+        self.assertEqual(calculate_ticket_price.__code__.co_filename,
+                         os.path.join(lesson, "04_nested_conditions.py"))
+        self.assertEqual(calculate_customer_discount.__code__.co_filename,
+                         os.path.join(lesson, "01_if_else_elif.py"))
+
+    def test_matches_nested_ifs(self):
+        for age in self.AGES:
+            for is_student, is_weekend, _ in self.FLAGS:
+                self.assertEqual(ticket_price(age, is_student, is_weekend),
+                                 calculate_ticket_price(age, is_student, is_weekend))
+        for amount in self.AMOUNTS:
+            for flags in self.FLAGS:
+                self.assertEqual(discount(amount, *flags), calculate_discount(amount, *flags))
+        for customer_type in ("VIP", "Member", "Regular", "", "vip", "Üye", None):
+            for has_coupon in (False, True):
+                self.assertEqual(customer_discount_percent(customer_type, has_coupon),
+                                 calculate_customer_discount(100, customer_type, has_coupon)[1])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_batch_matches_nested_ifs(self):
+        rows = [(age, s, w) for age in self.AGES for s, w, _ in self.FLAGS]
+        prices, _ = ticket_prices(*(np.array(column) for column in zip(*rows)))
+        self.assertEqual(prices.tolist(), [calculate_ticket_price(*row)[0] for row in rows])
+
+        carts = [(amount, *flags) for amount in self.AMOUNTS for flags in self.FLAGS]
+        finals, percents = discounts(*(np.array(column) for column in zip(*carts)))
+        expected = [calculate_discount(*cart) for cart in carts]
+        self.assertEqual(percents.tolist(), [percent for _, percent in expected])
+        np.testing.assert_allclose(finals, [final for final, _ in expected])
+
+        empty = np.array([], dtype=bool)
+        prices, cells = ticket_prices(np.array([]), empty, empty)
+        self.assertEqual((prices.size, cells.size), (0, 0))
+
+
+class PredicateChainTest(unittest.TestCase):
+    EMAILS = ["", "user@example.com", "no-at-sign", "ayşe@örnek.com.tr", "@"]
+    PASSWORDS = ["", "short", "password123", "Pass1234", "Şifre1234", "ŞİFRE12", "12345678"]
+
+    def setUp(self):
+        self.namespace = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            _lessons.define(self.namespace, "02-control-structures/02_logical_operators.py",
+                            "validate_registration")
+            _lessons.define(self.namespace, "05-functions/01_function_definition.py",
+                            "is_valid_email", "is_valid_password", "validate_user")
+
+    def registrations(self):
+        for email in self.EMAILS:
+            for password in self.PASSWORDS:
+                for age in (12, 13, 120, 121):
+                    for terms in (False, True):
+                        yield email, password, age, terms
+
+    def test_registration_matches_lesson(self):
+        validate_registration = self.namespace["validate_registration"]
+        fixed = registration_chain(learning=False)
+        learning = registration_chain(reorder_every=7)
+        for args in self.registrations():
+            valid, message = validate_registration(*args)
+            errors = [] if valid else message
+            self.assertEqual(fixed.check_all(*args), errors)
+            self.assertEqual(fixed(*args), (True, None) if valid else (False, errors[0]))
+            # A learned order may report a different failure first, never a wrong one
+            ok, first = learning(*args)
+            self.assertEqual(ok, valid)
+            self.assertTrue(ok or first in errors)
+            self.assertEqual(sorted(learning.check_all(*args)), sorted(errors))
+
+    def test_user_matches_lesson(self):
+        validate_user = self.namespace["validate_user"]
+        fixed, learning = user_chain(learning=False), user_chain(reorder_every=3)
+        for email in self.EMAILS:
+            for password in self.PASSWORDS:
+                valid, message = validate_user(email, password)
+                expected = (True, None) if valid else (False, message)
+                self.assertEqual(fixed(email, password), expected)
+                self.assertEqual(learning(email, password)[0], valid)
+
+
+class BinnerTest(unittest.TestCase):
+    VALUES = list(range(-3, 300)) + [0.5, 4.99, 59.99, 60.0, 89.5, 255.5, 10**20]
+
+    def setUp(self):
+        namespace = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            _lessons.define(namespace, "02-control-structures/03_comparison_operators.py",
+                            "check_grade")
+            _lessons.define(namespace, "02-control-structures/05_ternary_operator.py",
+                            "categorize_size")
+        self.lessons = [
+            (GRADES, calculate_grade),
+            (GRADES, namespace["check_grade"]),
+            (SIZES, namespace["categorize_size"]),
+            # The age-category ternary chain in 05_ternary_operator.py
+            (AGE_CATEGORIES, lambda age: "Child" if age < 13 else "Teen" if age < 18
+                else "Adult" if age < 65 else "Senior"),
+        ]
+
+    def test_matches_lesson_ladders(self):
+        for binner, lesson in self.lessons:
+            expected = [lesson(value) for value in self.VALUES]
+            self.assertEqual([binner.classify(value) for value in self.VALUES], expected)
+            self.assertEqual(binner.classify_many(self.VALUES), expected)
+            # 0-255 only: the bytes.translate path, both ends of the table
+            small = list(range(256))
+            self.assertEqual(binner.classify_many(small), [lesson(value) for value in small])
+            self.assertEqual(binner.classify_many(bytes(small)), binner.classify_many(small))
+            if np is not None:
+                codes = binner.codes(np.array(self.VALUES, dtype=np.float64))
+                self.assertEqual([binner.labels[code] for code in codes], expected)
+
+    def test_empty_and_non_ascii_labels(self):
+        binner = Binner([0.5], ["düşük", "yüksek"], side="left")
+        self.assertEqual(binner.classify_many([0, 0.5, 1]), ["düşük", "düşük", "yüksek"])
+        self.assertEqual(len(binner.codes([])), 0)
+        self.assertEqual(binner.counts(binner.codes([])), {"düşük": 0, "yüksek": 0})
+        if np is not None:
+            self.assertEqual(binner.counts(binner.codes(np.array([]))), {"düşük": 0, "yüksek": 0})
+
+
+class ProgressTest(unittest.TestCase):
+    def test_matches_lesson(self):
+        namespace = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            _lessons.define(namespace, "02-control-structures/05_ternary_operator.py",
+                            "get_status_message")
+        lesson = namespace["get_status_message"]
+        for progress in [*range(-5, 151), 74.5, 99.9, 100.0, True]:
+            self.assertEqual(get_status_message(progress), lesson(progress), progress)
+        for i in range(101):
+            # The PROGRESS BAR demo in 05_range_function.py
+            bar = "█" * (i // 10) + "░" * (10 - i // 10)
+            self.assertEqual(progress_bar(i), f"[{bar}] {i}%")
+
+    def test_reporter_emits_every_percent_once(self):
+        for total in (1, 3, 7, 100, 101, 333):
+            lines = []
+            reporter = ProgressReporter(total, emit=lines.append, min_interval=0)
+            for done in range(total + 1):
+                reporter.update(done)
+            reporter.finish()
+            percents = sorted({done * 100 // total for done in range(total + 1)})
+            self.assertEqual(lines, [BARS[percent] for percent in percents], total)
+
+        lines = []
+        reporter = ProgressReporter(10, emit=lines.append, min_interval=3600)
+        for done in range(1, 10):
+            reporter.update(done)
+        reporter.finish()
+        self.assertEqual(lines, [BARS[10], BARS[100]])
+        self.assertEqual(ProgressReporter(5, emit=lines.append, width=4).lines[50], "[██░░] 50%")
+        with self.assertRaises(ValueError):
+            ProgressReporter(0)
+
+
+class MemoryTest(unittest.TestCase):
+    def test_deep_size_adds_every_object_once(self):
+        self.assertEqual(deep_getsizeof([]), sys.getsizeof([]))
+        word = "şğü" * 10  # Non-ASCII strings use more bytes per character
+        data = [word, word, "abc"]
+        self.assertEqual(deep_getsizeof(data),
+                         sys.getsizeof(data) + sys.getsizeof(word) + sys.getsizeof("abc"))
+        loop = []
+        loop.append(loop)
+        self.assertEqual(deep_getsizeof(loop), sys.getsizeof(loop))
+        record = SlotRecord(word, 1000)
+        self.assertEqual(deep_getsizeof(record),
+                         sys.getsizeof(record) + sys.getsizeof(word) + sys.getsizeof(1000))
+
+    def test_shallow_column_is_the_lessons_getsizeof(self):
+        # 06_data_structures_comparison.py measures containers with sys.getsizeof
+        lesson = {"list[int]": list, "tuple[int]": tuple, "set[int]": set,
+                  "dict[int,int]": lambda data: {i: i for i in data}}
+        for n in (0, 1, 1000):
+            rows = {name: row for name, *row in compare_memory(n)}
+            for name, build in lesson.items():
+                shallow, deep, _ = rows[name]
+                self.assertEqual(shallow, sys.getsizeof(build(range(n))), (name, n))
+                self.assertGreaterEqual(deep, shallow)
+
+    def test_main_rejects_no_elements(self):
+        for bad in ("0", "-5"):
+            with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                memory_main(["-n", bad])
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            memory_main(["-n", "10"])
+        self.assertIn("list[SlotRecord]", output.getvalue())
+
+
+class TableTest(unittest.TestCase):
+    STUDENTS = [
+        {"name": "Alice", "grade": 85, "attendance": 95},
+        {"name": "Bob", "grade": 65, "attendance": 70},
+        {"name": "Charlie", "grade": 90, "attendance": 50},
+        {"name": "David", "grade": 75, "attendance": 85},
+    ]
+
+    def test_filter_with_and_without_numpy(self):
+        honors = (col("grade") >= 80) & (col("attendance") >= 80)
+        expr = honors | ~col("name").isin(["Alice", "Bob", "Charlie"])
+        for use_numpy in (False, True) if np is not None else (False,):
+            table = Table.from_records(self.STUDENTS, use_numpy=use_numpy)
+            self.assertEqual(table.filter(expr)["name"], ["Alice", "David"])
+            view = table.filter(col("grade") < 80).filter(col("attendance") > 80)
+            self.assertEqual(view["name"], ["David"])
+
+    def test_expr_is_abstract(self):
+        with self.assertRaises(TypeError):
+            Expr()
+
+
+class ConversionsTest(unittest.TestCase):
+    TOKENS = ["10", "-3", " 42 ", "abc", "", "3.5", "1e3", "٣٤", "１２", "nan", "0x10", "7"]
+
+    @staticmethod
+    def lesson(tokens, kind):
+        """try/except per token, as in 03_type_conversions.py."""
+        values, errors = [], []
+        for text in tokens:
+            try:
+                number = kind(text)
+            except (ValueError, OverflowError):
+                number = conversions.KINDS[kind][1]
+                errors.append(1)
+            else:
+                errors.append(0)
+            values.append(number)
+        return values, errors
+
+    def assertSameResult(self, result, expected):
+        values, errors = result
+        expected_values, expected_errors = expected
+        self.assertEqual(list(errors), expected_errors)
+        for value, want in zip(values, expected_values):
+            if isinstance(want, float) and math.isnan(want):
+                self.assertTrue(math.isnan(value))
+            else:
+                self.assertEqual(value, want)
+        self.assertEqual(len(values), len(expected_values))
+
+    def test_matches_lesson_for_every_chunk_size(self):
+        tokens = self.TOKENS
+        for kind in (int, float):
+            expected = self.lesson(tokens, kind)
+            for chunk_size in (1, 2, 5, 64):
+                self.assertSameResult(convert(tokens, kind, chunk_size=chunk_size), expected)
+                self.assertSameResult(convert(iter(tokens), kind, chunk_size=chunk_size), expected)
+        self.assertEqual(list(convert(["9" * 30, "1"])[1]), [1, 0])  # Does not fit in int64
+
+    def test_empty_and_bytes(self):
+        values, errors = convert([])
+        self.assertEqual((len(values), errors), (0, bytearray()))
+        values, errors = convert_buffer(b"1\n2\nx\n")
+        self.assertEqual((list(values), list(errors)), ([1, 2, 0], [0, 0, 1]))
+        self.assertEqual(len(convert_buffer(b"")[0]), 0)
+
+    def test_small_inputs_stay_in_process(self):
+        with mock.patch.object(conversions, "ProcessPoolExecutor", side_effect=AssertionError):
+            self.assertEqual(list(convert(["1", "2"], workers=4)[0]), [1, 2])
+
+    def test_parallel_matches_serial(self):
+        tokens = [str(i) if i % 7 else "x" for i in range(1_000)]
+        expected = convert(tokens, chunk_size=64)
+        with mock.patch.object(conversions, "PARALLEL_MIN", 100):
+            self.assertEqual(convert(iter(tokens), chunk_size=64, workers=2), expected)
+
+
+class CredentialStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.store = CredentialStore(max_attempts=3, iterations=1_000, workers=4)
+        self.store.add_user("admin", "admin123")
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_login(self):
+        self.assertEqual(self.store.login("admin", "admin123"), "Login successful!")
+        self.assertEqual(self.store.login("admin", "admin123"), "Login successful!")  # cached
+        self.assertEqual(self.store.login("admin", "nope"), "Invalid credentials")
+        self.assertEqual(self.store.login("", "x"), "Username cannot be empty")
+
+    def test_lockout(self):
+        for _ in range(3):
+            self.assertEqual(self.store.login("admin", "wrong"), "Invalid credentials")
+        self.assertEqual(self.store.login("admin", "admin123"),
+                         "Account locked - too many failed attempts")
+
+    def test_concurrent_guesses_cannot_bypass_lockout(self):
+        async def burst():
+            guesses = [self.store.login_async("admin", f"wrong{i}") for i in range(20)]
+            guesses.append(self.store.login_async("admin", "admin123"))
+            return await asyncio.gather(*guesses)
+
+        results = asyncio.run(burst())
+        self.assertNotIn("Login successful!", results)
+        self.assertEqual(results.count("Invalid credentials"), 3)
+        self.assertEqual(self.store.failures["admin"][0], 3)
+        self.assertEqual(self.store.in_flight, {})
+
+    def test_concurrent_correct_logins_all_succeed(self):
+        for workers in (1, 4):
+            store = CredentialStore(max_attempts=3, iterations=1_000, workers=workers)
+            store.add_user("bob", "pw")
+
+            async def burst():
+                return await asyncio.gather(*(store.login_async("bob", "pw") for _ in range(10)))
+
+            try:
+                self.assertEqual(asyncio.run(burst()), ["Login successful!"] * 10)
+                self.assertEqual(store.in_flight, {})
+            finally:
+                store.close()
+
+    def test_threaded_correct_logins_all_succeed(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(self.store.login, ["admin"] * 16, ["admin123"] * 16))
+        self.assertEqual(results, ["Login successful!"] * 16)
+        self.assertEqual(self.store.in_flight, {})
+
+    def test_unknown_users_keep_no_counters(self):
+        for i in range(50):
+            self.assertEqual(self.store.login(f"ghost{i}", "pw"), "Invalid credentials")
+        self.assertEqual(self.store.failures, {})
+        self.assertEqual(self.store.in_flight, {})
+
+
+class PalindromesTest(unittest.TestCase):
+    @staticmethod
+    def every_slice(s):
+        """The lesson's O(n^3) loop over every slice."""
+        return [s[i:j] for i in range(len(s)) for j in range(i + 1, len(s) + 1)
+                if s[i:j] == s[i:j][::-1]]
+
+    def texts(self):
+        rng = random.Random(11)
+        yield from ["", "a", "ababa", "abba", "Zeynep", "ğüğ üğü"]
+        for _ in range(200):
+            yield "".join(rng.choices("abğ", k=rng.randint(0, 25)))
+
+    def test_match_every_slice(self):
+        for s in self.texts():
+            found = self.every_slice(s)
+            self.assertEqual(distinct_palindromes(s), sorted(set(found)), s)
+            self.assertEqual(count_palindromic_substrings(s), len(found), s)
+            longest = max(found, key=len, default="")  # First of the longest ones
+            self.assertEqual(longest_palindrome(s), longest, s)
+
+    def test_tree_occurrences_and_chunks(self):
+        for s in self.texts():
+            tree = PalindromeTree()
+            for i in range(0, len(s), 3):
+                tree.extend(s[i:i + 3])
+            found = self.every_slice(s)
+            self.assertEqual(tree.occurrences(), {p: found.count(p) for p in set(found)}, s)
+            self.assertEqual(len(tree), len(set(found)))
+            self.assertEqual(len(tree.longest()), len(longest_palindrome(s)))
+
+    def test_file(self):
+        text = "kayak ve ışık, neden ağa? " * 20
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "text.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            for chunk_size in (1, 7, 1 << 16):
+                tree = palindrome_tree_from_file(path, chunk_size=chunk_size)
+                self.assertEqual(sorted(tree.palindromes()), distinct_palindromes(text))
+
+
+class PasswordsTest(unittest.TestCase):
+    PASSWORDS = ["", "abc", "Pass1234", "pass1234", "PASSWORD", "Şifre 2024!", "Passwort²³⁴⁵",
+                 "ǅemal1234", "Ⅷrules1234", "密码Abcdef1", "Tab\tSpace 12", "١٢٣Password"]
+
+    def test_is_valid_matches_lesson_function(self):
+        for password in self.PASSWORDS:
+            self.assertEqual(is_valid(features(password)), is_valid_password(password), password)
+
+    def test_counts(self):
+        f = features("Şifre 2024!")
+        self.assertEqual((f.length, f.upper, f.lower, f.digit, f.space, f.symbol, f.non_ascii),
+                         (11, 1, 4, 4, 1, 1, 1))
+        self.assertEqual(features(""), (0, 0, 0, 0, 0, 0, 0, 0))
+
+    def test_parallel_audit_matches_serial_across_chunk_boundaries(self):
+        passwords = self.PASSWORDS * 7
+        expected = [features(password) for password in passwords]
+        self.assertEqual(list(audit(passwords)), expected)
+        self.assertEqual(list(audit(iter(passwords), workers=2, chunk_size=5)), expected)
+        self.assertEqual(list(audit([], workers=2)), [])
+
+    def test_parallel_audit_reads_input_lazily(self):
+        consumed = 0
+
+        def passwords():
+            nonlocal consumed
+            for i in range(10_000):
+                consumed += 1
+                yield f"Pass{i}"
+
+        results = audit(passwords(), workers=2, chunk_size=10)
+        next(results)
+        self.assertLessEqual(consumed, 10 * (2 * 2 + 1))
+        results.close()
+
+    def test_audit_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "passwords.txt")
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write("\r\n".join(self.PASSWORDS[1:] * 3) + "\n")
+            expected = summarise(self.PASSWORDS[1:] * 3)
+            self.assertEqual(audit_file(path), expected)
+            self.assertEqual(audit_file(path, workers=2, chunk_size=4), expected)
+
+
+class PermissionsTest(unittest.TestCase):
+    def test_unknown_permission_is_not_granted_and_adds_no_bit(self):
+        perms = Permissions(["read", "write"])
+        perms.add_role("editor", ["read", "write"])
+        editor = perms.role_mask("editor")
+        for i in range(70):
+            self.assertFalse(perms.has(editor, f"x{i}"))
+        self.assertFalse(perms.has(editor, ["read", "unknown"]))
+        self.assertEqual(perms.who_can([editor], "unknown"), [])
+        self.assertEqual(len(perms.bits), 2)
+        self.assertTrue(perms.has(editor, ["read", "write"]))
+
+
+class RuleSetTest(unittest.TestCase):
+    def test_field_names_do_not_clash_with_generated_names(self):
+        rules = RuleSet(["default", "results", "v0"],
+                        [{"name": "big", "when": ["results", ">", 5], "result": "big"},
+                         {"name": "listed", "when": ["v0", "in", ["a", "b"]], "result": "listed"}],
+                        default="none")
+        self.assertEqual(rules(True, 1, "c"), "none")
+        self.assertEqual(rules(True, 9, "c"), "big")
+        self.assertEqual(rules(default=None, results=1, v0="a"), "listed")
+        self.assertEqual(rules.explain(False, 1, "b"), "listed")
+        self.assertIsNone(rules.explain(False, 1, "z"))
+
+    def test_field_names_need_not_be_identifiers(self):
+        rules = RuleSet(["credit score", "if"], [{"when": ["credit score", "<", 600], "result": "no"}],
+                        default="yes")
+        self.assertEqual(rules(500, 0), "no")
+        self.assertEqual(rules(700, 0), "yes")
+        with self.assertRaises(ValueError):
+            RuleSet(["a", "a"], [])
+
+    def test_loan_rules_match_hand_written_branches(self):
+        def check_eligibility_good(age, income, credit_score, employment):
+            if age < 18:
+                return "Denied: Age"
+            if income < 30000:
+                return "Denied: Income"
+            if credit_score < 600:
+                return "Denied: Credit score"
+            if employment != "full-time":
+                return "Denied: Employment"
+            return "Approved"
+
+        rules = RuleSet.from_dict(LOAN_RULES)
+        rng = random.Random(0)
+        applicants = [(rng.randint(14, 80), rng.randint(10_000, 90_000), rng.randint(400, 850),
+                       rng.choice(["full-time", "part-time"])) for _ in range(2_000)]
+        expected = [check_eligibility_good(*applicant) for applicant in applicants]
+        self.assertEqual([rules(*applicant) for applicant in applicants], expected)
+        self.assertEqual([rules.decide(*applicant) for applicant in applicants], expected)
+
+        records = [dict(zip(rules.fields, applicant)) for applicant in applicants]
+        numbers = rules.evaluate_many(records)
+        self.assertEqual([rules.results[n] for n in numbers], expected)
+        if np is not None:
+            columns = {field: [applicant[i] for applicant in applicants]
+                       for i, field in enumerate(rules.fields)}
+            self.assertEqual(rules.evaluate_columns(columns).tolist(), list(numbers))
+
+
+class MenuTest(unittest.TestCase):
+    @staticmethod
+    def one_by_one(menu, choices):
+        """Reference: ``choose`` for every choice."""
+        session = Session(menu)
+        output = []
+        for choice in choices:
+            if session.done:
+                break
+            output.append(session.choose(choice))
+        return output
+
+    def test_lesson_session(self):
+        self.assertEqual(Session(MAIN_MENU).run(["1", "3", "9", "4", "1"]),
+                         ["  → Viewing profile...", "  → Showing help...", INVALID,
+                          "  → Exiting program..."])
+        self.assertEqual(Session(MAIN_MENU).run([]), [])
+        shown = Session(MAIN_MENU).run(["9", "4"], show_menu=True)
+        self.assertEqual(shown, [MAIN_MENU.text, INVALID, MAIN_MENU.text, "  → Exiting program..."])
+        self.assertEqual(MAIN_MENU.label(2), "Edit settings")
+
+    def test_submenus_and_callables_match_one_by_one(self):
+        counter = Menu("COUNTER", [("Count", lambda session: f"depth {len(session.stack)}"),
+                                   ("Back", Back("back")), ("Exit", Exit())])
+        menu = Menu("MAIN", [("Settings", SETTINGS_MENU), ("Counter", counter), ("Help", "help"),
+                             ("Quit", Exit("bye"), "q")])
+        rng = random.Random(3)
+        for _ in range(300):
+            script = rng.choices(["1", "2", "3", "4", "q", "x", "é", ""], k=rng.randint(0, 40))
+            self.assertEqual(Session(menu).run(script), self.one_by_one(menu, script), script)
+
+    def test_duplicate_key(self):
+        with self.assertRaises(ValueError):
+            Menu("M", [("A", "a", "x"), ("B", "b", "x")])
+
+    def test_run_scripts_in_processes(self):
+        rng = random.Random(5)
+        scripts = [rng.choices("12349", k=20) for _ in range(50)]
+        expected = [self.one_by_one(MAIN_MENU, script) for script in scripts]
+        self.assertEqual(run_scripts(MAIN_MENU, scripts), expected)
+        self.assertEqual(run_scripts(MAIN_MENU, iter(scripts), workers=2, chunk_size=7), expected)
+
+
+class MatrixTest(unittest.TestCase):
+    def test_copy_does_not_share_the_buffer(self):
+        sources = [Matrix.from_rows([[1, 2], [3, 4]])]
+        if np is not None:
+            sources.append(Matrix.from_numpy([[1, 2], [3, 4]]))
+        for original in sources:
+            copy = original.copy()
+            copy[1, 1] = 9
+            self.assertEqual(original[1, 1], 4.0)
+
+    def test_scalar_operators_on_both_sides(self):
+        m = Matrix.from_rows([[1, 2], [4, 8]])
+        for use_numpy in (False, True) if np is not None else (False,):
+            with mock.patch.object(Matrix, "use_numpy", use_numpy):
+                self.assertEqual((10 - m).to_rows(), [[9.0, 8.0], [6.0, 2.0]])
+                self.assertEqual((m - 1).to_rows(), [[0.0, 1.0], [3.0, 7.0]])
+                self.assertEqual((m / 2).to_rows(), [[0.5, 1.0], [2.0, 4.0]])
+                self.assertEqual((8 / m).to_rows(), [[8.0, 4.0], [2.0, 1.0]])
+                self.assertEqual((m.T / m).to_rows(), [[1.0, 2.0], [0.5, 1.0]])
+                self.assertEqual((2 * m + m * 2 - m).to_rows(), [[3.0, 6.0], [12.0, 24.0]])
+
+    def test_transpose_copy(self):
+        m = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(m.T.copy(block=2).to_rows(), [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]])
+
+
+class PrimesTest(unittest.TestCase):
+    def test_table_matches_trial_division(self):
+        def trial_division(n):
+            return n >= 2 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+        table = PrimeTable.build(1_000)
+        for n in range(-50, 2_000):
+            self.assertEqual(n in table, trial_division(n), n)
+            self.assertEqual(is_prime(n), trial_division(n), n)
+        self.assertEqual(list(primes_between(-10, 30)), [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+
+    def test_small_segments(self):
+        loops = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            _lessons.define(loops, "03-loops/03_break_continue.py", "is_prime")
+        expected = [n for n in range(300) if loops["is_prime"](n)]
+        for segment_odds in (0, 1, 7, 8, 9, 17):
+            self.assertEqual(list(primes_between(0, 300, segment_odds=segment_odds)), expected)
+            table = PrimeTable.build(300, segment_odds=segment_odds)
+            self.assertEqual([n for n in range(300) if n in table], expected)
+        self.assertEqual(list(primes_between(0, 0)), [])
+
+    def test_package_is_prime_is_miller_rabin(self):
+        import beginner_level
+
+        self.assertIs(beginner_level.is_prime, is_prime)
+        self.assertTrue(beginner_level.is_prime(2 ** 61 - 1))
+        self.assertIn("loops", beginner_level.__all__)
+        self.assertTrue(beginner_level.loops.is_prime(97))
+
+
+class LessonHelpersTest(unittest.TestCase):
+    def lesson(self, path, *names):
+        namespace = {}
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            _lessons.define(namespace, path, *names)
+        self.assertEqual(output.getvalue(), "")  # No demo code ran
+        return namespace
+
+    def test_helpers_come_from_the_lesson_files(self):
+        self.assertEqual(calculate_grade.__code__.co_filename,
+                         os.path.join(_lessons.LESSONS_DIR, "05-functions", "01_function_definition.py"))
+        self.assertEqual([calculate_grade(s) for s in (95, 85, 75, 65, 5)], list("ABCDF"))
+        with self.assertRaises(ImportError):
+            self.lesson("03-loops/03_break_continue.py", "no_such_function")
+
+    def test_process_data_matches_lesson(self):
+        lesson = self.lesson("05-functions/02_parameters_and_arguments.py",
+                             "process_data")["process_data"]
+        numbers = [5, 2, 8, 1, 9, 3, 7, 4, 6]
+        cases = [{}, {"transform": lambda x: x * 2}, {"filter_fn": lambda x: x > 5},
+                 {"sort_key": abs, "reverse": True},
+                 {"transform": str, "filter_fn": lambda x: x % 2, "sort_key": len}]
+        for options in cases:
+            with contextlib.redirect_stdout(io.StringIO()):
+                expected = lesson(numbers, **options)
+            self.assertEqual(process_data(numbers, **options), expected)
+            self.assertEqual(process_data(iter(numbers), **options), expected)
+        self.assertEqual(process_data([]), [])
+
+    def test_contact_book_matches_lesson(self):
+        contacts = {}
+        namespace = self.lesson("04-data-structures/05_dictionaries.py", "add_contact")
+        namespace["contacts"] = contacts
+        with contextlib.redirect_stdout(io.StringIO()):
+            namespace["add_contact"]("Çağla", "555", "c@example.com", "Ankara")
+        book = {}
+        add_contact(book, "Çağla", "555", "c@example.com", "Ankara")
+        self.assertEqual(book, contacts)
+        self.assertEqual(search_contact(book, "Çağla")["email"], "c@example.com")
+        self.assertIsNone(search_contact(book, "Nobody"))
+
+
+class GuessingTest(unittest.TestCase):
+    def test_binary_search_within_worst_case(self):
+        attempts = [play(secret) for secret in range(1, 101)]
+        self.assertEqual(max(attempts), worst_case())
+        self.assertEqual(play(50), 1)
+
+    def test_secret_out_of_range_is_rejected(self):
+        for secret in (0, 101, -5):
+            with self.assertRaises(ValueError):
+                play(secret)
+        with self.assertRaises(ValueError):
+            play(5, low=10, high=1)
+
+    def test_simulate_counts_every_game(self):
+        distribution = simulate(1_000, strategy="random", chunk_size=300, seed=1)
+        self.assertEqual(sum(distribution.values()), 1_000)
+        self.assertEqual(distribution, simulate(1_000, strategy="random", chunk_size=300, seed=1))
+
+
+class LedgerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = self.tmp.name
+
+    def crash(self, ledger):
+        """Drop a ledger like a killed process: no close, no truncate."""
+        ledger.flush()
+        for mapped in ledger._maps:
+            mapped.close()
+        ledger._file.close()
+        ledger._file = None
+
+    def test_postings(self):
+        with Ledger.open(self.directory, grow_records=4) as ledger:
+            ledger.open_account(1, 1000_00)
+            self.assertEqual(ledger.withdraw(1, 300_00), 700_00)
+            self.assertEqual(ledger.deposit(1, 500_00), 1200_00)
+            with self.assertRaises(InsufficientFunds):
+                ledger.withdraw(1, 5000_00)
+            with self.assertRaises(ValueError):
+                ledger.open_account(1)
+            self.assertEqual(len(ledger), 3)
+        with Ledger.open(self.directory) as ledger:
+            self.assertEqual(ledger.balances, {1: 1200_00})
+            self.assertEqual(len(ledger), 3)
+
+    def test_out_of_range_values_change_nothing(self):
+        with Ledger.open(self.directory, grow_records=4) as ledger:
+            ledger.open_account(1, 5)
+            with self.assertRaises(ValueError):
+                ledger.open_account(2 ** 32, 5)
+            with self.assertRaises(ValueError):
+                ledger.open_account(-1, 5)
+            with self.assertRaises(ValueError):
+                ledger.open_account(2, 2 ** 63)
+            with self.assertRaises(ValueError):
+                ledger.deposit(1, 2 ** 63 - 1)
+            for bad in (1.5, "5", None):
+                with self.assertRaises(TypeError):
+                    ledger.deposit(1, bad)
+                with self.assertRaises(TypeError):
+                    ledger.withdraw(1, bad)
+            with self.assertRaises(TypeError):
+                ledger.deposit(1.0, 1)
+            with self.assertRaises(TypeError):
+                ledger.open_account(3, 0.5)
+            self.assertEqual(ledger.balances, {1: 5})
+            self.assertEqual(len(ledger), 1)
+            self.assertEqual(ledger.deposit(1, 1), 6)
+        with Ledger.open(self.directory) as ledger:
+            self.assertEqual(ledger.balances, {1: 6})
+            self.assertEqual(len(ledger), 2)
+
+    def test_threads_posting_at_once(self):
+        with Ledger.open(self.directory, stripes=4, grow_records=64) as ledger:
+            for account in range(8):
+                ledger.open_account(account, 0)
+
+            def post(account):
+                for _ in range(500):
+                    ledger.deposit(account, 2)
+                    ledger.withdraw(account, 1)
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(post, range(8)))
+            self.assertEqual(len(ledger), 8 + 8 * 1000)
+            balances = dict(ledger.balances)
+        self.assertEqual(balances, dict.fromkeys(range(8), 500))
+        with Ledger.open(self.directory) as ledger:
+            self.assertEqual(ledger.balances, balances)
+            self.assertEqual(len(ledger), 8 + 8 * 1000)
+
+    def test_open_after_crash(self):
+        ledger = Ledger.open(self.directory, grow_records=4)
+        for account in range(3):
+            ledger.open_account(account, 100)
+        ledger.deposit(0, 50)
+        ledger.snapshot()
+        ledger.withdraw(1, 30)
+        next(ledger._positions)     # Slot reserved by a thread that never wrote it
+        ledger.deposit(2, 7)
+        balances, records = dict(ledger.balances), len(ledger)
+        self.crash(ledger)
+        self.assertGreater(os.path.getsize(os.path.join(self.directory, "ledger.log")),
+                           records * RECORD.size)
+
+        with Ledger.open(self.directory, grow_records=4) as ledger:
+            self.assertEqual(ledger.balances, balances)
+            self.assertEqual(len(ledger), records)
+            ledger.deposit(0, 1)
+        with Ledger.open(self.directory) as ledger:
+            self.assertEqual(ledger.balance(0), 151)
+            self.assertEqual(len(ledger), records + 1)
+
+
+class ProductIndexTest(unittest.TestCase):
+    PRODUCTS = ["Laptop", "Mouse", "Keyboard", "Monitor", "Headphones", "USB Hub", "Straße"]
+
+    def test_matches_substring_scan_for_every_query_length(self):
+        index = ProductIndex(self.PRODUCTS)
+        for query in ["", "o", "O", "ou", "key", "eyb", "keyb", "hub", "b h", "ss", "zz", "xyzw"]:
+            expected = [p for p in self.PRODUCTS if query.casefold() in p.casefold()]
+            self.assertEqual(sorted(index.search(query)), sorted(expected), query)
+        self.assertEqual(index.search("o"), ["Mouse", "Monitor", "Laptop", "Keyboard", "Headphones"])
+        self.assertEqual(index.first("o"), "Laptop")
+
+    def test_short_queries_use_postings(self):
+        index = ProductIndex(self.PRODUCTS)
+        self.assertEqual(sorted(index.candidates("mo")), sorted(index.postings["mo"]))
+        self.assertEqual(index.candidates("q"), [])
+
+    def test_remove_compacts_ids(self):
+        index = ProductIndex(self.PRODUCTS)
+        for product in self.PRODUCTS[:5]:
+            index.remove(product)
+            self.assertLessEqual(len(index.names), 2 * len(index))  # Compacted on the way
+        self.assertEqual(len(index), 2)
+        index.compact()
+        self.assertEqual(index.names, ["USB Hub", "Straße"])
+        self.assertEqual(index.search("s"), ["Straße", "USB Hub"])
+        self.assertEqual(index.search("hub"), ["USB Hub"])
+        self.assertEqual(index.candidates("mo"), [])
+        index.add("Mouse")
+        self.assertEqual(index.first("u"), "USB Hub")
+        self.assertEqual(index.search("mou"), ["Mouse"])
+
+
+class TieredPricingTest(unittest.TestCase):
+    def test_calculate_price_keeps_cents(self):
+        self.assertEqual(str(calculate_price(100, True, 1)), "80.00")
+        self.assertEqual(str(calculate_price(100, False, 15)), "90.00")
+        self.assertEqual(str(calculate_price("19.99", False, 11)), "17.99")
+
+    def test_bulk_quote(self):
+        self.assertEqual(BULK_PRICING.quote(1000, 6), (900, 5400, 1000))
+
+
+class VowelIndexerTest(unittest.TestCase):
+    def test_pattern(self):
+        self.assertEqual(vowel_index_pattern("Mustafa"), (4, 1))
+        self.assertEqual(vowel_index_pattern("İrem"), (2, 0))
+
+    def test_found_vowel_stops_searching_its_other_forms(self):
+        indexer = VowelIndexer()
+        indexer.feed("xax")
+        self.assertNotIn("A", indexer._pending)
+        self.assertNotIn("a", indexer._pending)
+        indexer.feed("A")
+        self.assertEqual(indexer.positions, {"a": 1})
+
+    def test_random_chunks_match_reference(self):
+        def reference(text):
+            positions = {}
+            for i, ch in enumerate(text):
+                vowel = VOWEL_FORMS.get(ch)
+                if vowel is not None and vowel not in positions:
+                    positions[vowel] = i
+            return positions
+
+        rng = random.Random(7)
+        alphabet = "aAeEiİıIoOöÖuUüÜbcxyz ğş"
+        for _ in range(200):
+            text = "".join(rng.choices(alphabet, k=rng.randint(0, 60)))
+            cuts = sorted(rng.sample(range(len(text) + 1), min(4, len(text) + 1)))
+            chunks = [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+            indexer = VowelIndexer()
+            for chunk in chunks:
+                indexer.feed(chunk)
+            self.assertEqual(indexer.positions, reference(text), (text, chunks))
+            self.assertEqual(indexer.offset, len(text))
+
+    def test_chunks_match_whole_text(self):
+        text = "Ilgaz Öztürk and İrem ate ice cream under the oak"
+        chunks = [text[i:i + 4] for i in range(0, len(text), 4)]
+        whole, chunked = index_documents([text, chunks])
+        self.assertEqual(whole, chunked)
+
+
+if __name__ == "__main__":
+    unittest.main()